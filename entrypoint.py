@@ -1,24 +1,28 @@
 #!/usr/bin/env python
+import functools
 import os
+import sys
 from typing import Literal
 from mcp_polygon import server
 
+# These are currently the only supported transports
+_SUPPORTED_TRANSPORTS: dict[str, Literal["stdio", "sse", "streamable-http"]] = {
+    "stdio": "stdio",
+    "sse": "sse",
+    "streamable-http": "streamable-http",
+}
 
+
+@functools.lru_cache(maxsize=1)
 def transport() -> Literal["stdio", "sse", "streamable-http"]:
     """
     Determine the transport type for the MCP server.
     Defaults to 'stdio' if not set in environment variables.
+
+    The result is cached; the environment is only read on the first call.
     """
     mcp_transport_str = os.environ.get("MCP_TRANSPORT", "stdio")
-
-    # These are currently the only supported transports
-    supported_transports: dict[str, Literal["stdio", "sse", "streamable-http"]] = {
-        "stdio": "stdio",
-        "sse": "sse",
-        "streamable-http": "streamable-http",
-    }
-
-    return supported_transports.get(mcp_transport_str, "stdio")
+    return _SUPPORTED_TRANSPORTS.get(mcp_transport_str, "stdio")
 
 
 def configure_http_transport() -> None:
@@ -45,23 +49,28 @@ def configure_http_transport() -> None:
 
 # Ensure the server process doesn't exit immediately when run as an MCP server
 def start_server():
+    # Diagnostics go to stderr: with stdio transport, stdout is the MCP channel
+    messages = []
     polygon_api_key = os.environ.get("POLYGON_API_KEY", "")
     if not polygon_api_key:
-        print("Warning: POLYGON_API_KEY environment variable not set.")
+        messages.append("Warning: POLYGON_API_KEY environment variable not set.")
     else:
-        print("Starting Polygon MCP server with API key configured.")
+        messages.append("Starting Polygon MCP server with API key configured.")
 
     # Configure HTTP transport environment variables before server starts
     configure_http_transport()
 
     # Log transport configuration for debugging
     selected_transport = transport()
-    print(f"Starting MCP server with transport: {selected_transport}")
+    messages.append(f"Starting MCP server with transport: {selected_transport}")
     if selected_transport in ("sse", "streamable-http"):
         host = os.environ.get("FASTMCP_HOST", "127.0.0.1")
         port = os.environ.get("FASTMCP_PORT", "8000")
         path = os.environ.get("FASTMCP_STREAMABLE_HTTP_PATH", "/mcp")
-        print(f"HTTP server will listen on: http://{host}:{port}{path}")
+        messages.append(f"HTTP server will listen on: http://{host}:{port}{path}")
+
+    sys.stderr.write("\n".join(messages) + "\n")
+    sys.stderr.flush()
 
     server.run(transport=selected_transport)
 
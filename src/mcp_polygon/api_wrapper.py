@@ -1,10 +1,145 @@
 """API wrapper for consistent error handling and response formatting."""
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Callable, Dict, Optional
+import os
+import re
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+from urllib3 import exceptions as urllib3_exceptions
+
+from .formatters import RecordTagger
 
 logger = logging.getLogger(__name__)
 
+# Exception classes raised by the SDK's urllib3 transport, classified once at
+# import time so error formatting is an isinstance check rather than string scans
+_TIMEOUT_ERRORS = (urllib3_exceptions.TimeoutError, TimeoutError)
+_CONNECTION_ERRORS = (
+    urllib3_exceptions.NewConnectionError,
+    urllib3_exceptions.ProtocolError,
+    ConnectionError,
+)
+
+# Fallback classification for errors that only describe themselves in text
+_TIMEOUT_PATTERN = re.compile(r"timeout", re.IGNORECASE)
+_CONNECTION_PATTERN = re.compile(r"connection", re.IGNORECASE)
+
+# HTTP statuses whose error messages do not include call context
+_CONTEXT_FREE_STATUSES = frozenset({401, 403, 429, *range(500, 600)})
+
+# Polygon API tier limitation (plan does not include the endpoint): the
+# NOT_AUTHORIZED status is matched exactly, "not entitled" in any case
+_TIER_LIMIT_PATTERN = re.compile(r"NOT_AUTHORIZED|(?i:not entitled)")
+
+
+# Repeated failures of the same method with the same exception type within this
+# window are logged once; a different failure is always logged
+_ERROR_LOG_INTERVAL = 10.0
+_ERROR_LOG_MAX_METHODS = 256
+_last_error_logged: OrderedDict[tuple[str, type], float] = OrderedDict()
+
+
+def _should_log_error(method_name: str, error: Exception) -> bool:
+    """
+    Rate-limit error logging per method and exception type to avoid log spam
+    during error storms.
+
+    Args:
+        method_name: API method name that failed
+        error: Exception raised by the call
+
+    Returns:
+        True if this failure should be logged
+    """
+    now = time.monotonic()
+    key = (method_name, type(error))
+    last = _last_error_logged.get(key)
+    if last is not None and now - last < _ERROR_LOG_INTERVAL:
+        return False
+
+    _last_error_logged[key] = now
+    _last_error_logged.move_to_end(key)
+    if len(_last_error_logged) > _ERROR_LOG_MAX_METHODS:
+        _last_error_logged.popitem(last=False)
+    return True
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Return the HTTP status code carried by an error, if any."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _join_context(context: Dict[str, Any]) -> str:
+    """Render context items as 'k=v, k=v'."""
+    if len(context) == 1:
+        # Common case: only {"method": ...}, no join needed
+        return "%s=%s" % next(iter(context.items()))
+    return ", ".join(["%s=%s" % item for item in context.items()])
+
+
+def _format_context(context: Optional[Dict[str, Any]]) -> str:
+    """Render context as ' (k=v, ...)', only for messages that include it."""
+    if not context:
+        return ""
+    return " (%s)" % _join_context(context)
+
+
+_INVALID_API_KEY_MSG = (
+    "Error: Invalid API key. Please check your POLYGON_API_KEY environment variable."
+)
+_RATE_LIMIT_MSG = "Error: Rate limit exceeded. Please wait a moment and try again."
+
+# Message builders for specific HTTP statuses, called with (operation, context)
+_STATUS_HANDLERS: Dict[int, Callable[[str, Optional[Dict[str, Any]]], str]] = {
+    401: lambda operation, context: _INVALID_API_KEY_MSG,
+    403: lambda operation, context: (
+        f"Error: API key does not have permission to access {operation}. "
+        "Upgrade your plan at polygon.io"
+    ),
+    404: lambda operation, context: (
+        f"Error: Resource not found{_format_context(context)}. "
+        "Please verify the ticker symbol or parameters."
+    ),
+    429: lambda operation, context: _RATE_LIMIT_MSG,
+}
+
+
+def _classify_error(error: Exception) -> Optional[str]:
+    """
+    Classify a transport error as 'timeout' or 'connection'.
+
+    Args:
+        error: The exception that occurred
+
+    Returns:
+        'timeout', 'connection', or None if the error is neither
+    """
+    # MaxRetryError wraps the underlying failure in .reason
+    if isinstance(error, urllib3_exceptions.MaxRetryError) and error.reason:
+        error = error.reason
+
+    # Connection errors first: urllib3's NewConnectionError subclasses its
+    # ConnectTimeoutError even when the host simply refused the connection
+    if isinstance(error, _CONNECTION_ERRORS):
+        return "connection"
+    if isinstance(error, _TIMEOUT_ERRORS):
+        return "timeout"
+
+    # Match on the exception's class name and message in a single search
+    text = f"{type(error).__module__}.{type(error).__name__} {error}"
+    if _TIMEOUT_PATTERN.search(text):
+        return "timeout"
+    if _CONNECTION_PATTERN.search(text):
+        return "connection"
+    return None
+
 
 class PolygonAPIError:
     """Structured error response formatting for LLM-friendly error messages."""
@@ -24,52 +159,36 @@ class PolygonAPIError:
         Returns:
             Human-readable error message string
         """
-        # Build context string if provided
-        ctx = ""
-        if context:
-            ctx = " (" + ", ".join(f"{k}={v}" for k, v in context.items()) + ")"
-
         # Handle HTTP errors from requests library
         if hasattr(error, "response") and hasattr(error.response, "status_code"):
             status = error.response.status_code
 
-            if status == 401:
-                return (
-                    "Error: Invalid API key. Please check your POLYGON_API_KEY "
-                    "environment variable."
-                )
-            elif status == 403:
-                return (
-                    f"Error: API key does not have permission to access {operation}. "
-                    "Upgrade your plan at polygon.io"
-                )
-            elif status == 404:
-                return (
-                    f"Error: Resource not found{ctx}. Please verify the ticker "
-                    "symbol or parameters."
-                )
-            elif status == 429:
-                return "Error: Rate limit exceeded. Please wait a moment and try again."
+            handler = _STATUS_HANDLERS.get(status)
+            if handler is not None:
+                return handler(operation, context)
             elif 500 <= status < 600:
                 return (
                     f"Error: Polygon API is experiencing issues (status {status}). "
                     "Please try again later."
                 )
             else:
-                return f"Error: API request failed with status {status}{ctx}"
+                return (
+                    f"Error: API request failed with status {status}"
+                    f"{_format_context(context)}"
+                )
+
+        error_kind = _classify_error(error)
 
         # Handle timeout errors
-        elif "timeout" in str(type(error)).lower() or "timeout" in str(error).lower():
+        if error_kind == "timeout":
             return (
-                f"Error: Request timed out after 30 seconds{ctx}. "
+                "Error: Request timed out after 30 seconds"
+                f"{_format_context(context)}. "
                 "The API may be slow or overloaded."
             )
 
         # Handle connection errors
-        elif (
-            "connection" in str(type(error)).lower()
-            or "connection" in str(error).lower()
-        ):
+        elif error_kind == "connection":
             return (
                 "Error: Could not connect to Polygon API. "
                 "Please check your internet connection."
@@ -79,7 +198,9 @@ class PolygonAPIError:
         else:
             # Log unexpected errors for debugging
             logger.error(
-                f"Unexpected error in {operation}: {error}",
+                "Unexpected error in %s: %s",
+                operation,
+                error,
                 exc_info=True,
                 extra=context or {},
             )
@@ -88,10 +209,232 @@ class PolygonAPIError:
             )
 
 
+def _to_plain(obj: Any) -> Any:
+    """
+    Convert SDK model objects into plain dicts/lists in a single walk.
+
+    Args:
+        obj: SDK response object, list, or primitive value
+
+    Returns:
+        Equivalent structure of dicts, lists, and JSON-compatible primitives
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, dict):
+        return {k: _to_plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(item) for item in obj]
+    if hasattr(obj, "__dict__"):
+        return {k: _to_plain(v) for k, v in vars(obj).items()}
+    return str(obj)
+
+
+def _error_context(method_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract context for error messages from the call's parameters.
+
+    More context = better debugging for LLM and users.
+    Priority: ticker/symbol, dates, then query parameters.
+
+    Args:
+        method_name: API method name that failed
+        kwargs: Parameters passed to the API method
+
+    Returns:
+        Ordered dict of context values
+    """
+    context = {"method": method_name}
+
+    # Add ticker/symbol to context
+    if "ticker" in kwargs:
+        context["ticker"] = kwargs["ticker"]
+    elif "from_" in kwargs and "to" in kwargs:
+        # Forex/crypto currency pair
+        context["currency_pair"] = f"{kwargs.get('from_', '')}_{kwargs.get('to', '')}"
+
+    # Add date range to context if present
+    if "from_" in kwargs and "to" in kwargs and "ticker" in kwargs:
+        # Aggregates query with date range
+        context["date_range"] = f"{kwargs['from_']} to {kwargs['to']}"
+    elif "date" in kwargs:
+        # Single date query
+        context["date"] = kwargs["date"]
+
+    # Add additional query parameters for better debugging
+    for key in ("multiplier", "timespan", "limit", "window"):
+        if kwargs.get(key) is not None:
+            context[key] = kwargs[key]
+
+    return context
+
+
+# Response cache: identical calls within the TTL reuse the formatted result.
+# MCP_CACHE_TTL is the default TTL in seconds for endpoints not listed below;
+# MCP_CACHE_MAX_ENTRIES=0 disables caching entirely.
+CACHE_DEFAULT_TTL = float(os.environ.get("MCP_CACHE_TTL", "60"))
+CACHE_MAX_ENTRIES = int(os.environ.get("MCP_CACHE_MAX_ENTRIES", "4096"))
+
+# Last trade/quote, conversions and market status are never cached
+_UNCACHED_PREFIXES = (
+    "get_last_",
+    "get_real_time_",
+    "get_market_status",
+)
+
+# Snapshots are cached briefly so an agent re-reading the same snapshot within
+# seconds does not spend a request. MCP_SNAPSHOT_CACHE_TTL=0 disables this.
+SNAPSHOT_CACHE_TTL = float(os.environ.get("MCP_SNAPSHOT_CACHE_TTL", "2"))
+_SNAPSHOT_PREFIXES = (
+    "get_snapshot",
+    "list_snapshot",
+    "list_universal_snapshots",
+    "get_futures_snapshot",
+)
+
+# Indicator and aggregate results whose time range ends before today no
+# longer change, so they are kept for an hour instead of the default TTL
+CACHE_HISTORICAL_TTL = 3600.0
+_INDICATOR_METHODS = frozenset({"get_sma", "get_ema", "get_macd", "get_rsi"})
+
+# Reference and economic data that changes rarely (seconds)
+_CACHE_TTLS: Dict[str, float] = {
+    "get_exchanges": 86400,
+    "get_ticker_types": 86400,
+    "list_conditions": 86400,
+    "get_related_companies": 86400,
+    "list_inflation": 86400,
+    "list_inflation_expectations": 86400,
+    "list_treasury_yields": 3600,
+    "list_futures_products": 86400,
+    "get_futures_product_details": 86400,
+    "list_futures_schedules": 3600,
+    "list_futures_schedules_by_product_code": 3600,
+    "get_market_holidays": 3600,
+    "get_ticker_details": 3600,
+    "list_ticker_changes": 3600,
+    "vx_list_stock_financials": 3600,
+}
+
+
+def _before_today(value: Any) -> bool:
+    """Return True if a date, datetime, ISO string or ms timestamp is before today."""
+    try:
+        if isinstance(value, datetime):
+            day = (
+                value.astimezone(timezone.utc).date() if value.tzinfo else value.date()
+            )
+        elif isinstance(value, date):
+            day = value
+        elif isinstance(value, int):
+            day = datetime.fromtimestamp(value / 1000, tz=timezone.utc).date()
+        else:
+            day = date.fromisoformat(str(value)[:10])
+    except (ValueError, TypeError, OverflowError, OSError):
+        return False
+    return day < datetime.now(timezone.utc).date()
+
+
+def _historical_bound(method_name: str, kwargs: Dict[str, Any]) -> Any:
+    """Return the upper time bound of an indicator or aggregates query, if any."""
+    if method_name in _INDICATOR_METHODS:
+        params = kwargs.get("params") or {}
+        return (
+            kwargs.get("timestamp")
+            or params.get("timestamp.lt")
+            or params.get("timestamp.lte")
+        )
+    if method_name == "get_aggs":
+        return kwargs.get("to")
+    return None
+
+
+def _cache_ttl(method_name: str, kwargs: Dict[str, Any]) -> float:
+    """Return the response cache TTL for an API call (0 means uncached)."""
+    if method_name.startswith(_UNCACHED_PREFIXES):
+        return 0
+    if method_name.startswith(_SNAPSHOT_PREFIXES):
+        return SNAPSHOT_CACHE_TTL
+    bound = _historical_bound(method_name, kwargs)
+    if bound and _before_today(bound):
+        return CACHE_HISTORICAL_TTL
+    return _CACHE_TTLS.get(method_name, CACHE_DEFAULT_TTL)
+
+
+def _cache_key(method_name: str, kwargs: Dict[str, Any]) -> str:
+    """Build a compact cache key from the method name and its parameters."""
+    payload = orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS, default=str)
+    return f"{method_name}|{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+class _ResponseCache:
+    """Bounded LRU cache of formatted responses with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the least recently used."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+# Client-side request rate limit (requests per second) shared by all tools.
+# Polygon rejects requests over the plan's limit with 429; waiting in-process
+# is cheaper than a rejected round trip. Off by default (0) since paid plans
+# have no per-minute limit; set it to the plan's rate, e.g. 0.083 for the
+# free tier's 5 requests/minute.
+RATE_LIMIT_RPS = float(os.environ.get("POLYGON_RPS", "0"))
+
+
+class _RateLimiter:
+    """Token bucket allowing `rate` requests per second, bursting up to `rate`."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        if self.rate <= 0:
+            return
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        # Reserve the token up front; a negative balance is this caller's wait,
+        # so concurrent callers queue in arrival order without a lock
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
 class PolygonAPIWrapper:
     """Wrapper for Polygon API calls with automatic formatting and error handling."""
 
-    def __init__(self, client, formatter: Callable[[str], str]):
+    def __init__(self, client, formatter: Callable[[str | bytes | dict | list], str]):
         """
         Initialize the API wrapper.
 
@@ -101,20 +444,75 @@ class PolygonAPIWrapper:
         """
         self.client = client
         self.formatter = formatter
+        self._limiter = _RateLimiter(RATE_LIMIT_RPS)
+
+    @property
+    def client(self):
+        """Polygon RESTClient instance used for API calls."""
+        return self._client
+
+    @client.setter
+    def client(self, client) -> None:
+        # Bound methods and cached responses belong to a specific client,
+        # so reset both on swap
+        self._client = client
+        self._method_cache: Dict[str, Callable] = {}
+        self._cache = _ResponseCache(CACHE_MAX_ENTRIES)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _resolve_method(self, method_name: str) -> Callable:
+        """
+        Resolve an API method by name, caching the bound method.
 
-    async def call(self, method_name: str, **kwargs) -> str:
+        Args:
+            method_name: API method name; 'vx_' prefixed names resolve on client.vx
+
+        Returns:
+            Bound client method
+
+        Raises:
+            AttributeError: If the client has no such method
+        """
+        method = self._method_cache.get(method_name)
+        if method is None:
+            if method_name.startswith("vx_"):
+                # Handle vx.* methods (client.vx.method_name)
+                method = getattr(self._client.vx, method_name[3:])
+            else:
+                # Regular methods (client.method_name)
+                method = getattr(self._client, method_name)
+            self._method_cache[method_name] = method
+        return method
+
+    async def call(
+        self,
+        method_name: str,
+        *,
+        force_refresh: bool = False,
+        formatter: Optional[Callable[[Any], str]] = None,
+        **kwargs,
+    ) -> str:
         """
         Call a Polygon API method with automatic error handling and CSV formatting.
 
         This method:
         1. Resolves the API method by name (handles both regular and vx.* methods)
-        2. Calls the method with raw=True to get binary response
-        3. Decodes the response and formats it as CSV
+        2. Calls the method with raw=True in a worker thread to get binary response
+        3. Passes the raw response bytes to the formatter (e.g., CSV)
         4. Returns helpful error messages on any failures
 
+        Successful results are cached per (method, parameters) for the
+        endpoint's TTL; errors are never cached. Identical calls that arrive
+        while a request is already in flight share its result instead of
+        issuing a second request.
+
         Args:
             method_name: API method name (e.g., 'get_aggs', 'list_trades')
                         For vx methods, prefix with 'vx_' (e.g., 'vx_list_stock_financials')
+            force_refresh: Bypass the response cache and fetch fresh data
+            formatter: Formatter to use instead of the wrapper's default for
+                      this call (e.g., to derive indicators from aggregates).
+                      Results are cached per formatter, keyed by its repr.
             **kwargs: Parameters to pass to the API method
 
         Returns:
@@ -128,14 +526,95 @@ class PolygonAPIWrapper:
             >>> await wrapper.call('vx_list_stock_financials', ticker='AAPL', ...)
             "ticker,period,filing_date,revenue\\nAAPL,Q4,2024-01-01,100000000\\n..."
         """
-        try:
-            # Handle vx.* methods (client.vx.method_name)
-            if method_name.startswith("vx_"):
-                actual_method_name = method_name[3:]  # Remove 'vx_' prefix
-                method = getattr(self.client.vx, actual_method_name)
+        ttl = _cache_ttl(method_name, kwargs) if self._cache.max_entries > 0 else 0
+        key = _cache_key(method_name, kwargs)
+        if formatter is None:
+            formatter = self.formatter
+        else:
+            key = f"{key}|{formatter!r}"
+        if ttl > 0 and not force_refresh:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Single-flight: concurrent identical calls await the same request.
+        # The shared task is shielded so one caller's cancellation does not
+        # cancel the fetch for the others.
+        inflight = self._inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch(method_name, key, ttl, formatter, kwargs)
+            )
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def call_many(
+        self,
+        method_name: str,
+        param: str,
+        values: List[Any],
+        *,
+        max_concurrent: int = 8,
+        **kwargs,
+    ) -> str:
+        """
+        Call one API method for several values of a parameter concurrently.
+
+        Each value is fetched through call(), so caching, single-flight and
+        the rate limiter all apply. The records are merged into one table with
+        a leading `param` column and formatted once.
+
+        Args:
+            method_name: API method name (e.g., 'get_sma')
+            param: Parameter that varies per call (e.g., 'ticker')
+            values: Values of `param`, one API call each
+            max_concurrent: Maximum number of calls in flight
+            **kwargs: Parameters shared by every call
+
+        Returns:
+            Formatted table of all records, followed by an "Errors:" section
+            listing any values whose call failed
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def call_one(value: Any) -> str:
+            async with semaphore:
+                return await self.call(
+                    method_name,
+                    formatter=RecordTagger(param, value),
+                    **{param: value},
+                    **kwargs,
+                )
+
+        results = await asyncio.gather(*(call_one(value) for value in values))
+
+        records: List[Any] = []
+        errors = []
+        for value, result in zip(values, results):
+            # Tagged results are JSON arrays; anything else is an error message
+            if result.startswith("["):
+                records.extend(orjson.loads(result))
             else:
-                # Regular methods (client.method_name)
-                method = getattr(self.client, method_name)
+                errors.append(f"{value}: {result}")
+
+        output = self.formatter(records) if records else ""
+        if errors:
+            output += ("\n" if output else "") + "Errors:\n" + "\n".join(errors) + "\n"
+        return output
+
+    async def _fetch(
+        self,
+        method_name: str,
+        key: str,
+        ttl: float,
+        formatter: Callable[[Any], str],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """Issue the API call, format the response and cache it on success."""
+        try:
+            method = self._resolve_method(method_name)
 
             # Handle SDK methods that require query parameters in params dict
             # Some SDK methods only accept query parameters through the params dict,
@@ -162,13 +641,13 @@ class PolygonAPIWrapper:
                 direct_keys = {"underlying_asset", "raw", "options", "params"}
 
                 # Separate kwargs into direct parameters and query parameters
-                for key, value in kwargs.items():
-                    if key in param_keys and value is not None:
+                for name, value in kwargs.items():
+                    if name in param_keys and value is not None:
                         # Query parameter with non-None value
-                        query_params[key] = value
-                    elif key in direct_keys:
+                        query_params[name] = value
+                    elif name in direct_keys:
                         # Direct parameter (even if None)
-                        direct_params[key] = value
+                        direct_params[name] = value
                     # Note: Unknown parameters are silently dropped to avoid SDK errors
 
                 # Merge with existing params dict if present
@@ -183,38 +662,31 @@ class PolygonAPIWrapper:
 
                 kwargs = direct_params
 
-            # Make API call with raw=True to get binary response
-            results = method(**kwargs, raw=True)
+            # Make API call with raw=True to get binary response. The SDK is
+            # synchronous, so run it in a worker thread to keep the event loop
+            # free for concurrent tool calls; connections are reused through
+            # the client's shared urllib3 pool.
+            await self._limiter.acquire()
+            results = await asyncio.to_thread(method, **kwargs, raw=True)
 
             # Handle different response types from SDK
             if hasattr(results, "data"):
-                # Binary response (most endpoints)
-                json_data = results.data.decode("utf-8")
-            elif hasattr(results, "__dict__"):
-                # Object response (technical indicators, related companies)
-                import json
-
-                # Convert object to dict, handling nested objects
-                json_data = json.dumps(
-                    results,
-                    default=lambda o: o.__dict__ if hasattr(o, "__dict__") else str(o),
-                )
-            elif isinstance(results, list):
-                # List response
-                import json
-
-                json_data = json.dumps(
-                    [
-                        item.__dict__ if hasattr(item, "__dict__") else item
-                        for item in results
-                    ]
-                )
+                # Binary response (most endpoints): hand the raw body to the
+                # formatter, which parses bytes directly with no decode or copy
+                json_data = results.data
+            elif hasattr(results, "__dict__") or isinstance(results, list):
+                # Object response (technical indicators, related companies) or
+                # list response: hand plain data to the formatter, no JSON round trip
+                json_data = _to_plain(results)
             else:
                 # Fallback to string conversion
                 json_data = str(results)
 
             # Format as CSV
-            return self.formatter(json_data)
+            formatted = formatter(json_data)
+            if ttl > 0:
+                self._cache.set(key, formatted, ttl)
+            return formatted
 
         except AttributeError as e:
             # Method doesn't exist on client
@@ -224,57 +696,37 @@ class PolygonAPIWrapper:
             )
 
         except Exception as e:
-            # Extract context for error messages
-            # More context = better debugging for LLM and users
-            # Priority: ticker/symbol, dates, then query parameters
             error_msg = str(e)
-            context = {"method": method_name}
-
-            # Add ticker/symbol to context
-            if "ticker" in kwargs:
-                context["ticker"] = kwargs["ticker"]
-            elif "from_" in kwargs and "to" in kwargs:
-                # Forex/crypto currency pair
-                context["currency_pair"] = (
-                    f"{kwargs.get('from_', '')}_{kwargs.get('to', '')}"
-                )
 
-            # Add date range to context if present
-            if "from_" in kwargs and "to" in kwargs and "ticker" in kwargs:
-                # Aggregates query with date range
-                context["date_range"] = f"{kwargs['from_']} to {kwargs['to']}"
-            elif "date" in kwargs:
-                # Single date query
-                context["date"] = kwargs["date"]
-
-            # Add additional query parameters for better debugging
-            if "multiplier" in kwargs and kwargs["multiplier"] is not None:
-                context["multiplier"] = kwargs["multiplier"]
-            if "timespan" in kwargs and kwargs["timespan"] is not None:
-                context["timespan"] = kwargs["timespan"]
-            if "limit" in kwargs and kwargs["limit"] is not None:
-                context["limit"] = kwargs["limit"]
-            if "window" in kwargs and kwargs["window"] is not None:
-                context["window"] = kwargs["window"]
-
-            # Check for API tier limitation (NOT_AUTHORIZED)
-            if "NOT_AUTHORIZED" in error_msg or "not entitled" in error_msg.lower():
-                # Build context string for error message
-                ctx_str = ", ".join(f"{k}={v}" for k, v in context.items())
-                return (
-                    f"API tier limitation: Your Polygon.io plan does not include access to {method_name}. "
-                    f"This tool requires a higher subscription tier.\n\n"
-                    f"Upgrade at: https://polygon.io/pricing\n\n"
-                    f"Context: {ctx_str}\n"
-                    f"Details: {error_msg}"
+            # Check for API tier limitation (NOT_AUTHORIZED) before any other work
+            if _TIER_LIMIT_PATTERN.search(error_msg):
+                context = _error_context(method_name, kwargs)
+                return "".join(
+                    (
+                        "API tier limitation: Your Polygon.io plan does not include ",
+                        f"access to {method_name}. ",
+                        "This tool requires a higher subscription tier.\n\n",
+                        "Upgrade at: https://polygon.io/pricing\n\n",
+                        "Context: ",
+                        _join_context(context),
+                        "\nDetails: ",
+                        error_msg,
+                    )
                 )
 
-            # Log the full error for debugging
-            logger.error(
-                f"Error calling {method_name}",
-                exc_info=True,
-                extra={"kwargs": kwargs, "error": error_msg},
-            )
+            # Log the full error for debugging (traceback capture is skipped when
+            # ERROR is filtered out or the same failure was logged moments ago)
+            if logger.isEnabledFor(logging.ERROR) and _should_log_error(method_name, e):
+                logger.error(
+                    "Error calling %s",
+                    method_name,
+                    exc_info=True,
+                    extra={"kwargs": kwargs, "error": error_msg},
+                )
 
-            # Return formatted error message
+            # Return formatted error message; context is only extracted for
+            # errors whose message includes it
+            context = None
+            if _status_code(e) not in _CONTEXT_FREE_STATUSES:
+                context = _error_context(method_name, kwargs)
             return PolygonAPIError.format_error(method_name, e, context)
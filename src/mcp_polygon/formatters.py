@@ -1,52 +1,73 @@
-import json
 import csv
 import io
+import itertools
+import json
+from dataclasses import dataclass
 from typing import Any
 
+import orjson
+
+# Bodies above this size are parsed with the stdlib json module. orjson is
+# faster but briefly holds an intermediate document of roughly 15x the input,
+# which dominates peak memory on multi-megabyte trade/quote listings; stdlib
+# json builds Python objects directly and peaks at about a third of that.
+LARGE_BODY_BYTES = 16 * 1024 * 1024
+
 
-def json_to_csv(json_input: str | dict) -> str:
+def json_to_csv(json_input: str | bytes | dict | list) -> str:
     """
     Convert JSON to flattened CSV format.
 
     Args:
-        json_input: JSON string or dict. If the JSON has a 'results' key containing
-                   a list, it will be extracted. Otherwise, the entire structure
-                   will be wrapped in a list for processing.
+        json_input: JSON string/bytes or parsed data. If the JSON has a 'results'
+                   key containing a list, it will be extracted. Otherwise, the
+                   entire structure will be wrapped in a list for processing.
 
     Returns:
         CSV string with headers and flattened rows
     """
-    # Parse JSON if it's a string
-    if isinstance(json_input, str):
-        data = json.loads(json_input)
-    else:
-        data = json_input
+    records = _extract_records(json_input)
 
-    if isinstance(data, dict) and "results" in data:
-        results = data["results"]
-        # Handle both list results (most endpoints) and dict results (technical indicators)
-        if isinstance(results, list):
-            records = results
-        elif isinstance(results, dict):
-            # For technical indicators: results = {"values": [...]}
-            # Extract the values array if it exists, otherwise wrap the dict
-            if "values" in results and isinstance(results["values"], list):
-                records = results["values"]
-            else:
-                records = [results]
+    if not records:
+        return ""
+
+    # Fast path: most endpoints return records with a uniform schema, so each
+    # row is flattened and written straight through using the first record's
+    # columns, without holding a second, flattened copy of the response. Rows
+    # are emitted as plain value lists in that column order, which skips
+    # DictWriter's per-row field checks
+    first = _flatten_dict(records[0])
+    columns = tuple(first)
+    known_keys = first.keys()
+
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerow(first.values())
+    for record in itertools.islice(records, 1, None):
+        flattened = _flatten_dict(record)
+        if tuple(flattened) == columns:
+            # Same keys in the same order (the common case): values line up
+            writer.writerow(flattened.values())
+        elif flattened.keys() <= known_keys:
+            writer.writerow([flattened.get(column, "") for column in columns])
         else:
-            # Single result object
-            records = [results]
-    elif isinstance(data, list):
-        records = data
-    else:
-        records = [data]
+            # A later record introduced new columns; rebuild with the full union
+            return _records_to_csv([_flatten_dict(record) for record in records])
+
+    return output.getvalue()
 
-    flattened_records = [_flatten_dict(record) for record in records]
 
-    if not flattened_records:
-        return ""
+def _records_to_csv(flattened_records: list[dict[str, Any]]) -> str:
+    """
+    Write flattened records as CSV using the union of all their keys.
 
+    Args:
+        flattened_records: Records already passed through _flatten_dict
+
+    Returns:
+        CSV string with headers and one row per record
+    """
     # Get all unique keys across all records (for consistent column ordering)
     all_keys = []
     seen = set()
@@ -64,6 +85,189 @@ def json_to_csv(json_input: str | dict) -> str:
     return output.getvalue()
 
 
+def json_to_onto(json_input: str | bytes | dict | list) -> str:
+    """
+    Convert JSON to a columnar, schema-once text format.
+
+    The schema is declared a single time as ``results{f1|f2|f3}`` and every
+    record follows as one ``|``-delimited row. Nested objects get their own
+    indented sub-schema (``  name{a|b}``) and their values appear on an
+    indented line beneath the parent row, so field names are never repeated
+    per record the way they are in JSON.
+
+    Args:
+        json_input: JSON string/bytes or parsed data, unwrapped like json_to_csv.
+
+    Returns:
+        Columnar text with a schema header and one row per record
+    """
+    records = [
+        record if isinstance(record, dict) else {"value": record}
+        for record in _extract_records(json_input)
+    ]
+
+    if not records:
+        return ""
+
+    schema = _build_schema(records)
+    if not schema:
+        return ""
+
+    lines = []
+    _emit_schema(schema, "results", 0, lines)
+    for record in records:
+        _emit_row(schema, record, 0, lines)
+
+    return "\n".join(lines) + "\n"
+
+
+@dataclass(frozen=True)
+class RecordTagger:
+    """
+    Formatter that returns a response's records as a JSON array, each tagged
+    with a leading ``column=value`` field.
+
+    Used by PolygonAPIWrapper.call_many to merge several responses into one
+    table before the final CSV/onto formatting. Frozen so its repr is a
+    stable response-cache key.
+    """
+
+    column: str
+    value: Any
+
+    def __call__(self, json_input: str | bytes | dict | list) -> str:
+        """Return the tagged records as a JSON array string."""
+        records = [
+            {self.column: self.value, **record}
+            if isinstance(record, dict)
+            else {self.column: self.value, "value": record}
+            for record in _extract_records(json_input)
+        ]
+        return orjson.dumps(records).decode()
+
+
+def _extract_records(json_input: str | bytes | dict | list) -> list:
+    """
+    Unwrap a Polygon response into the list of records to format.
+
+    Args:
+        json_input: JSON string/bytes or parsed data. If the JSON has a 'results'
+                   key containing a list, it will be extracted. Otherwise, the
+                   entire structure will be wrapped in a list for processing.
+
+    Returns:
+        List of records (usually dicts)
+    """
+    # Parse JSON if it's a string or raw bytes (orjson reads buffers in place)
+    if isinstance(json_input, (str, bytes, bytearray, memoryview)):
+        if len(json_input) > LARGE_BODY_BYTES and not isinstance(
+            json_input, memoryview
+        ):
+            data = json.loads(json_input)
+        else:
+            data = orjson.loads(json_input)
+    else:
+        data = json_input
+
+    if isinstance(data, dict) and "results" in data:
+        results = data["results"]
+        # Handle both list results (most endpoints) and dict results (technical indicators)
+        if isinstance(results, list):
+            return results
+        elif isinstance(results, dict):
+            # For technical indicators: results = {"values": [...]}
+            # Extract the values array if it exists, otherwise wrap the dict
+            if "values" in results and isinstance(results["values"], list):
+                return results["values"]
+            return [results]
+        # Single result object
+        return [results]
+    elif isinstance(data, list):
+        return data
+    return [data]
+
+
+def _build_schema(records: list[dict]) -> dict[str, Any]:
+    """
+    Build an ordered schema from a list of records.
+
+    Scalar fields map to None; nested objects (and lists of objects) map to
+    their own sub-schema. Keys keep first-seen order across all records.
+    """
+    schema: dict[str, Any] = {}
+    nested: dict[str, list[dict]] = {}
+
+    for record in records:
+        for key, value in record.items():
+            if isinstance(value, dict):
+                nested.setdefault(key, []).append(value)
+            elif (
+                isinstance(value, list)
+                and value
+                and all(isinstance(item, dict) for item in value)
+            ):
+                nested.setdefault(key, []).extend(value)
+            if key not in schema:
+                schema[key] = None
+
+    for key, children in nested.items():
+        schema[key] = _build_schema(children)
+
+    return schema
+
+
+def _emit_schema(
+    schema: dict[str, Any], name: str, depth: int, lines: list[str]
+) -> None:
+    """Append the schema header for one level, followed by nested sub-schemas."""
+    indent = "  " * depth
+    scalar_fields = [key for key, sub in schema.items() if sub is None]
+    lines.append(f"{indent}{name}{{{'|'.join(scalar_fields)}}}")
+    for key, sub in schema.items():
+        if sub is not None:
+            _emit_schema(sub, key, depth + 1, lines)
+
+
+def _emit_row(
+    schema: dict[str, Any], record: dict, depth: int, lines: list[str]
+) -> None:
+    """Append one record as a row, followed by indented rows for nested objects."""
+    indent = "  " * depth
+    lines.append(
+        indent
+        + "|".join(
+            _onto_value(record.get(key)) for key, sub in schema.items() if sub is None
+        )
+    )
+    for key, sub in schema.items():
+        if sub is None:
+            continue
+        value = record.get(key)
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    _emit_row(sub, item, depth + 1, lines)
+        else:
+            # Keep child rows aligned with their parent even when the object is absent
+            _emit_row(sub, value if isinstance(value, dict) else {}, depth + 1, lines)
+
+
+def _onto_value(value: Any) -> str:
+    """Render a scalar cell, escaping the row delimiter and line breaks."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return ",".join(_onto_value(item) for item in value)
+    if isinstance(value, dict):
+        return orjson.dumps(value).decode()
+    text = str(value)
+    if "|" in text or "\n" in text or "\\" in text:
+        text = text.replace("\\", "\\\\").replace("|", "\\|").replace("\n", "\\n")
+    return text
+
+
 def _flatten_dict(
     d: dict[str, Any], parent_key: str = "", sep: str = "_"
 ) -> dict[str, Any]:
@@ -78,17 +282,48 @@ def _flatten_dict(
     Returns:
         Flattened dictionary with no nested structures
     """
-    items = []
+    flattened: dict[str, Any] = {}
+    _flatten_into(flattened, d, parent_key, sep)
+    return flattened
+
+
+def _flatten_into(out: dict[str, Any], d: dict, parent_key: str, sep: str) -> None:
+    """Write the flattened items of d into out (single dict, no per-level copies)."""
     for k, v in d.items():
         new_key = f"{parent_key}{sep}{k}" if parent_key else k
 
         if isinstance(v, dict):
             # Recursively flatten nested dicts
-            items.extend(_flatten_dict(v, new_key, sep=sep).items())
+            _flatten_into(out, v, new_key, sep)
         elif isinstance(v, list):
-            # Convert lists to comma-separated strings
-            items.append((new_key, str(v)))
+            if v and all(isinstance(item, dict) for item in v):
+                # Lists of objects: field names once, then one row per object
+                out[new_key] = _encode_record_list(v)
+            else:
+                # Convert lists to comma-separated strings
+                out[new_key] = str(v)
         else:
-            items.append((new_key, v))
+            out[new_key] = v
+
+
+def _encode_record_list(records: list[dict]) -> str:
+    """
+    Encode a list of objects as a single schema-once cell value.
+
+    Field names (nested keys joined with '/') are written once as
+    ``{a|b/c}`` followed by ``[row;row]``, with ``|`` between values, instead
+    of repeating every key in every element.
+
+    Args:
+        records: Non-empty list of dicts
 
-    return dict(items)
+    Returns:
+        Encoded string such as ``{name|count}[tag1|1;tag2|2]``
+    """
+    flattened = [_flatten_dict(record, sep="/") for record in records]
+    keys = list(dict.fromkeys(key for record in flattened for key in record))
+    rows = ";".join(
+        "|".join(_onto_value(record.get(key)).replace(";", "\\;") for key in keys)
+        for record in flattened
+    )
+    return f"{{{'|'.join(keys)}}}[{rows}]"
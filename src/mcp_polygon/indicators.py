@@ -0,0 +1,346 @@
+"""Local technical indicator computation over aggregate bars."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+import orjson
+
+from .api_wrapper import PolygonAPIWrapper
+from .formatters import json_to_csv
+from .validation import validate_date, validate_tickers
+
+# Indicators supported by the fused indicator tools, in output column order
+INDICATORS = ("sma", "ema", "macd", "rsi")
+
+
+def sma(values: Sequence[float], window: int) -> List[Optional[float]]:
+    """
+    Simple moving average using a running window sum.
+
+    Args:
+        values: Input series (e.g., closing prices), oldest first
+        window: Number of values averaged
+
+    Returns:
+        Series aligned with values; None until the window is full
+    """
+    out: List[Optional[float]] = [None] * len(values)
+    total = 0.0
+    for i, value in enumerate(values):
+        total += value
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+def ema(values: Sequence[Optional[float]], window: int) -> List[Optional[float]]:
+    """
+    Exponential moving average, seeded with the SMA of the first window values.
+
+    Uses EMA[t] = a * x[t] + (1 - a) * EMA[t-1] with a = 2 / (window + 1).
+    Leading None values (e.g., an indicator still warming up) are skipped.
+
+    Args:
+        values: Input series, oldest first
+        window: EMA period
+
+    Returns:
+        Series aligned with values; None until enough values are seen
+    """
+    out: List[Optional[float]] = [None] * len(values)
+    alpha = 2.0 / (window + 1)
+    seed_total = 0.0
+    seen = 0
+    prev = 0.0
+    for i, value in enumerate(values):
+        if value is None:
+            continue
+        seen += 1
+        if seen < window:
+            seed_total += value
+            continue
+        if seen == window:
+            prev = (seed_total + value) / window
+        else:
+            prev = alpha * value + (1.0 - alpha) * prev
+        out[i] = prev
+    return out
+
+
+def macd(
+    values: Sequence[float], short_window: int, long_window: int, signal_window: int
+) -> Tuple[List[Optional[float]], List[Optional[float]], List[Optional[float]]]:
+    """
+    Moving Average Convergence/Divergence.
+
+    Computed in one pass: the fast EMA, slow EMA and signal EMA are carried
+    as running state instead of building each series separately. Results
+    match ema() applied to the closes and then to the MACD line.
+
+    Args:
+        values: Input series, oldest first
+        short_window: Fast EMA period (typically 12)
+        long_window: Slow EMA period (typically 26)
+        signal_window: EMA period of the MACD line (typically 9)
+
+    Returns:
+        (macd, signal, histogram) series aligned with values
+    """
+    n = len(values)
+    line: List[Optional[float]] = [None] * n
+    signal: List[Optional[float]] = [None] * n
+    histogram: List[Optional[float]] = [None] * n
+    fast_alpha = 2.0 / (short_window + 1)
+    slow_alpha = 2.0 / (long_window + 1)
+    signal_alpha = 2.0 / (signal_window + 1)
+    fast = slow = sig = 0.0
+    fast_total = slow_total = sig_total = 0.0
+    line_seen = 0
+    for i, value in enumerate(values):
+        seen = i + 1
+        if seen < short_window:
+            fast_total += value
+        elif seen == short_window:
+            fast = (fast_total + value) / short_window
+        else:
+            fast = fast_alpha * value + (1.0 - fast_alpha) * fast
+        if seen < long_window:
+            slow_total += value
+        elif seen == long_window:
+            slow = (slow_total + value) / long_window
+        else:
+            slow = slow_alpha * value + (1.0 - slow_alpha) * slow
+        if seen < short_window or seen < long_window:
+            continue
+
+        m = fast - slow
+        line[i] = m
+        line_seen += 1
+        if line_seen < signal_window:
+            sig_total += m
+            continue
+        if line_seen == signal_window:
+            sig = (sig_total + m) / signal_window
+        else:
+            sig = signal_alpha * m + (1.0 - signal_alpha) * sig
+        signal[i] = sig
+        histogram[i] = m - sig
+    return line, signal, histogram
+
+
+def rsi(values: Sequence[float], window: int) -> List[Optional[float]]:
+    """
+    Relative Strength Index with Wilder smoothing.
+
+    The first average gain/loss is the simple mean of the first window
+    changes; later averages use avg = (avg * (window - 1) + change) / window.
+
+    Args:
+        values: Input series, oldest first
+        window: RSI period (typically 14)
+
+    Returns:
+        Series in [0, 100] aligned with values; None until window changes exist
+    """
+    out: List[Optional[float]] = [None] * len(values)
+    avg_gain = avg_loss = 0.0
+    for i in range(1, len(values)):
+        change = values[i] - values[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if i <= window:
+            avg_gain += gain / window
+            avg_loss += loss / window
+            if i < window:
+                continue
+        else:
+            avg_gain = (avg_gain * (window - 1) + gain) / window
+            avg_loss = (avg_loss * (window - 1) + loss) / window
+        out[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+def _extract_bars(json_input: Any) -> Tuple[List[Any], List[float]]:
+    """Return (timestamps, closes) from an aggregates response, oldest first."""
+    if isinstance(json_input, (str, bytes, bytearray, memoryview)):
+        json_input = orjson.loads(json_input)
+    results = json_input.get("results") if isinstance(json_input, dict) else None
+    bars = sorted(
+        (bar for bar in results or () if bar.get("c") is not None),
+        key=lambda bar: bar.get("t") or 0,
+    )
+    return [bar.get("t") for bar in bars], [float(bar["c"]) for bar in bars]
+
+
+def _render(values: Sequence[Any]) -> List[str]:
+    """Render a column as CSV cells, with None as an empty cell."""
+    return ["" if value is None else str(value) for value in values]
+
+
+@dataclass(frozen=True)
+class IndicatorFormatter:
+    """
+    Response formatter that turns aggregate bars into indicator columns.
+
+    Passed to PolygonAPIWrapper.call in place of the wrapper's formatter, so
+    one aggregates request yields every requested indicator. The computed rows
+    are rendered by `output` (the wrapper's configured formatter), with CSV
+    written directly. Frozen so its repr is a stable cache key for the
+    wrapper's response cache.
+    """
+
+    indicators: Tuple[str, ...] = INDICATORS
+    window: int = 50
+    short_window: int = 12
+    long_window: int = 26
+    signal_window: int = 9
+    rsi_window: int = 14
+    output: Callable[[Any], str] = json_to_csv
+
+    def __call__(self, json_input: Any) -> str:
+        """Compute the indicators and format them with one row per bar."""
+        timestamps, closes = _extract_bars(json_input)
+        if not closes:
+            return ""
+
+        header = ["timestamp", "close"]
+        columns: List[List[Optional[float]]] = [closes]
+        if "sma" in self.indicators:
+            header.append("sma")
+            columns.append(sma(closes, self.window))
+        if "ema" in self.indicators:
+            header.append("ema")
+            columns.append(ema(closes, self.window))
+        if "macd" in self.indicators:
+            header += ["macd", "macd_signal", "macd_histogram"]
+            columns += macd(
+                closes, self.short_window, self.long_window, self.signal_window
+            )
+        if "rsi" in self.indicators:
+            header.append("rsi")
+            columns.append(rsi(closes, self.rsi_window))
+
+        if self.output is not json_to_csv:
+            return self.output(
+                [dict(zip(header, row)) for row in zip(timestamps, *columns)]
+            )
+
+        # Every cell is a number or empty, so no CSV quoting is needed; joining
+        # pre-rendered columns skips csv.writer's per-field type dispatch
+        cells = [_render(timestamps)] + [_render(column) for column in columns]
+        rows = "\n".join(map(",".join, zip(*cells)))
+        return f"{','.join(header)}\n{rows}\n"
+
+
+def validate_indicators(
+    indicators: Optional[List[str]], *windows: Optional[int]
+) -> Optional[str]:
+    """
+    Validate a fused indicator request. Returns error message if invalid.
+
+    Args:
+        indicators: Requested indicator names (None means all)
+        *windows: Indicator periods, each of which must be a positive integer
+
+    Returns:
+        Error message string if validation fails, None if valid
+
+    Examples:
+        >>> validate_indicators(["sma", "rsi"], 50, 14)
+        None
+
+        >>> validate_indicators(["vwap"], 50)
+        "Error: Unknown indicator(s): vwap. Supported: sma, ema, macd, rsi."
+    """
+    unknown = [name for name in indicators or () if name.lower() not in INDICATORS]
+    if unknown:
+        return (
+            f"Error: Unknown indicator(s): {', '.join(unknown)}. "
+            f"Supported: {', '.join(INDICATORS)}."
+        )
+    if any(window is None or window < 1 for window in windows):
+        return "Error: Indicator windows must be positive integers."
+    return None
+
+
+async def get_indicators(
+    api: PolygonAPIWrapper,
+    ticker: str,
+    from_: Union[str, int, datetime, date],
+    to: Union[str, int, datetime, date],
+    timespan: str,
+    multiplier: int,
+    indicators: Optional[List[str]],
+    window: int,
+    short_window: int,
+    long_window: int,
+    signal_window: int,
+    rsi_window: int,
+    adjusted: Optional[bool],
+    limit: Optional[int],
+) -> str:
+    """
+    Compute indicators for one ticker from a single aggregates request.
+
+    Shared body of the get_*_indicators tools: validates the dates and
+    indicator arguments, then fetches the bars with an IndicatorFormatter that
+    renders through the wrapper's configured output format.
+
+    Returns:
+        Formatted rows with timestamp, close and one column per indicator
+        value (MACD adds macd, macd_signal and macd_histogram), oldest bar
+        first; or an "Error: ..." message
+    """
+    if error := validate_date(from_, "from_"):
+        return error
+    if error := validate_date(to, "to"):
+        return error
+    if error := validate_indicators(
+        indicators, window, short_window, long_window, signal_window, rsi_window
+    ):
+        return error
+
+    return await api.call(
+        "get_aggs",
+        formatter=IndicatorFormatter(
+            indicators=tuple(i.lower() for i in indicators or INDICATORS),
+            window=window,
+            short_window=short_window,
+            long_window=long_window,
+            signal_window=signal_window,
+            rsi_window=rsi_window,
+            output=api.formatter,
+        ),
+        ticker=ticker,
+        multiplier=multiplier,
+        timespan=timespan,
+        from_=from_,
+        to=to,
+        adjusted=adjusted,
+        sort="asc",
+        limit=limit,
+    )
+
+
+async def get_sma_batch(
+    api: PolygonAPIWrapper, tickers: List[str], **kwargs: Any
+) -> str:
+    """
+    Fetch the SMA for several tickers concurrently, merged into one table.
+
+    Shared body of the get_*_sma_batch tools; kwargs are passed to get_sma
+    for every ticker.
+
+    Returns:
+        Formatted rows with a leading ticker column, failed tickers listed
+        under Errors; or an "Error: ..." message
+    """
+    if error := validate_tickers(tickers):
+        return error
+    if error := validate_date(kwargs.get("timestamp"), "timestamp"):
+        return error
+
+    return await api.call_many("get_sma", "ticker", tickers, **kwargs)
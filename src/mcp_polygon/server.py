@@ -1,26 +1,29 @@
+import asyncio
+import hashlib
+import importlib
+import json
 import os
 import logging
 import sys
+import time
+from pathlib import Path
 from typing import Literal
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
 from polygon import RESTClient
 from importlib.metadata import version, PackageNotFoundError
-from .formatters import json_to_csv
-from .tools.rest import stocks, options, futures, crypto, forex, economy, indices
-from .tools.websockets.connection_manager import ConnectionManager
-from .tools.websockets import (
-    stocks as stocks_ws,
-    crypto as crypto_ws,
-    options as options_ws,
-    futures as futures_ws,
-    forex as forex_ws,
-    indices as indices_ws,
-)
+from .api_wrapper import PolygonAPIWrapper
+from .formatters import json_to_csv, json_to_onto
 
-# Configure logging
+# Configure logging. Defaults to WARNING so routine INFO chatter is not
+# formatted and written on every call; set MCP_POLYGON_LOG=INFO (or DEBUG)
+# for connection and diagnostics detail. Logs go to stderr, which is never
+# part of the MCP protocol stream (stdio uses stdout)
+_log_level = os.environ.get("MCP_POLYGON_LOG", "WARNING").upper()
+if not isinstance(logging.getLevelName(_log_level), int):
+    _log_level = "WARNING"
 logging.basicConfig(
-    level=logging.INFO,
+    level=_log_level,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[logging.StreamHandler(sys.stderr)],  # MCP uses stderr for logs
 )
@@ -28,7 +31,8 @@ logger = logging.getLogger("mcp_polygon")
 
 POLYGON_API_KEY = os.environ.get("POLYGON_API_KEY", "")
 if not POLYGON_API_KEY:
-    print("Warning: POLYGON_API_KEY environment variable not set.")
+    # Never print to stdout: it carries the MCP protocol for stdio transport
+    logger.warning("POLYGON_API_KEY environment variable not set.")
 
 version_number = "MCP-Polygon/unknown"
 try:
@@ -39,8 +43,33 @@ except PackageNotFoundError:
 polygon_client = RESTClient(POLYGON_API_KEY)
 polygon_client.headers["User-Agent"] += f" {version_number}"
 
-# Create global ConnectionManager for WebSocket streaming
-connection_manager = ConnectionManager()
+# urllib3 keeps only one idle connection per host by default, so concurrent
+# calls (batch_execute, multi-ticker tools) open extra TLS connections and
+# then discard them. Keep enough idle connections to reuse across fan-outs
+HTTP_POOL_SIZE = max(1, int(os.environ.get("MCP_HTTP_POOL_SIZE", "16")))
+polygon_client.client.connection_pool_kw["maxsize"] = HTTP_POOL_SIZE
+
+# WebSocket streaming tools can be disabled to skip the websockets import chain
+ENABLE_WEBSOCKETS = os.environ.get("MCP_ENABLE_WEBSOCKETS", "true").lower() not in (
+    "0",
+    "false",
+    "no",
+)
+
+# Global ConnectionManager for WebSocket streaming (see get_connection_manager)
+_connection_manager = None
+
+# Tool modules registered at startup, in registration order
+_REST_MODULES = (
+    "stocks",
+    "options",
+    "futures",
+    "crypto",
+    "forex",
+    "economy",
+    "indices",
+)
+_WS_MODULES = ("stocks", "crypto", "options", "futures", "forex", "indices")
 
 # Configure transport security for HTTP transports
 # This enables DNS rebinding protection as required by MCP specification
@@ -61,6 +90,14 @@ transport_security = TransportSecuritySettings(
 http_host = os.environ.get("FASTMCP_HOST", "127.0.0.1")
 http_port = int(os.environ.get("FASTMCP_PORT", "8000"))
 
+# Select the REST output format: "csv" (default) or "onto" (schema-once columnar)
+output_format = os.environ.get("MCP_OUTPUT_FORMAT", "csv").lower()
+formatter = json_to_onto if output_format == "onto" else json_to_csv
+
+# One API wrapper shared by every REST tool module, so the response cache and
+# in-flight request map are process-wide rather than per asset class
+polygon_api = PolygonAPIWrapper(polygon_client, formatter)
+
 poly_mcp = FastMCP(
     "Polygon",
     dependencies=["polygon"],
@@ -69,34 +106,102 @@ poly_mcp = FastMCP(
     port=http_port,
 )
 
-# Register REST API tools by asset class
-stocks.register_tools(poly_mcp, polygon_client, json_to_csv)
-options.register_tools(poly_mcp, polygon_client, json_to_csv)
-futures.register_tools(poly_mcp, polygon_client, json_to_csv)
-crypto.register_tools(poly_mcp, polygon_client, json_to_csv)
-forex.register_tools(poly_mcp, polygon_client, json_to_csv)
-economy.register_tools(poly_mcp, polygon_client, json_to_csv)
-indices.register_tools(poly_mcp, polygon_client, json_to_csv)
-
-# Register WebSocket streaming tools
-stocks_ws.register_tools(poly_mcp, connection_manager)
-crypto_ws.register_tools(poly_mcp, connection_manager)
-options_ws.register_tools(poly_mcp, connection_manager)
-futures_ws.register_tools(poly_mcp, connection_manager)
-forex_ws.register_tools(poly_mcp, connection_manager)
-indices_ws.register_tools(poly_mcp, connection_manager)
-
-
-async def run_startup_diagnostics():
+
+def get_connection_manager():
     """
-    Run diagnostics on server startup.
+    Return the global WebSocket ConnectionManager, creating it on first use.
+
+    Stdio deployments with MCP_ENABLE_WEBSOCKETS disabled never construct it
+    or import the WebSocket connection module.
+    """
+    global _connection_manager
+    if _connection_manager is None:
+        from .tools.websockets.connection_manager import ConnectionManager
+
+        _connection_manager = ConnectionManager()
+    return _connection_manager
+
+
+def _register_tools() -> None:
+    """
+    Import tool modules and register them with the MCP server.
+
+    Tool modules are imported here rather than at module scope so that the
+    WebSocket stack is never loaded when MCP_ENABLE_WEBSOCKETS is disabled.
+    """
+    # Register REST API tools by asset class
+    for name in _REST_MODULES:
+        module = importlib.import_module(f".tools.rest.{name}", __package__)
+        module.register_tools(poly_mcp, polygon_api)
+
+    # Register the batch tool that fans out to the tools above
+    from .tools import batch
+
+    batch.register_tools(poly_mcp)
+
+    if not ENABLE_WEBSOCKETS:
+        logger.info("WebSocket streaming tools disabled (MCP_ENABLE_WEBSOCKETS)")
+        return
+
+    # Register WebSocket streaming tools
+    for name in _WS_MODULES:
+        module = importlib.import_module(f".tools.websockets.{name}", __package__)
+        module.register_tools(poly_mcp, get_connection_manager)
+
+
+_register_tools()
+
+
+# Startup connectivity probe is opt-in: it makes a blocking network round trip
+HEALTHCHECK_ENABLED = os.environ.get("MCP_HEALTHCHECK") == "1"
+HEALTHCHECK_TIMEOUT = 2.0
+HEALTHCHECK_TTL = int(os.environ.get("MCP_HEALTHCHECK_TTL", "3600"))
 
-    Note: This async function calls synchronous polygon_client.get_aggs()
-    internally, which will block briefly (~100-300ms). This is acceptable
-    for a startup check that runs once on server initialization.
 
-    For production async patterns, wrap sync calls with asyncio.to_thread(),
-    but the performance impact here is negligible.
+def _health_cache_path() -> Path:
+    """Location of the cached connectivity result ($XDG_CACHE_HOME/mcp_polygon)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "mcp_polygon" / "health.json"
+
+
+def _api_key_fingerprint() -> str:
+    """Hash of the API key so a cached result is only reused for the same key."""
+    return hashlib.sha256(POLYGON_API_KEY.encode("utf-8")).hexdigest()
+
+
+def _health_cache_fresh() -> bool:
+    """Return True if a successful check for this API key is within the TTL."""
+    try:
+        cached = json.loads(_health_cache_path().read_text())
+    except (OSError, ValueError):
+        return False
+    return (
+        cached.get("key") == _api_key_fingerprint()
+        and time.time() - cached.get("checked_at", 0) < HEALTHCHECK_TTL
+    )
+
+
+def _write_health_cache() -> None:
+    """Record a successful connectivity check; failures to write are ignored."""
+    path = _health_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"key": _api_key_fingerprint(), "checked_at": time.time()})
+        )
+    except OSError:
+        # Read-only filesystems (e.g. the Docker image) simply skip caching
+        pass
+
+
+async def run_startup_diagnostics() -> bool:
+    """
+    Run diagnostics on server startup.
+
+    The synchronous polygon_client.get_aggs() probe runs in a worker thread
+    with a HEALTHCHECK_TIMEOUT deadline, so a slow network cannot stall startup.
 
     Checks performed:
     - POLYGON_API_KEY environment variable presence
@@ -107,6 +212,9 @@ async def run_startup_diagnostics():
     - ✅ Success indicators
     - ⚠️  Warnings for missing config
     - ❌ Errors for connectivity failures
+
+    Returns:
+        True if API connectivity was confirmed, False otherwise
     """
     logger.info("🔍 Running startup diagnostics...")
 
@@ -118,31 +226,70 @@ async def run_startup_diagnostics():
         logger.warning(
             "   Set your API key: export POLYGON_API_KEY=your_key_here"
         )
-        return
+        return False
 
     logger.info(f"✅ API key present (ends with: ...{POLYGON_API_KEY[-4:]})")
 
     # Test basic connectivity with simple aggregates query (works on all tiers)
     try:
-        test_result = polygon_client.get_aggs(
-            "AAPL", 1, "day", "2024-01-01", "2024-01-02", raw=True
+        test_result = await asyncio.wait_for(
+            asyncio.to_thread(
+                polygon_client.get_aggs,
+                "AAPL",
+                1,
+                "day",
+                "2024-01-01",
+                "2024-01-02",
+                raw=True,
+            ),
+            timeout=HEALTHCHECK_TIMEOUT,
         )
         if hasattr(test_result, "data") and test_result.data:
             logger.info("✅ API connectivity OK")
-        else:
-            logger.warning("⚠️  API returned empty response")
+            return True
+        logger.warning("⚠️  API returned empty response")
+    except asyncio.TimeoutError:
+        logger.error(
+            f"❌ API connectivity check timed out after {HEALTHCHECK_TIMEOUT}s"
+        )
     except Exception as e:
         logger.error(f"❌ API connectivity failed: {e}")
         logger.error("   Please check your API key and network connection")
         logger.error("   Visit: https://polygon.io/dashboard for API key")
+    return False
+
+
+def _use_uvloop(transport: str) -> bool:
+    """
+    Switch asyncio to uvloop when it is installed and the loop does network I/O.
+
+    uvloop is an optional extra (``pip install mcp_polygon[uvloop]``). HTTP
+    transports always use it. Stdio handles a single client over pipes, so
+    it only uses uvloop when WebSocket streaming is enabled, where market
+    data sockets keep the loop busy.
+
+    Returns:
+        True if the uvloop event loop policy was installed
+    """
+    if sys.platform == "win32" or (transport == "stdio" and not ENABLE_WEBSOCKETS):
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
 
 
 def run(transport: Literal["stdio", "sse", "streamable-http"] = "stdio") -> None:
     """Run the Polygon MCP server."""
-    import asyncio
-
-    # Run startup diagnostics
-    asyncio.run(run_startup_diagnostics())
+    # Run startup diagnostics when requested, unless a recent check succeeded
+    if HEALTHCHECK_ENABLED and not _health_cache_fresh():
+        if asyncio.run(run_startup_diagnostics()):
+            _write_health_cache()
 
     # Start the MCP server
+    _use_uvloop(transport)
     poly_mcp.run(transport)
@@ -1,3 +1,16 @@
 """MCP tools for Polygon.io API organized by asset class"""
 
-__all__ = ["stocks", "options", "futures", "crypto", "forex", "economy", "indices"]
+import os
+
+# Tools return text (CSV or JSON). By default FastMCP also publishes a
+# {"result": str} output schema per tool and repeats every result as
+# structuredContent; MCP_STRUCTURED_OUTPUT=false registers tools as text-only,
+# which skips that schema work and halves response payloads.
+STRUCTURED_OUTPUT = (
+    None
+    if os.environ.get("MCP_STRUCTURED_OUTPUT", "true").lower()
+    not in ("0", "false", "no")
+    else False
+)
+
+__all__ = ["batch", "rest", "websockets", "STRUCTURED_OUTPUT"]
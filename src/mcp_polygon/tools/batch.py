@@ -0,0 +1,112 @@
+"""Batch execution tool for running several read-only MCP tools in one call"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Set
+
+from . import STRUCTURED_OUTPUT
+
+# Upper bound on sub-calls per batch to keep a single request bounded
+MAX_BATCH_CALLS = 50
+
+
+def _result_text(result: Any) -> str:
+    """Return the text of a FastMCP.call_tool result."""
+    if isinstance(result, tuple):
+        # Tools with an output schema return (content blocks, structured output)
+        result = result[0]
+    if isinstance(result, dict):
+        return json.dumps(result)
+    return "".join(getattr(block, "text", "") for block in result)
+
+
+def register_tools(mcp):
+    """
+    Register the batch_execute tool with the MCP server.
+
+    Sub-calls are dispatched through the server's own tool registry, so they
+    get the same argument validation, caching and error handling as direct
+    tool calls.
+
+    Args:
+        mcp: FastMCP instance
+    """
+    from mcp.types import ToolAnnotations
+
+    async def _batchable_tools() -> Set[str]:
+        """Only read-only tools (REST queries, stream status) may be batched."""
+        return {
+            tool.name
+            for tool in await mcp.list_tools()
+            if tool.name != "batch_execute"
+            and tool.annotations
+            and tool.annotations.readOnlyHint
+        }
+
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
+    async def batch_execute(
+        calls: List[Dict[str, Any]],
+        max_concurrent: int = 8,
+        timeout_ms: int = 30000,
+    ) -> str:
+        """
+        Run several read-only tools concurrently and return all results at once.
+
+        Use this to fetch related data in one round trip, for example the SMA,
+        EMA, MACD and RSI for one ticker.
+
+        Args:
+            calls: List of {"name": <tool name>, "args": {<tool arguments>}}
+            max_concurrent: Maximum number of sub-calls in flight (default 8)
+            timeout_ms: Per-call timeout in milliseconds (default 30000)
+
+        Returns:
+            JSON array with one {"name", "ok", "result"|"error"} object per call,
+            in the same order as `calls`; a tool that returns an "Error..."
+            message is reported with ok=false
+        """
+        if not calls:
+            return "Error: 'calls' must contain at least one tool call."
+        if len(calls) > MAX_BATCH_CALLS:
+            return f"Error: A batch may contain at most {MAX_BATCH_CALLS} calls."
+        if timeout_ms <= 0:
+            return "Error: 'timeout_ms' must be a positive number of milliseconds."
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        timeout = timeout_ms / 1000
+        batchable = await _batchable_tools()
+
+        async def run_one(call: Dict[str, Any]) -> Dict[str, Any]:
+            name = call.get("name") if isinstance(call, dict) else None
+            if not isinstance(name, str) or name not in batchable:
+                return {
+                    "name": name,
+                    "ok": False,
+                    "error": f"Unknown or non-batchable tool: {name}",
+                }
+            args = call.get("args") or {}
+
+            async with semaphore:
+                try:
+                    result = _result_text(
+                        await asyncio.wait_for(mcp.call_tool(name, args), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    return {
+                        "name": name,
+                        "ok": False,
+                        "error": f"Timed out after {timeout_ms}ms",
+                    }
+                except Exception as e:
+                    return {"name": name, "ok": False, "error": str(e)}
+
+            # Tools report failures (validation, 404, rate limits) as text
+            if result.startswith("Error"):
+                return {"name": name, "ok": False, "error": result}
+            return {"name": name, "ok": True, "result": result}
+
+        results = await asyncio.gather(*(run_one(call) for call in calls))
+        return json.dumps(results)
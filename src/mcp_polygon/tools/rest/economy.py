@@ -2,25 +2,26 @@
 
 from typing import Optional, Any, Dict, Union
 from datetime import datetime, date
+from mcp.types import ToolAnnotations
 from ...api_wrapper import PolygonAPIWrapper
+from .. import STRUCTURED_OUTPUT
 from ...validation import validate_date, validate_date_any_of
 
 
-def register_tools(mcp, client, formatter):
+def register_tools(mcp, api: PolygonAPIWrapper):
     """
     Register all economy-related tools with the MCP server.
 
     Args:
         mcp: FastMCP instance
-        client: Polygon RESTClient instance
-        formatter: json_to_csv function
+        api: Shared PolygonAPIWrapper (one per process, so its response
+            cache and in-flight map span every asset class)
     """
-    from mcp.types import ToolAnnotations
 
-    # Create API wrapper instance for this module
-    api = PolygonAPIWrapper(client, formatter)
-
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_treasury_yields(
         date: Optional[Union[str, datetime, date]] = None,
         date_any_of: Optional[str] = None,
@@ -64,7 +65,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_inflation(
         date: Optional[Union[str, datetime, date]] = None,
         date_any_of: Optional[str] = None,
@@ -106,7 +110,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_inflation_expectations(
         date: Optional[Union[str, datetime, date]] = None,
         date_any_of: Optional[str] = None,
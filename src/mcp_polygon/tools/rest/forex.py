@@ -2,25 +2,26 @@
 
 from typing import Optional, Any, Dict, Union
 from datetime import datetime, date
+from mcp.types import ToolAnnotations
 from ...api_wrapper import PolygonAPIWrapper
+from .. import STRUCTURED_OUTPUT
 from ...validation import validate_date
 
 
-def register_tools(mcp, client, formatter):
+def register_tools(mcp, api: PolygonAPIWrapper):
     """
     Register all forex-related tools with the MCP server.
 
     Args:
         mcp: FastMCP instance
-        client: Polygon RESTClient instance
-        formatter: json_to_csv function
+        api: Shared PolygonAPIWrapper (one per process, so its response
+            cache and in-flight map span every asset class)
     """
-    from mcp.types import ToolAnnotations
 
-    # Create API wrapper instance for this module
-    api = PolygonAPIWrapper(client, formatter)
-
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_last_forex_quote(
         from_: str,
         to: str,
@@ -36,7 +37,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_real_time_currency_conversion(
         from_: str,
         to: str,
@@ -56,7 +60,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_forex_sma(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -86,7 +93,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_forex_ema(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -116,7 +126,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_forex_macd(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -150,7 +163,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_forex_rsi(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
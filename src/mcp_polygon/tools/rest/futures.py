@@ -2,24 +2,25 @@
 
 from typing import Optional, Any, Dict, Union
 from datetime import date
+from mcp.types import ToolAnnotations
 from ...api_wrapper import PolygonAPIWrapper
+from .. import STRUCTURED_OUTPUT
 
 
-def register_tools(mcp, client, formatter):
+def register_tools(mcp, api: PolygonAPIWrapper):
     """
     Register all futures-related tools with the MCP server.
 
     Args:
         mcp: FastMCP instance
-        client: Polygon RESTClient instance
-        formatter: json_to_csv function
+        api: Shared PolygonAPIWrapper (one per process, so its response
+            cache and in-flight map span every asset class)
     """
-    from mcp.types import ToolAnnotations
 
-    # Create API wrapper instance for this module
-    api = PolygonAPIWrapper(client, formatter)
-
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_aggregates(
         ticker: str,
         resolution: str,
@@ -49,7 +50,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_contracts(
         product_code: Optional[str] = None,
         first_trade_date: Optional[Union[str, date]] = None,
@@ -77,7 +81,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_futures_contract_details(
         ticker: str,
         as_of: Optional[Union[str, date]] = None,
@@ -93,7 +100,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_products(
         name: Optional[str] = None,
         name_search: Optional[str] = None,
@@ -127,7 +137,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_futures_product_details(
         product_code: str,
         type: Optional[str] = None,
@@ -145,7 +158,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_quotes(
         ticker: str,
         timestamp: Optional[str] = None,
@@ -183,7 +199,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_trades(
         ticker: str,
         timestamp: Optional[str] = None,
@@ -221,7 +240,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_schedules(
         session_end_date: Optional[str] = None,
         trading_venue: Optional[str] = None,
@@ -241,7 +263,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_schedules_by_product_code(
         product_code: str,
         session_end_date: Optional[str] = None,
@@ -269,7 +294,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_market_statuses(
         product_code_any_of: Optional[str] = None,
         product_code: Optional[str] = None,
@@ -289,7 +317,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_futures_snapshot(
         ticker: Optional[str] = None,
         ticker_any_of: Optional[str] = None,
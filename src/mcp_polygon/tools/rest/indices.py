@@ -1,25 +1,27 @@
 """Indices-related MCP tools for Polygon.io API"""
 
-from typing import Optional, Any, Dict, Union
+from typing import Optional, Any, Dict, Union, List
 from datetime import datetime, date
+from mcp.types import ToolAnnotations
 from ...api_wrapper import PolygonAPIWrapper
+from .. import STRUCTURED_OUTPUT
+from ...indicators import get_indicators, get_sma_batch
 
 
-def register_tools(mcp, client, formatter):
+def register_tools(mcp, api: PolygonAPIWrapper):
     """
     Register all indices-related tools with the MCP server.
 
     Args:
         mcp: FastMCP instance
-        client: Polygon RESTClient instance
-        formatter: json_to_csv function
+        api: Shared PolygonAPIWrapper (one per process, so its response
+            cache and in-flight map span every asset class)
     """
-    from mcp.types import ToolAnnotations
 
-    # Create API wrapper instance for this module
-    api = PolygonAPIWrapper(client, formatter)
-
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_indices_snapshot(
         ticker_any_of: Optional[str] = None,
         order: Optional[str] = None,
@@ -54,7 +56,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_index_sma(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -80,7 +85,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_index_ema(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -106,7 +114,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_index_macd(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -136,7 +147,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_index_rsi(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -161,3 +175,74 @@ def register_tools(mcp, client, formatter):
             limit=limit,
             params=params,
         )
+
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
+    async def get_index_indicators(
+        ticker: str,
+        from_: Union[str, int, datetime, date],
+        to: Union[str, int, datetime, date],
+        timespan: str = "day",
+        multiplier: int = 1,
+        indicators: Optional[List[str]] = None,
+        window: int = 50,
+        short_window: int = 12,
+        long_window: int = 26,
+        signal_window: int = 9,
+        rsi_window: int = 14,
+        adjusted: Optional[bool] = None,
+        limit: Optional[int] = 5000,
+    ) -> str:
+        """
+        Get SMA, EMA, MACD and RSI for an index ticker (format: I:SPX) from a single aggregates request.
+
+        Start `from_` early enough to cover the longest window; `indicators`
+        takes any of "sma", "ema", "macd", "rsi" (default: all).
+        """
+        return await get_indicators(
+            api,
+            ticker=ticker,
+            from_=from_,
+            to=to,
+            timespan=timespan,
+            multiplier=multiplier,
+            indicators=indicators,
+            window=window,
+            short_window=short_window,
+            long_window=long_window,
+            signal_window=signal_window,
+            rsi_window=rsi_window,
+            adjusted=adjusted,
+            limit=limit,
+        )
+
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
+    async def get_index_sma_batch(
+        tickers: List[str],
+        timestamp: Optional[Union[str, int, datetime, date]] = None,
+        timespan: Optional[str] = None,
+        adjusted: Optional[bool] = None,
+        window: Optional[int] = 50,
+        series_type: Optional[str] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = 50,
+    ) -> str:
+        """
+        Get Simple Moving Average (SMA) for several index tickers (format: I:SPX) in one call.
+        """
+        return await get_sma_batch(
+            api,
+            tickers,
+            timestamp=timestamp,
+            timespan=timespan,
+            adjusted=adjusted,
+            window=window,
+            series_type=series_type,
+            order=order,
+            limit=limit,
+        )
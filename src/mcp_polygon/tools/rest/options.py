@@ -1,25 +1,28 @@
 """Options-related MCP tools for Polygon.io API"""
 
-from typing import Optional, Any, Dict, Union
+from typing import Optional, Any, Dict, Union, List
 from datetime import datetime, date
+from mcp.types import ToolAnnotations
 from ...api_wrapper import PolygonAPIWrapper
+from .. import STRUCTURED_OUTPUT
+from ...indicators import get_indicators, get_sma_batch
+from ...validation import validate_option_ticker
 
 
-def register_tools(mcp, client, formatter):
+def register_tools(mcp, api: PolygonAPIWrapper):
     """
     Register all options-related tools with the MCP server.
 
     Args:
         mcp: FastMCP instance
-        client: Polygon RESTClient instance
-        formatter: json_to_csv function
+        api: Shared PolygonAPIWrapper (one per process, so its response
+            cache and in-flight map span every asset class)
     """
-    from mcp.types import ToolAnnotations
 
-    # Create API wrapper instance for this module
-    api = PolygonAPIWrapper(client, formatter)
-
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_snapshot_option(
         underlying_asset: str,
         option_contract: str,
@@ -28,6 +31,9 @@ def register_tools(mcp, client, formatter):
         """
         Get snapshot for a specific option contract.
         """
+        if error := validate_option_ticker(option_contract):
+            return error
+
         return await api.call(
             "get_snapshot_option",
             underlying_asset=underlying_asset,
@@ -35,7 +41,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_options_contracts(
         underlying_ticker: Optional[str] = None,
         contract_type: Optional[str] = None,
@@ -63,7 +72,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_options_contract(
         options_ticker: str,
         params: Optional[Dict[str, Any]] = None,
@@ -73,13 +85,19 @@ def register_tools(mcp, client, formatter):
 
         Options ticker format: O:SPY251219C00650000 (O: prefix + underlying + expiration YYMMDD + C/P + strike price * 1000)
         """
+        if error := validate_option_ticker(options_ticker):
+            return error
+
         return await api.call(
             "get_options_contract",
             ticker=options_ticker,
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_options_chain(
         underlying_asset: str,
         strike_price: Optional[float] = None,
@@ -132,7 +150,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_options_sma(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -145,6 +166,9 @@ def register_tools(mcp, client, formatter):
         params: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Get Simple Moving Average (SMA) technical indicator for an options ticker (format: O:SPY251219C00650000)."""
+        if error := validate_option_ticker(ticker):
+            return error
+
         return await api.call(
             "get_sma",
             ticker=ticker,
@@ -158,7 +182,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_options_ema(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -171,6 +198,9 @@ def register_tools(mcp, client, formatter):
         params: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Get Exponential Moving Average (EMA) technical indicator for an options ticker (format: O:SPY251219C00650000)."""
+        if error := validate_option_ticker(ticker):
+            return error
+
         return await api.call(
             "get_ema",
             ticker=ticker,
@@ -184,7 +214,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_options_macd(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -199,6 +232,9 @@ def register_tools(mcp, client, formatter):
         params: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Get Moving Average Convergence/Divergence (MACD) technical indicator for an options ticker (format: O:SPY251219C00650000)."""
+        if error := validate_option_ticker(ticker):
+            return error
+
         return await api.call(
             "get_macd",
             ticker=ticker,
@@ -214,7 +250,10 @@ def register_tools(mcp, client, formatter):
             params=params,
         )
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_options_rsi(
         ticker: str,
         timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -227,6 +266,9 @@ def register_tools(mcp, client, formatter):
         params: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Get Relative Strength Index (RSI) technical indicator for an options ticker (format: O:SPY251219C00650000)."""
+        if error := validate_option_ticker(ticker):
+            return error
+
         return await api.call(
             "get_rsi",
             ticker=ticker,
@@ -239,3 +281,80 @@ def register_tools(mcp, client, formatter):
             limit=limit,
             params=params,
         )
+
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
+    async def get_options_indicators(
+        ticker: str,
+        from_: Union[str, int, datetime, date],
+        to: Union[str, int, datetime, date],
+        timespan: str = "day",
+        multiplier: int = 1,
+        indicators: Optional[List[str]] = None,
+        window: int = 50,
+        short_window: int = 12,
+        long_window: int = 26,
+        signal_window: int = 9,
+        rsi_window: int = 14,
+        adjusted: Optional[bool] = None,
+        limit: Optional[int] = 5000,
+    ) -> str:
+        """
+        Get SMA, EMA, MACD and RSI for an options contract (format: O:SPY251219C00650000) from a single aggregates request.
+
+        Start `from_` early enough to cover the longest window; `indicators`
+        takes any of "sma", "ema", "macd", "rsi" (default: all).
+        """
+        if error := validate_option_ticker(ticker):
+            return error
+
+        return await get_indicators(
+            api,
+            ticker=ticker,
+            from_=from_,
+            to=to,
+            timespan=timespan,
+            multiplier=multiplier,
+            indicators=indicators,
+            window=window,
+            short_window=short_window,
+            long_window=long_window,
+            signal_window=signal_window,
+            rsi_window=rsi_window,
+            adjusted=adjusted,
+            limit=limit,
+        )
+
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
+    async def get_options_sma_batch(
+        tickers: List[str],
+        timestamp: Optional[Union[str, int, datetime, date]] = None,
+        timespan: Optional[str] = None,
+        adjusted: Optional[bool] = None,
+        window: Optional[int] = 50,
+        series_type: Optional[str] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = 10,
+    ) -> str:
+        """
+        Get Simple Moving Average (SMA) for several options tickers (format: O:SPY251219C00650000) in one call.
+        """
+        if error := validate_option_ticker(*tickers):
+            return error
+
+        return await get_sma_batch(
+            api,
+            tickers,
+            timestamp=timestamp,
+            timespan=timespan,
+            adjusted=adjusted,
+            window=window,
+            series_type=series_type,
+            order=order,
+            limit=limit,
+        )
@@ -9,17 +9,42 @@ Documentation References:
 """
 
 import asyncio
-import json
 import logging
 import ssl
 from typing import Dict, List, Optional, Callable, Set
 from enum import Enum
 from collections import deque
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 logger = logging.getLogger(__name__)
 
+# Events processed between explicit event-loop yields. Frames that are already
+# queued are received without suspending, so a bursting market could otherwise
+# starve other connections, pings and tool calls sharing the loop
+YIELD_EVERY_EVENTS = 64
+
+# Messages queued per handler before further messages for that handler are
+# dropped. Handlers consume from their own queue, so a slow handler falls
+# behind on its own instead of stalling the receive loop
+HANDLER_QUEUE_SIZE = 1000
+
+# TLS context shared by every connection and reconnect. Loading the system CA
+# store takes tens of milliseconds, so it is built once, on first connect
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """Return the shared client SSL context, creating it on first use."""
+    global _ssl_context
+    if _ssl_context is None:
+        context = ssl.create_default_context()
+        context.check_hostname = True
+        context.verify_mode = ssl.CERT_REQUIRED
+        _ssl_context = context
+    return _ssl_context
+
 
 class APIAccessError(Exception):
     """Raised when API plan doesn't include requested data access."""
@@ -62,6 +87,9 @@ class WebSocketConnection:
         self.state = ConnectionState.DISCONNECTED
         self.subscriptions: Set[str] = set()
         self.message_handlers: List[Callable] = []
+        self._handler_queues: List[asyncio.Queue] = []
+        self._handler_tasks: List[asyncio.Task] = []
+        self._dropped_messages: int = 0  # Messages a full handler queue refused
         self.reconnect_attempts = 0
         self.max_reconnect_delay = 30
         self._receive_task: Optional[asyncio.Task] = None
@@ -69,26 +97,25 @@ class WebSocketConnection:
         self._total_messages_received: int = 0  # Lifetime counter
         self.last_error: Optional[str] = None  # Store last API access error
 
-    async def connect(self) -> None:
+    async def connect(self, *, retry: bool = True) -> None:
         """
         Establish WebSocket connection and authenticate.
 
+        Args:
+            retry: On failure, keep reconnecting with backoff (default). When
+                False the error is raised instead, for the reconnect loop.
+
         Documentation: polygon-docs/websockets/quickstart.md:65-92
         """
         try:
             self.state = ConnectionState.CONNECTING
-            logger.info(f"Connecting to {self.endpoint}")
-
-            # Create SSL context with system certificates
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = True
-            ssl_context.verify_mode = ssl.CERT_REQUIRED
+            logger.info("Connecting to %s", self.endpoint)
 
             self.websocket = await websockets.connect(
                 self.endpoint,
                 ping_interval=30,
                 ping_timeout=10,
-                ssl=ssl_context
+                ssl=_get_ssl_context()
             )
 
             self.state = ConnectionState.AUTHENTICATING
@@ -113,11 +140,13 @@ class WebSocketConnection:
             if self.subscriptions:
                 await self._resubscribe()
 
-            logger.info(f"✓ Connected to {self.market} WebSocket")
+            logger.info("✓ Connected to %s WebSocket", self.market)
 
         except Exception as e:
             self.state = ConnectionState.ERROR
-            logger.error(f"Connection failed: {e}")
+            if not retry:
+                raise
+            logger.error("Connection failed: %s", e)
             await self._handle_connection_error(e)
 
     async def _authenticate(self) -> None:
@@ -127,7 +156,7 @@ class WebSocketConnection:
         Documentation: polygon-docs/websockets/quickstart.md:146-175
         """
         auth_message = {"action": "auth", "params": self.api_key}
-        await self.websocket.send(json.dumps(auth_message))
+        await self.websocket.send(orjson.dumps(auth_message).decode())
         logger.debug("→ Authentication message sent")
 
         # Wait for auth success - may receive multiple messages
@@ -135,7 +164,7 @@ class WebSocketConnection:
         max_attempts = 5
         for attempt in range(max_attempts):
             response = await self.websocket.recv()
-            messages = json.loads(response)
+            messages = orjson.loads(response)
 
             for msg in messages:
                 if msg.get("ev") == "status":
@@ -158,21 +187,34 @@ class WebSocketConnection:
         Args:
             channels: List of channel subscriptions (e.g., ["T.AAPL", "Q.MSFT"])
 
+        Duplicates and channels that are already subscribed are dropped, and
+        no frame is sent when nothing new remains.
+
         Documentation: polygon-docs/websockets/quickstart.md:245-278
         """
         if self.state != ConnectionState.CONNECTED:
             raise Exception(f"Cannot subscribe: connection state is {self.state.value}")
 
-        subscribe_message = {"action": "subscribe", "params": ",".join(channels)}
-        await self.websocket.send(json.dumps(subscribe_message))
+        subscriptions = self.subscriptions
+        channels = [c for c in dict.fromkeys(channels) if c not in subscriptions]
+        if not channels:
+            return
 
-        self.subscriptions.update(channels)
-        logger.info(f"→ Subscribed to {len(channels)} channels")
+        await self._send_subscribe(channels)
+        subscriptions.update(channels)
+        logger.info("→ Subscribed to %s channels", len(channels))
+
+    async def _send_subscribe(self, channels: List[str]) -> None:
+        """Send a subscribe frame for channels."""
+        subscribe_message = {"action": "subscribe", "params": ",".join(channels)}
+        await self.websocket.send(orjson.dumps(subscribe_message).decode())
 
     async def unsubscribe(self, channels: List[str]) -> None:
         """
         Unsubscribe from data channels.
 
+        Only channels that are currently subscribed are sent, each once.
+
         Documentation: polygon-docs/websockets/INDEX_AGENT.md:116-119
         """
         if self.state != ConnectionState.CONNECTED:
@@ -180,17 +222,22 @@ class WebSocketConnection:
                 f"Cannot unsubscribe: connection state is {self.state.value}"
             )
 
+        subscriptions = self.subscriptions
+        channels = [c for c in dict.fromkeys(channels) if c in subscriptions]
+        if not channels:
+            return
+
         unsubscribe_message = {"action": "unsubscribe", "params": ",".join(channels)}
-        await self.websocket.send(json.dumps(unsubscribe_message))
+        await self.websocket.send(orjson.dumps(unsubscribe_message).decode())
 
         self.subscriptions.difference_update(channels)
-        logger.info(f"→ Unsubscribed from {len(channels)} channels")
+        logger.info("→ Unsubscribed from %s channels", len(channels))
 
     async def _resubscribe(self) -> None:
         """Resubscribe to all channels after reconnection."""
         if self.subscriptions:
-            logger.info(f"Resubscribing to {len(self.subscriptions)} channels")
-            await self.subscribe(list(self.subscriptions))
+            logger.info("Resubscribing to %s channels", len(self.subscriptions))
+            await self._send_subscribe(list(self.subscriptions))
 
     async def _receive_messages(self) -> None:
         """
@@ -198,41 +245,56 @@ class WebSocketConnection:
 
         Documentation: polygon-docs/websockets/quickstart.md:363-441
         """
+        # Bound once per connection: the buffer and handler list are only
+        # ever mutated in place, never replaced
+        loads = orjson.loads
+        buffer_extend = self.message_buffer.extend
+        queues = self._handler_queues
+        since_yield = 0
         try:
             async for message in self.websocket:
                 try:
-                    messages = json.loads(message)
+                    messages = loads(message)
 
                     if not isinstance(messages, list):
-                        logger.warning(f"Non-array message received: {message}")
+                        logger.warning("Non-array message received: %s", message)
                         continue
 
-                    for msg in messages:
-                        # Handle status messages
-                        if msg.get("ev") == "status":
+                    data_messages = [
+                        msg for msg in messages if msg.get("ev") != "status"
+                    ]
+                    if len(data_messages) != len(messages):
+                        for msg in messages:
+                            if msg.get("ev") != "status":
+                                continue
                             try:
                                 self._handle_status(msg)
                             except APIAccessError as e:
                                 # Store error for status queries
                                 self.last_error = str(e)
                                 self.state = ConnectionState.ERROR
-                                logger.error(f"⚠️  API Access Error: {e}")
+                                logger.error("⚠️  API Access Error: %s", e)
                                 # Don't raise - keep connection alive for potential delayed endpoint reconnect
-                                continue
-                        else:
-                            # Buffer data messages (status messages are NOT buffered)
-                            self.message_buffer.append(msg)
-                            self._total_messages_received += 1
 
-                            # Route market data to handlers
-                            for handler in self.message_handlers:
-                                await handler(msg)
+                    # Buffer data messages (status messages are NOT buffered)
+                    buffer_extend(data_messages)
+                    self._total_messages_received += len(data_messages)
 
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON received: {message}, error: {e}")
+                    # Route market data to each handler's queue without waiting
+                    # for the handler; a full queue drops for that handler only
+                    if queues and data_messages:
+                        self._enqueue_for_handlers(queues, data_messages)
+
+                    since_yield += len(messages)
+                    if since_yield >= YIELD_EVERY_EVENTS:
+                        since_yield = 0
+                        await asyncio.sleep(0)
+
+                except orjson.JSONDecodeError as e:
+                    logger.error("Invalid JSON received: %s, error: %s", message, e)
 
         except ConnectionClosed as e:
-            logger.warning(f"Connection closed: {e}")
+            logger.warning("Connection closed: %s", e)
             await self._handle_connection_error(e)
         except asyncio.CancelledError:
             logger.info("Receive task cancelled (connection closing)")
@@ -253,7 +315,7 @@ class WebSocketConnection:
                 f"Note: Delayed endpoint is automatically used based on your API key."
             )
 
-        logger.info(f"[STATUS] {status}: {message}")
+        logger.info("[STATUS] %s: %s", status, message)
 
     async def _handle_connection_error(self, error: Exception) -> None:
         """
@@ -261,24 +323,29 @@ class WebSocketConnection:
 
         Documentation: polygon-docs/websockets/INDEX_AGENT.md:492-497
         """
-        self.state = ConnectionState.ERROR
+        # Iterative rather than recursive, so a long outage does not build up
+        # a chain of awaiting coroutines
+        while True:
+            self.state = ConnectionState.ERROR
 
-        # Calculate backoff delay (1s, 2s, 4s, 8s, ... max 30s)
-        delay = min(2**self.reconnect_attempts, self.max_reconnect_delay)
-        self.reconnect_attempts += 1
+            # Calculate backoff delay (1s, 2s, 4s, 8s, ... max 30s)
+            delay = min(2**self.reconnect_attempts, self.max_reconnect_delay)
+            self.reconnect_attempts += 1
 
-        logger.warning(f"Reconnecting in {delay}s (attempt {self.reconnect_attempts})")
-        await asyncio.sleep(delay)
+            logger.warning(
+                "Reconnecting in %ss (attempt %s)", delay, self.reconnect_attempts
+            )
+            await asyncio.sleep(delay)
 
-        try:
-            await self.connect()
-        except Exception as e:
-            logger.error(f"Reconnection failed: {e}")
-            # Will try again with increased delay
-            await self._handle_connection_error(e)
+            try:
+                await self.connect(retry=False)
+                return
+            except Exception as e:
+                logger.error("Reconnection failed: %s", e)
+                # Will try again with increased delay
 
     async def close(self) -> None:
-        """Close WebSocket connection gracefully."""
+        """Close WebSocket connection gracefully and remove message handlers."""
         # Clear buffer on disconnect
         self.clear_message_buffer()
 
@@ -290,14 +357,64 @@ class WebSocketConnection:
             except asyncio.CancelledError:
                 pass
 
+        # Stop handler consumers; undelivered messages are discarded
+        for task in self._handler_tasks:
+            task.cancel()
+        await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+        self._handler_tasks.clear()
+        self._handler_queues.clear()
+        self.message_handlers.clear()
+
         if self.websocket:
             await self.websocket.close()
             self.state = ConnectionState.DISCONNECTED
-            logger.info(f"✓ Closed {self.market} WebSocket")
+            logger.info("✓ Closed %s WebSocket", self.market)
 
     def add_message_handler(self, handler: Callable) -> None:
-        """Add a message handler callback."""
+        """
+        Add a message handler callback.
+
+        Handlers are async callables taking one data message. Each handler
+        gets its own bounded queue and consumer task (started on the running
+        event loop), so it never blocks message reception; when its queue is
+        full, new messages are dropped for that handler and counted.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=HANDLER_QUEUE_SIZE)
         self.message_handlers.append(handler)
+        self._handler_queues.append(queue)
+        self._handler_tasks.append(
+            asyncio.get_running_loop().create_task(self._run_handler(handler, queue))
+        )
+
+    async def _run_handler(self, handler: Callable, queue: asyncio.Queue) -> None:
+        """Feed queued messages to one handler, isolating its failures."""
+        while True:
+            msg = await queue.get()
+            try:
+                await handler(msg)
+            except Exception as e:
+                logger.error("Message handler %r failed: %s", handler, e)
+            finally:
+                queue.task_done()
+
+    def _enqueue_for_handlers(
+        self, queues: List[asyncio.Queue], messages: List[dict]
+    ) -> None:
+        """Queue messages for every handler, dropping where a queue is full."""
+        dropped = 0
+        for queue in queues:
+            for msg in messages:
+                try:
+                    queue.put_nowait(msg)
+                except asyncio.QueueFull:
+                    dropped += 1
+        if dropped:
+            if not self._dropped_messages:
+                logger.warning(
+                    "%s message handler is falling behind; dropping messages for it",
+                    self.market,
+                )
+            self._dropped_messages += dropped
 
     def get_status(self) -> dict:
         """Get connection status."""
@@ -330,12 +447,14 @@ class WebSocketConnection:
         Get message reception statistics.
 
         Returns:
-            Dict with keys: total_received, buffered, buffer_capacity
+            Dict with keys: total_received, buffered, buffer_capacity,
+            dropped (messages refused by a full handler queue)
         """
         return {
             "total_received": self._total_messages_received,
             "buffered": len(self.message_buffer),
             "buffer_capacity": self.message_buffer.maxlen,
+            "dropped": self._dropped_messages,
         }
 
     def clear_message_buffer(self) -> None:
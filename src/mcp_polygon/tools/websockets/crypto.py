@@ -15,22 +15,38 @@ Documentation References:
 """
 
 import os
-from typing import List, Optional
+from collections import defaultdict
+from typing import Callable, List, Optional
 from mcp.types import ToolAnnotations
+from .. import STRUCTURED_OUTPUT
 from .connection_manager import ConnectionManager
-from .stream_formatter import format_connection_status
+from .stream_formatter import format_connection_status, format_stream_message
 
+# Display names for subscription channel prefixes
+_CHANNEL_NAMES = {
+    "XT": "Trades",
+    "XQ": "Quotes",
+    "XA": "Minute Aggregates",
+    "XAS": "Second Aggregates",
+    "FMV": "Fair Market Value",
+}
 
-def register_tools(mcp, connection_manager: ConnectionManager):
+
+def register_tools(mcp, get_connection_manager: Callable[[], ConnectionManager]):
     """
     Register WebSocket streaming tools for crypto market.
 
     Args:
         mcp: FastMCP instance
-        connection_manager: Global ConnectionManager instance
+        get_connection_manager: Returns the global ConnectionManager; called
+            on each tool call so the manager is only created once a stream
+            tool is used
     """
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def start_crypto_stream(
         channels: Optional[List[str]] = None,
         api_key: Optional[str] = None,
@@ -101,7 +117,7 @@ def register_tools(mcp, connection_manager: ConnectionManager):
                 channels = []
 
             # Get or create connection
-            conn = connection_manager.get_connection(
+            conn = get_connection_manager().get_connection(
                 "crypto",
                 endpoint=endpoint,
                 api_key=api_key or os.getenv("POLYGON_API_KEY"),
@@ -119,7 +135,6 @@ def register_tools(mcp, connection_manager: ConnectionManager):
             recent = conn.get_recent_messages(limit=5)
 
             # Format sample messages
-            from .stream_formatter import format_stream_message
             formatted_samples = []
             for msg in recent:
                 try:
@@ -147,7 +162,10 @@ Stream is now active. Use get_crypto_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to start crypto stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def stop_crypto_stream() -> str:
         """
         Stop cryptocurrency market data stream.
@@ -158,7 +176,7 @@ Stream is now active. Use get_crypto_stream_status() to check buffer state."""
             Status message indicating stream stopped
         """
         try:
-            conn = connection_manager.get_connection("crypto")
+            conn = get_connection_manager().get_connection("crypto")
             await conn.close()
             return "✓ Stopped crypto WebSocket stream"
         except KeyError:
@@ -166,7 +184,10 @@ Stream is now active. Use get_crypto_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to stop crypto stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_crypto_stream_status() -> str:
         """
         Get current status of crypto WebSocket connection.
@@ -177,13 +198,16 @@ Stream is now active. Use get_crypto_stream_status() to check buffer state."""
             Connection status including state, subscriptions, and channel count
         """
         try:
-            conn = connection_manager.get_connection("crypto")
+            conn = get_connection_manager().get_connection("crypto")
             status = conn.get_status()
             return format_connection_status(status)
         except KeyError:
             return "○ No active crypto WebSocket connection"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def subscribe_crypto_channels(channels: List[str]) -> str:
         """
         Add subscriptions to active crypto stream.
@@ -199,7 +223,7 @@ Stream is now active. Use get_crypto_stream_status() to check buffer state."""
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("crypto")
+            conn = get_connection_manager().get_connection("crypto")
             await conn.subscribe(channels)
 
             status = conn.get_status()
@@ -211,7 +235,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to subscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def unsubscribe_crypto_channels(channels: List[str]) -> str:
         """
         Remove subscriptions from active crypto stream.
@@ -225,7 +252,7 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("crypto")
+            conn = get_connection_manager().get_connection("crypto")
             await conn.unsubscribe(channels)
 
             status = conn.get_status()
@@ -237,7 +264,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to unsubscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_crypto_subscriptions() -> str:
         """
         List all active subscriptions for crypto stream.
@@ -249,28 +279,19 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             List of subscribed channels grouped by type
         """
         try:
-            conn = connection_manager.get_connection("crypto")
+            conn = get_connection_manager().get_connection("crypto")
             status = conn.get_status()
 
             if not status["subscriptions"]:
                 return "No active subscriptions"
 
-            channels_by_type = {}
+            channels_by_type = defaultdict(list)
             for channel in status["subscriptions"]:
-                prefix = channel.split(".")[0]
-                if prefix not in channels_by_type:
-                    channels_by_type[prefix] = []
-                channels_by_type[prefix].append(channel)
+                channels_by_type[channel.partition(".")[0]].append(channel)
 
             output = f"Crypto Stream Subscriptions ({status['subscription_count']} total):\n\n"
             for prefix, channels in sorted(channels_by_type.items()):
-                channel_name = {
-                    "XT": "Trades",
-                    "XQ": "Quotes",
-                    "XA": "Minute Aggregates",
-                    "XAS": "Second Aggregates",
-                    "FMV": "Fair Market Value",
-                }.get(prefix, prefix)
+                channel_name = _CHANNEL_NAMES.get(prefix, prefix)
 
                 output += f"{channel_name} ({len(channels)}):\n"
                 output += "  " + ", ".join(channels[:20])
@@ -11,22 +11,37 @@ Documentation References:
 """
 
 import os
-from typing import List, Optional
+from collections import defaultdict
+from typing import Callable, List, Optional
 from mcp.types import ToolAnnotations
+from .. import STRUCTURED_OUTPUT
 from .connection_manager import ConnectionManager
-from .stream_formatter import format_connection_status
+from .stream_formatter import format_connection_status, format_stream_message
 
+# Display names for subscription channel prefixes
+_CHANNEL_NAMES = {
+    "T": "Trades (T.*)",
+    "Q": "Quotes (Q.*)",
+    "AM": "Minute Aggregates (AM.*)",
+    "AS": "Second Aggregates (AS.*)",
+}
 
-def register_tools(mcp, connection_manager: ConnectionManager):
+
+def register_tools(mcp, get_connection_manager: Callable[[], ConnectionManager]):
     """
     Register WebSocket streaming tools for futures market.
 
     Args:
         mcp: FastMCP instance
-        connection_manager: Global ConnectionManager instance
+        get_connection_manager: Returns the global ConnectionManager; called
+            on each tool call so the manager is only created once a stream
+            tool is used
     """
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def start_futures_stream(
         channels: List[str],
         api_key: Optional[str] = None,
@@ -83,7 +98,7 @@ def register_tools(mcp, connection_manager: ConnectionManager):
         """
         try:
             # Get or create connection
-            conn = connection_manager.get_connection(
+            conn = get_connection_manager().get_connection(
                 "futures",
                 endpoint=endpoint,
                 api_key=api_key or os.getenv("POLYGON_API_KEY"),
@@ -100,7 +115,6 @@ def register_tools(mcp, connection_manager: ConnectionManager):
             recent = conn.get_recent_messages(limit=5)
 
             # Format sample messages
-            from .stream_formatter import format_stream_message
             formatted_samples = []
             for msg in recent:
                 try:
@@ -128,7 +142,10 @@ Stream is now active. Use get_futures_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to start futures stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def stop_futures_stream() -> str:
         """
         Stop futures market data stream.
@@ -139,7 +156,7 @@ Stream is now active. Use get_futures_stream_status() to check buffer state."""
             Status message indicating stream stopped
         """
         try:
-            conn = connection_manager.get_connection("futures")
+            conn = get_connection_manager().get_connection("futures")
             await conn.close()
             return "✓ Stopped futures WebSocket stream"
         except KeyError:
@@ -147,7 +164,10 @@ Stream is now active. Use get_futures_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to stop futures stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_futures_stream_status() -> str:
         """
         Get current status of futures WebSocket connection.
@@ -158,13 +178,16 @@ Stream is now active. Use get_futures_stream_status() to check buffer state."""
             Connection status including state, subscriptions, and channel count
         """
         try:
-            conn = connection_manager.get_connection("futures")
+            conn = get_connection_manager().get_connection("futures")
             status = conn.get_status()
             return format_connection_status(status)
         except KeyError:
             return "○ No active futures WebSocket connection"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def subscribe_futures_channels(channels: List[str]) -> str:
         """
         Add subscriptions to active futures stream.
@@ -178,7 +201,7 @@ Stream is now active. Use get_futures_stream_status() to check buffer state."""
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("futures")
+            conn = get_connection_manager().get_connection("futures")
             await conn.subscribe(channels)
 
             status = conn.get_status()
@@ -190,7 +213,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to subscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def unsubscribe_futures_channels(channels: List[str]) -> str:
         """
         Remove subscriptions from active futures stream.
@@ -204,7 +230,7 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("futures")
+            conn = get_connection_manager().get_connection("futures")
             await conn.unsubscribe(channels)
 
             status = conn.get_status()
@@ -216,7 +242,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to unsubscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_futures_subscriptions() -> str:
         """
         List all active subscriptions for futures stream.
@@ -225,27 +254,19 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             List of subscribed channels grouped by type
         """
         try:
-            conn = connection_manager.get_connection("futures")
+            conn = get_connection_manager().get_connection("futures")
             status = conn.get_status()
 
             if not status["subscriptions"]:
                 return "No active subscriptions"
 
-            channels_by_type = {}
+            channels_by_type = defaultdict(list)
             for channel in status["subscriptions"]:
-                prefix = channel.split(".")[0]
-                if prefix not in channels_by_type:
-                    channels_by_type[prefix] = []
-                channels_by_type[prefix].append(channel)
+                channels_by_type[channel.partition(".")[0]].append(channel)
 
             output = f"Futures Stream Subscriptions ({status['subscription_count']} total):\n\n"
             for prefix, channels in sorted(channels_by_type.items()):
-                channel_name = {
-                    "T": "Trades (T.*)",
-                    "Q": "Quotes (Q.*)",
-                    "AM": "Minute Aggregates (AM.*)",
-                    "AS": "Second Aggregates (AS.*)",
-                }.get(prefix, prefix)
+                channel_name = _CHANNEL_NAMES.get(prefix, prefix)
 
                 output += f"{channel_name} ({len(channels)}):\n"
                 output += "  " + ", ".join(channels[:20])
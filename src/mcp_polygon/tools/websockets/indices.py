@@ -16,22 +16,35 @@ Documentation References:
 """
 
 import os
-from typing import List, Optional
+from typing import Callable, List, Optional
 from mcp.types import ToolAnnotations
+from .. import STRUCTURED_OUTPUT
 from .connection_manager import ConnectionManager
-from .stream_formatter import format_connection_status
+from .stream_formatter import format_connection_status, format_stream_message
 
+# Display names for subscription channel prefixes
+_CHANNEL_NAMES = {
+    "V.I:": "Index Values",
+    "AM.I:": "Minute Aggregates",
+    "AS.I:": "Second Aggregates",
+}
 
-def register_tools(mcp, connection_manager: ConnectionManager):
+
+def register_tools(mcp, get_connection_manager: Callable[[], ConnectionManager]):
     """
     Register WebSocket streaming tools for indices market.
 
     Args:
         mcp: FastMCP instance
-        connection_manager: Global ConnectionManager instance
+        get_connection_manager: Returns the global ConnectionManager; called
+            on each tool call so the manager is only created once a stream
+            tool is used
     """
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def start_indices_stream(
         channels: Optional[List[str]] = None,
         api_key: Optional[str] = None,
@@ -103,7 +116,7 @@ def register_tools(mcp, connection_manager: ConnectionManager):
                 endpoint = "wss://socket.polygon.io/indices"
 
             # Get or create connection
-            conn = connection_manager.get_connection(
+            conn = get_connection_manager().get_connection(
                 "indices",
                 endpoint=endpoint,
                 api_key=api_key or os.getenv("POLYGON_API_KEY"),
@@ -120,7 +133,6 @@ def register_tools(mcp, connection_manager: ConnectionManager):
             recent = conn.get_recent_messages(limit=5)
 
             # Format sample messages
-            from .stream_formatter import format_stream_message
             formatted_samples = []
             for msg in recent:
                 try:
@@ -148,7 +160,10 @@ Stream is now active. Use get_indices_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to start indices stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def stop_indices_stream() -> str:
         """
         Stop indices market data stream.
@@ -159,7 +174,7 @@ Stream is now active. Use get_indices_stream_status() to check buffer state."""
             Status message indicating stream stopped
         """
         try:
-            conn = connection_manager.get_connection("indices")
+            conn = get_connection_manager().get_connection("indices")
             await conn.close()
             return "✓ Stopped indices WebSocket stream"
         except KeyError:
@@ -167,7 +182,10 @@ Stream is now active. Use get_indices_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to stop indices stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_indices_stream_status() -> str:
         """
         Get current status of indices WebSocket connection.
@@ -178,13 +196,16 @@ Stream is now active. Use get_indices_stream_status() to check buffer state."""
             Connection status including state, subscriptions, and channel count
         """
         try:
-            conn = connection_manager.get_connection("indices")
+            conn = get_connection_manager().get_connection("indices")
             status = conn.get_status()
             return format_connection_status(status)
         except KeyError:
             return "○ No active indices WebSocket connection"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def subscribe_indices_channels(channels: List[str]) -> str:
         """
         Add subscriptions to active indices stream.
@@ -205,7 +226,7 @@ Stream is now active. Use get_indices_stream_status() to check buffer state."""
             >>> await subscribe_indices_channels(["AM.I:SPX", "AM.I:DJI"])
         """
         try:
-            conn = connection_manager.get_connection("indices")
+            conn = get_connection_manager().get_connection("indices")
             await conn.subscribe(channels)
 
             status = conn.get_status()
@@ -217,7 +238,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to subscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def unsubscribe_indices_channels(channels: List[str]) -> str:
         """
         Remove subscriptions from active indices stream.
@@ -231,7 +255,7 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("indices")
+            conn = get_connection_manager().get_connection("indices")
             await conn.unsubscribe(channels)
 
             status = conn.get_status()
@@ -243,7 +267,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to unsubscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_indices_subscriptions() -> str:
         """
         List all active subscriptions for indices stream.
@@ -260,42 +287,28 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             # Minute Aggregates (1): AM.I:SPX
         """
         try:
-            conn = connection_manager.get_connection("indices")
+            conn = get_connection_manager().get_connection("indices")
             status = conn.get_status()
 
             if not status["subscriptions"]:
                 return "No active subscriptions"
 
-            # Group channels by type
-            channel_groups = {
-                "V.I:": [],  # Index values
-                "AM.I:": [],  # Minute aggregates
-                "AS.I:": [],  # Second aggregates
-            }
+            # Group channels by type, in _CHANNEL_NAMES order
+            channel_groups = {prefix: [] for prefix in _CHANNEL_NAMES}
 
             for channel in status["subscriptions"]:
-                # Match channel prefix patterns
-                if channel.startswith("V.I:"):
-                    channel_groups["V.I:"].append(channel)
-                elif channel.startswith("AM.I:"):
-                    channel_groups["AM.I:"].append(channel)
-                elif channel.startswith("AS.I:"):
-                    channel_groups["AS.I:"].append(channel)
+                # Prefix runs up to and including the first ":" (e.g. "AM.I:")
+                group = channel_groups.get(channel[: channel.find(":") + 1])
+                if group is not None:
+                    group.append(channel)
 
             output = f"Indices Stream Subscriptions ({status['subscription_count']} total):\n\n"
 
-            # Map prefixes to readable names
-            channel_names = {
-                "V.I:": "Index Values",
-                "AM.I:": "Minute Aggregates",
-                "AS.I:": "Second Aggregates",
-            }
-
             for prefix, channels in channel_groups.items():
                 if not channels:
                     continue
 
-                channel_name = channel_names[prefix]
+                channel_name = _CHANNEL_NAMES[prefix]
                 output += f"{channel_name} ({len(channels)}):\n"
                 output += "  " + ", ".join(channels[:20])
                 if len(channels) > 20:
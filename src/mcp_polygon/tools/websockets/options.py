@@ -8,22 +8,38 @@ Documentation References:
 """
 
 import os
-from typing import List, Optional
+from collections import defaultdict
+from typing import Callable, List, Optional
 from mcp.types import ToolAnnotations
+from .. import STRUCTURED_OUTPUT
 from .connection_manager import ConnectionManager
-from .stream_formatter import format_connection_status
+from .stream_formatter import format_connection_status, format_stream_message
 
+# Display names for subscription channel prefixes
+_CHANNEL_NAMES = {
+    "T": "Trades (T.O:*)",
+    "Q": "Quotes (Q.O:*)",
+    "AM": "Minute Aggregates (AM.O:*)",
+    "AS": "Second Aggregates (AS.O:*)",
+    "FMV": "Fair Market Value (FMV.O:*)",
+}
 
-def register_tools(mcp, connection_manager: ConnectionManager):
+
+def register_tools(mcp, get_connection_manager: Callable[[], ConnectionManager]):
     """
     Register WebSocket streaming tools for options market.
 
     Args:
         mcp: FastMCP instance
-        connection_manager: Global ConnectionManager instance
+        get_connection_manager: Returns the global ConnectionManager; called
+            on each tool call so the manager is only created once a stream
+            tool is used
     """
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def start_options_stream(
         channels: List[str],
         api_key: Optional[str] = None,
@@ -83,7 +99,7 @@ def register_tools(mcp, connection_manager: ConnectionManager):
         """
         try:
             # Get or create connection
-            conn = connection_manager.get_connection(
+            conn = get_connection_manager().get_connection(
                 "options",
                 endpoint=endpoint,
                 api_key=api_key or os.getenv("POLYGON_API_KEY"),
@@ -100,7 +116,6 @@ def register_tools(mcp, connection_manager: ConnectionManager):
             recent = conn.get_recent_messages(limit=5)
 
             # Format sample messages
-            from .stream_formatter import format_stream_message
             formatted_samples = []
             for msg in recent:
                 try:
@@ -128,7 +143,10 @@ Stream is now active. Use get_options_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to start options stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def stop_options_stream() -> str:
         """
         Stop options market data stream.
@@ -139,7 +157,7 @@ Stream is now active. Use get_options_stream_status() to check buffer state."""
             Status message indicating stream stopped
         """
         try:
-            conn = connection_manager.get_connection("options")
+            conn = get_connection_manager().get_connection("options")
             await conn.close()
             return "✓ Stopped options WebSocket stream"
         except KeyError:
@@ -147,7 +165,10 @@ Stream is now active. Use get_options_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to stop options stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_options_stream_status() -> str:
         """
         Get current status of options WebSocket connection.
@@ -158,13 +179,16 @@ Stream is now active. Use get_options_stream_status() to check buffer state."""
             Connection status including state, subscriptions, and channel count
         """
         try:
-            conn = connection_manager.get_connection("options")
+            conn = get_connection_manager().get_connection("options")
             status = conn.get_status()
             return format_connection_status(status)
         except KeyError:
             return "○ No active options WebSocket connection"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def subscribe_options_channels(channels: List[str]) -> str:
         """
         Add subscriptions to active options stream.
@@ -179,7 +203,7 @@ Stream is now active. Use get_options_stream_status() to check buffer state."""
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("options")
+            conn = get_connection_manager().get_connection("options")
             await conn.subscribe(channels)
 
             status = conn.get_status()
@@ -191,7 +215,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to subscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def unsubscribe_options_channels(channels: List[str]) -> str:
         """
         Remove subscriptions from active options stream.
@@ -205,7 +232,7 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("options")
+            conn = get_connection_manager().get_connection("options")
             await conn.unsubscribe(channels)
 
             status = conn.get_status()
@@ -217,7 +244,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to unsubscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_options_subscriptions() -> str:
         """
         List all active subscriptions for options stream.
@@ -226,28 +256,19 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             List of subscribed channels grouped by type
         """
         try:
-            conn = connection_manager.get_connection("options")
+            conn = get_connection_manager().get_connection("options")
             status = conn.get_status()
 
             if not status["subscriptions"]:
                 return "No active subscriptions"
 
-            channels_by_type = {}
+            channels_by_type = defaultdict(list)
             for channel in status["subscriptions"]:
-                prefix = channel.split(".")[0]
-                if prefix not in channels_by_type:
-                    channels_by_type[prefix] = []
-                channels_by_type[prefix].append(channel)
+                channels_by_type[channel.partition(".")[0]].append(channel)
 
             output = f"Options Stream Subscriptions ({status['subscription_count']} total):\n\n"
             for prefix, channels in sorted(channels_by_type.items()):
-                channel_name = {
-                    "T": "Trades (T.O:*)",
-                    "Q": "Quotes (Q.O:*)",
-                    "AM": "Minute Aggregates (AM.O:*)",
-                    "AS": "Second Aggregates (AS.O:*)",
-                    "FMV": "Fair Market Value (FMV.O:*)",
-                }.get(prefix, prefix)
+                channel_name = _CHANNEL_NAMES.get(prefix, prefix)
 
                 output += f"{channel_name} ({len(channels)}):\n"
                 output += "  " + ", ".join(channels[:20])
@@ -8,22 +8,39 @@ Documentation References:
 """
 
 import os
-from typing import List, Optional
+from collections import defaultdict
+from typing import Callable, List, Optional
 from mcp.types import ToolAnnotations
+from .. import STRUCTURED_OUTPUT
 from .connection_manager import ConnectionManager
-from .stream_formatter import format_connection_status
+from .stream_formatter import format_connection_status, format_stream_message
 
+# Display names for subscription channel prefixes
+_CHANNEL_NAMES = {
+    "T": "Trades",
+    "Q": "Quotes",
+    "AM": "Minute Aggregates",
+    "A": "Second Aggregates",
+    "LULD": "Limit Up/Limit Down",
+    "FMV": "Fair Market Value",
+}
 
-def register_tools(mcp, connection_manager: ConnectionManager):
+
+def register_tools(mcp, get_connection_manager: Callable[[], ConnectionManager]):
     """
     Register WebSocket streaming tools for stocks market.
 
     Args:
         mcp: FastMCP instance
-        connection_manager: Global ConnectionManager instance
+        get_connection_manager: Returns the global ConnectionManager; called
+            on each tool call so the manager is only created once a stream
+            tool is used
     """
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def start_stocks_stream(
         channels: List[str],
         api_key: Optional[str] = None,
@@ -88,7 +105,7 @@ def register_tools(mcp, connection_manager: ConnectionManager):
         """
         try:
             # Get or create connection
-            conn = connection_manager.get_connection(
+            conn = get_connection_manager().get_connection(
                 "stocks",
                 endpoint=endpoint,
                 api_key=api_key or os.getenv("POLYGON_API_KEY"),
@@ -105,7 +122,6 @@ def register_tools(mcp, connection_manager: ConnectionManager):
             recent = conn.get_recent_messages(limit=5)
 
             # Format sample messages
-            from .stream_formatter import format_stream_message
             formatted_samples = []
             for msg in recent:
                 try:
@@ -133,7 +149,10 @@ Stream is now active. Use get_stocks_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to start stocks stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def stop_stocks_stream() -> str:
         """
         Stop stock market data stream.
@@ -144,7 +163,7 @@ Stream is now active. Use get_stocks_stream_status() to check buffer state."""
             Status message indicating stream stopped
         """
         try:
-            conn = connection_manager.get_connection("stocks")
+            conn = get_connection_manager().get_connection("stocks")
             await conn.close()
             return "✓ Stopped stocks WebSocket stream"
         except KeyError:
@@ -152,7 +171,10 @@ Stream is now active. Use get_stocks_stream_status() to check buffer state."""
         except Exception as e:
             return f"✗ Failed to stop stocks stream: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def get_stocks_stream_status() -> str:
         """
         Get current status of stocks WebSocket connection.
@@ -163,13 +185,16 @@ Stream is now active. Use get_stocks_stream_status() to check buffer state."""
             Connection status including state, subscriptions, and channel count
         """
         try:
-            conn = connection_manager.get_connection("stocks")
+            conn = get_connection_manager().get_connection("stocks")
             status = conn.get_status()
             return format_connection_status(status)
         except KeyError:
             return "○ No active stocks WebSocket connection"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def subscribe_stocks_channels(channels: List[str]) -> str:
         """
         Add subscriptions to active stocks stream.
@@ -183,7 +208,7 @@ Stream is now active. Use get_stocks_stream_status() to check buffer state."""
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("stocks")
+            conn = get_connection_manager().get_connection("stocks")
             await conn.subscribe(channels)
 
             status = conn.get_status()
@@ -195,7 +220,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to subscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=False),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def unsubscribe_stocks_channels(channels: List[str]) -> str:
         """
         Remove subscriptions from active stocks stream.
@@ -209,7 +237,7 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             Confirmation message with updated subscription list
         """
         try:
-            conn = connection_manager.get_connection("stocks")
+            conn = get_connection_manager().get_connection("stocks")
             await conn.unsubscribe(channels)
 
             status = conn.get_status()
@@ -221,7 +249,10 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
         except Exception as e:
             return f"✗ Failed to unsubscribe: {str(e)}"
 
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    @mcp.tool(
+        annotations=ToolAnnotations(readOnlyHint=True),
+        structured_output=STRUCTURED_OUTPUT,
+    )
     async def list_stocks_subscriptions() -> str:
         """
         List all active subscriptions for stocks stream.
@@ -230,29 +261,19 @@ Channels: {", ".join(status["subscriptions"][:10])}{"..." if len(status["subscri
             List of subscribed channels
         """
         try:
-            conn = connection_manager.get_connection("stocks")
+            conn = get_connection_manager().get_connection("stocks")
             status = conn.get_status()
 
             if not status["subscriptions"]:
                 return "No active subscriptions"
 
-            channels_by_type = {}
+            channels_by_type = defaultdict(list)
             for channel in status["subscriptions"]:
-                prefix = channel.split(".")[0]
-                if prefix not in channels_by_type:
-                    channels_by_type[prefix] = []
-                channels_by_type[prefix].append(channel)
+                channels_by_type[channel.partition(".")[0]].append(channel)
 
             output = f"Stocks Stream Subscriptions ({status['subscription_count']} total):\n\n"
             for prefix, channels in sorted(channels_by_type.items()):
-                channel_name = {
-                    "T": "Trades",
-                    "Q": "Quotes",
-                    "AM": "Minute Aggregates",
-                    "A": "Second Aggregates",
-                    "LULD": "Limit Up/Limit Down",
-                    "FMV": "Fair Market Value",
-                }.get(prefix, prefix)
+                channel_name = _CHANNEL_NAMES.get(prefix, prefix)
 
                 output += f"{channel_name} ({len(channels)}):\n"
                 output += "  " + ", ".join(channels[:20])
@@ -6,9 +6,15 @@ Documentation References:
 - Field Reference: polygon-docs/websockets/INDEX_AGENT.md:382-475
 """
 
-import json
 from datetime import datetime
 
+import orjson
+
+
+def _dumps(data: dict, pretty: bool) -> str:
+    """Serialize a formatted message, indented by two spaces when pretty."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+
 
 def format_stream_message(message: dict, pretty: bool = True) -> str:
     """
@@ -49,7 +55,7 @@ def format_stream_message(message: dict, pretty: bool = True) -> str:
         return _format_fmv(message, pretty)
     else:
         # Generic formatting for unknown types
-        return json.dumps(message, indent=2 if pretty else None)
+        return _dumps(message, pretty)
 
 
 def _format_trade(trade: dict, pretty: bool) -> str:
@@ -73,7 +79,7 @@ def _format_trade(trade: dict, pretty: bool) -> str:
         "full_data": trade,
     }
 
-    return json.dumps(summary, indent=2 if pretty else None)
+    return _dumps(summary, pretty)
 
 
 def _format_quote(quote: dict, pretty: bool) -> str:
@@ -104,7 +110,7 @@ def _format_quote(quote: dict, pretty: bool) -> str:
         "full_data": quote,
     }
 
-    return json.dumps(summary, indent=2 if pretty else None)
+    return _dumps(summary, pretty)
 
 
 def _format_aggregate(agg: dict, timeframe: str, pretty: bool) -> str:
@@ -130,7 +136,7 @@ def _format_aggregate(agg: dict, timeframe: str, pretty: bool) -> str:
         "full_data": agg,
     }
 
-    return json.dumps(summary, indent=2 if pretty else None)
+    return _dumps(summary, pretty)
 
 
 def _format_index_value(value: dict, pretty: bool) -> str:
@@ -147,7 +153,7 @@ def _format_index_value(value: dict, pretty: bool) -> str:
         "full_data": value,
     }
 
-    return json.dumps(summary, indent=2 if pretty else None)
+    return _dumps(summary, pretty)
 
 
 def _format_luld(luld: dict, pretty: bool) -> str:
@@ -165,7 +171,7 @@ def _format_luld(luld: dict, pretty: bool) -> str:
         "full_data": luld,
     }
 
-    return json.dumps(summary, indent=2 if pretty else None)
+    return _dumps(summary, pretty)
 
 
 def _format_fmv(fmv: dict, pretty: bool) -> str:
@@ -182,7 +188,7 @@ def _format_fmv(fmv: dict, pretty: bool) -> str:
         "full_data": fmv,
     }
 
-    return json.dumps(summary, indent=2 if pretty else None)
+    return _dumps(summary, pretty)
 
 
 def format_status_message(status: dict) -> str:
@@ -1,6 +1,7 @@
 """Shared validation functions for REST API tools."""
 
-from typing import Optional, Union
+import re
+from typing import List, Optional, Union
 from datetime import datetime, date, timedelta, timezone
 
 
@@ -104,3 +105,59 @@ def validate_date_any_of(date_any_of: Optional[str]) -> Optional[str]:
             return error
 
     return None
+
+
+# Upper bound on tickers per multi-ticker request, matching batch_execute
+MAX_TICKERS = 50
+
+
+def validate_tickers(tickers: Optional[List[str]]) -> Optional[str]:
+    """
+    Validate a multi-ticker list. Returns error message if invalid.
+
+    Args:
+        tickers: Ticker symbols for a fan-out request
+
+    Returns:
+        Error message string if validation fails, None if valid
+    """
+    if not tickers:
+        return "Error: 'tickers' must contain at least one ticker."
+    if len(tickers) > MAX_TICKERS:
+        return f"Error: At most {MAX_TICKERS} tickers may be requested at once."
+    return None
+
+
+# OCC option symbol with Polygon's O: prefix: root (1-6 chars, may include a
+# digit for adjusted contracts), expiration YYMMDD, C/P, strike price * 1000
+_OPTION_TICKER = re.compile(r"O:[A-Z][A-Z0-9]{0,5}\d{6}[CP]\d{8}")
+
+
+def validate_option_ticker(*tickers: str) -> Optional[str]:
+    """
+    Validate options ticker format. Returns error message if invalid.
+
+    Malformed tickers are rejected locally instead of spending a request
+    (and rate-limit budget) on a guaranteed 404.
+
+    Args:
+        *tickers: Options tickers to check
+
+    Returns:
+        Error message string if validation fails, None if valid
+
+    Examples:
+        >>> validate_option_ticker("O:SPY251219C00650000")
+        None
+
+        >>> validate_option_ticker("SPY251219C650")
+        "Error: Invalid options ticker(s): SPY251219C650. Expected format ..."
+    """
+    invalid = [t for t in tickers if not _OPTION_TICKER.fullmatch(t)]
+    if invalid:
+        return (
+            f"Error: Invalid options ticker(s): {', '.join(invalid)}. "
+            "Expected format O:SPY251219C00650000 (O: prefix + underlying + "
+            "expiration YYMMDD + C/P + strike price * 1000)."
+        )
+    return None
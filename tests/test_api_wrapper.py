@@ -48,6 +48,19 @@ class TestPolygonAPIError:
         assert "not found" in result
         assert "INVALID" in result
 
+    def test_format_context_rendering(self):
+        """Test that context renders as '(k=v, ...)' for one or many keys."""
+        error = Mock()
+        error.response = Mock(status_code=404)
+
+        single = PolygonAPIError.format_error("get_aggs", error, {"method": "get_aggs"})
+        multi = PolygonAPIError.format_error(
+            "get_aggs", error, {"method": "get_aggs", "ticker": "AAPL"}
+        )
+
+        assert "not found (method=get_aggs)." in single
+        assert "not found (method=get_aggs, ticker=AAPL)." in multi
+
     def test_format_429_error(self):
         """Test formatting of 429 Rate Limit error."""
         error = Mock()
@@ -89,6 +102,27 @@ class TestPolygonAPIError:
         assert "connect" in result.lower()
         assert "internet" in result.lower()
 
+    def test_format_urllib3_timeout_error(self):
+        """Test that urllib3 read timeouts are classified by type."""
+        from urllib3.exceptions import ReadTimeoutError
+
+        error = ReadTimeoutError(None, "/v2/aggs", "Read timed out.")
+
+        result = PolygonAPIError.format_error("get_aggs", error)
+
+        assert "timed out" in result.lower()
+
+    def test_format_urllib3_max_retry_connection_error(self):
+        """Test that MaxRetryError is classified by its underlying reason."""
+        from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+        reason = NewConnectionError(None, "Failed to establish a new connection")
+        error = MaxRetryError(None, "/v2/aggs", reason)
+
+        result = PolygonAPIError.format_error("get_aggs", error)
+
+        assert "could not connect" in result.lower()
+
     def test_format_generic_error(self):
         """Test formatting of generic unexpected error."""
         error = Exception("Something unexpected")
@@ -151,6 +185,78 @@ class TestPolygonAPIWrapper:
         assert len(result) > 0
         api_wrapper.client.vx.list_stock_financials.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_formatter_receives_raw_bytes(self, mock_polygon_client, mock_response):
+        """Test that binary responses reach the formatter without decoding."""
+        from mcp_polygon.api_wrapper import PolygonAPIWrapper
+
+        formatter = Mock(return_value="ok")
+        response = mock_response({"results": []})
+        mock_polygon_client.get_aggs.return_value = response
+        wrapper = PolygonAPIWrapper(mock_polygon_client, formatter)
+
+        assert await wrapper.call("get_aggs", ticker="AAPL") == "ok"
+        formatter.assert_called_once_with(response.data)
+
+    @pytest.mark.asyncio
+    async def test_object_response_passed_as_plain_data(self, mock_polygon_client):
+        """Test that SDK object responses reach the formatter as plain dicts."""
+        from types import SimpleNamespace
+        from mcp_polygon.api_wrapper import PolygonAPIWrapper
+
+        values = [SimpleNamespace(timestamp=1, value=150.5)]
+        response = SimpleNamespace(values=values, underlying=None)
+        mock_polygon_client.get_sma.return_value = response
+        formatter = Mock(return_value="ok")
+        wrapper = PolygonAPIWrapper(mock_polygon_client, formatter)
+
+        await wrapper.call("get_sma", ticker="AAPL")
+
+        formatter.assert_called_once_with(
+            {"values": [{"timestamp": 1, "value": 150.5}], "underlying": None}
+        )
+
+    @pytest.mark.asyncio
+    async def test_blocking_calls_run_concurrently(self, api_wrapper, mock_response):
+        """Test that synchronous SDK calls do not block the event loop."""
+        import asyncio
+        import time
+
+        def slow_call(**kwargs):
+            time.sleep(0.2)
+            return mock_response({"results": [{"ticker": kwargs["ticker"]}]})
+
+        api_wrapper.client.get_aggs.side_effect = slow_call
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            api_wrapper.call("get_aggs", ticker="AAPL"),
+            api_wrapper.call("get_aggs", ticker="MSFT"),
+            api_wrapper.call("get_aggs", ticker="GOOG"),
+        )
+        elapsed = time.perf_counter() - start
+
+        assert ["AAPL" in results[0], "MSFT" in results[1]] == [True, True]
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_method_resolution_cached(self, api_wrapper, mock_response):
+        """Test that bound methods are cached and reset when the client changes."""
+        data = {"results": [{"ticker": "AAPL"}]}
+        api_wrapper.client.get_aggs.return_value = mock_response(data)
+
+        await api_wrapper.call("get_aggs", ticker="AAPL")
+        await api_wrapper.call("get_aggs", ticker="MSFT")
+        assert api_wrapper.client.get_aggs.call_count == 2
+        assert "get_aggs" in api_wrapper._method_cache
+
+        new_client = Mock()
+        new_client.get_aggs.return_value = mock_response(data)
+        api_wrapper.client = new_client
+        await api_wrapper.call("get_aggs", ticker="AAPL")
+
+        new_client.get_aggs.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_method_not_found(self, api_wrapper):
         """Test handling of non-existent API method."""
@@ -185,6 +291,19 @@ class TestPolygonAPIWrapper:
         assert "Error" in result
         assert "not found" in result
 
+    @pytest.mark.asyncio
+    async def test_context_skipped_for_context_free_status(self, api_wrapper):
+        """Test that 401/403/429/5xx errors do not extract call context."""
+        from unittest.mock import patch
+
+        api_wrapper.client.get_aggs.side_effect = make_http_error(429)
+
+        with patch("mcp_polygon.api_wrapper._error_context") as mock_context:
+            result = await api_wrapper.call("get_aggs", ticker="AAPL")
+
+        assert "Rate limit" in result
+        mock_context.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_http_429_error(self, api_wrapper):
         """Test handling of 429 rate limit error."""
@@ -457,3 +576,359 @@ class TestPolygonAPIWrapper:
         assert call_kwargs["limit"] == 100  # Not nested in params dict
         assert isinstance(result, str)
         assert len(result) > 0
+
+
+class TestErrorLogRateLimit:
+    """Tests for per-method error log suppression."""
+
+    def test_repeat_errors_logged_once_per_interval(self, monkeypatch):
+        """Test that repeated identical failures of one method are logged once."""
+        from collections import OrderedDict
+        from mcp_polygon import api_wrapper
+
+        monkeypatch.setattr(api_wrapper, "_last_error_logged", OrderedDict())
+
+        assert api_wrapper._should_log_error("get_aggs", ValueError()) is True
+        assert api_wrapper._should_log_error("get_aggs", ValueError()) is False
+        assert api_wrapper._should_log_error("list_trades", ValueError()) is True
+
+        monkeypatch.setattr(api_wrapper, "_ERROR_LOG_INTERVAL", 0)
+        assert api_wrapper._should_log_error("get_aggs", ValueError()) is True
+
+    def test_different_failure_of_same_method_logged(self, monkeypatch):
+        """Test that a new exception type is logged despite a recent failure."""
+        from collections import OrderedDict
+        from mcp_polygon import api_wrapper
+
+        monkeypatch.setattr(api_wrapper, "_last_error_logged", OrderedDict())
+
+        assert api_wrapper._should_log_error("get_aggs", TimeoutError()) is True
+        assert api_wrapper._should_log_error("get_aggs", KeyError("x")) is True
+        assert api_wrapper._should_log_error("get_aggs", TimeoutError()) is False
+
+    def test_tracked_methods_bounded(self, monkeypatch):
+        """Test that the suppression table evicts the oldest entries."""
+        from collections import OrderedDict
+        from mcp_polygon import api_wrapper
+
+        monkeypatch.setattr(api_wrapper, "_last_error_logged", OrderedDict())
+        monkeypatch.setattr(api_wrapper, "_ERROR_LOG_MAX_METHODS", 2)
+
+        for name in ("a", "b", "c"):
+            api_wrapper._should_log_error(name, ValueError())
+
+        assert list(api_wrapper._last_error_logged) == [
+            ("b", ValueError),
+            ("c", ValueError),
+        ]
+
+
+class TestResponseCache:
+    """Tests for the per-wrapper response cache."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_served_from_cache(self, api_wrapper, mock_response):
+        """Test that a repeated call with the same parameters skips the API."""
+        api_wrapper.client.list_treasury_yields.return_value = mock_response(
+            {"results": [{"date": "2024-01-02", "yield_10_year": 3.95}]}
+        )
+
+        first = await api_wrapper.call("list_treasury_yields", date="2024-01-02")
+        second = await api_wrapper.call("list_treasury_yields", date="2024-01-02")
+
+        assert first == second
+        api_wrapper.client.list_treasury_yields.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_params_only_method_served_from_cache(
+        self, api_wrapper, mock_response
+    ):
+        """Test that options chain results are cached under the call's key."""
+        api_wrapper.client.list_snapshot_options_chain.return_value = mock_response(
+            {"results": [{"details": {"ticker": "O:SPY251219C00650000"}}]}
+        )
+
+        first = await api_wrapper.call(
+            "list_snapshot_options_chain", underlying_asset="SPY", limit=10
+        )
+        second = await api_wrapper.call(
+            "list_snapshot_options_chain", underlying_asset="SPY", limit=10
+        )
+
+        assert first == second
+        api_wrapper.client.list_snapshot_options_chain.assert_called_once()
+        assert "params" not in api_wrapper._cache._entries
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_not_shared(self, api_wrapper, mock_response):
+        """Test that calls with different parameters are cached separately."""
+        api_wrapper.client.get_aggs.return_value = mock_response({"results": []})
+
+        await api_wrapper.call("get_aggs", ticker="AAPL", limit=10)
+        await api_wrapper.call("get_aggs", ticker="AAPL", limit=20)
+
+        assert api_wrapper.client.get_aggs.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_bypasses_cache(self, api_wrapper, mock_response):
+        """Test that force_refresh fetches fresh data and updates the cache."""
+        api_wrapper.client.get_aggs.return_value = mock_response({"results": []})
+
+        await api_wrapper.call("get_aggs", ticker="AAPL")
+        await api_wrapper.call("get_aggs", ticker="AAPL", force_refresh=True)
+
+        assert api_wrapper.client.get_aggs.call_count == 2
+        assert "force_refresh" not in api_wrapper.client.get_aggs.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_real_time_endpoints_not_cached(self, api_wrapper, mock_response):
+        """Test that last-trade and snapshot endpoints always hit the API."""
+        api_wrapper.client.get_last_trade.return_value = mock_response(
+            {"results": {"p": 150.0}}
+        )
+
+        await api_wrapper.call("get_last_trade", ticker="AAPL")
+        await api_wrapper.call("get_last_trade", ticker="AAPL")
+
+        assert api_wrapper.client.get_last_trade.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, api_wrapper, mock_response):
+        """Test that a failed call is retried rather than served from cache."""
+        api_wrapper.client.get_aggs.side_effect = [
+            Exception("connection refused"),
+            mock_response({"results": [{"c": 1}]}),
+        ]
+
+        first = await api_wrapper.call("get_aggs", ticker="AAPL")
+        second = await api_wrapper.call("get_aggs", ticker="AAPL")
+
+        assert "Error" in first
+        assert second == "c\n1\n"
+
+    def test_expiry_and_lru_eviction(self, monkeypatch):
+        """Test that entries expire after their TTL and the cache stays bounded."""
+        from mcp_polygon.api_wrapper import _ResponseCache
+
+        now = [1000.0]
+        monkeypatch.setattr("mcp_polygon.api_wrapper.time.monotonic", lambda: now[0])
+        cache = _ResponseCache(max_entries=2)
+
+        cache.set("a", "A", ttl=10)
+        cache.set("b", "B", ttl=10)
+        assert cache.get("a") == "A"
+        cache.set("c", "C", ttl=10)  # evicts "b", the least recently used
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        now[0] += 10
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_snapshots_cached_briefly(self, api_wrapper, mock_response):
+        """Test that repeated snapshot reads within seconds share one request."""
+        from mcp_polygon.api_wrapper import SNAPSHOT_CACHE_TTL, _cache_ttl
+
+        api_wrapper.client.get_snapshot_option.return_value = mock_response(
+            {"results": {"day": {"c": 1.5}}}
+        )
+
+        await api_wrapper.call("get_snapshot_option", underlying_asset="SPY")
+        await api_wrapper.call("get_snapshot_option", underlying_asset="SPY")
+
+        api_wrapper.client.get_snapshot_option.assert_called_once()
+        assert _cache_ttl("get_snapshot_option", {}) == SNAPSHOT_CACHE_TTL < 10
+
+    def test_completed_ranges_cached_longer(self):
+        """Test that indicators and aggregates ending before today get a long TTL."""
+        from datetime import date, datetime, timedelta, timezone
+
+        from mcp_polygon.api_wrapper import (
+            CACHE_DEFAULT_TTL,
+            CACHE_HISTORICAL_TTL,
+            _cache_ttl,
+        )
+
+        today = datetime.now(timezone.utc).date()
+        past = "2024-01-02"
+
+        assert _cache_ttl("get_sma", {"timestamp": past}) == CACHE_HISTORICAL_TTL
+        assert (
+            _cache_ttl("get_macd", {"params": {"timestamp.lt": date(2024, 1, 2)}})
+            == CACHE_HISTORICAL_TTL
+        )
+        assert _cache_ttl("get_aggs", {"to": 1704153600000}) == CACHE_HISTORICAL_TTL
+        assert _cache_ttl("get_sma", {"timestamp": None}) == CACHE_DEFAULT_TTL
+        assert _cache_ttl("get_aggs", {"to": today.isoformat()}) == CACHE_DEFAULT_TTL
+        tomorrow = today + timedelta(days=1)
+        assert _cache_ttl("get_rsi", {"timestamp": tomorrow}) == CACHE_DEFAULT_TTL
+
+
+class TestSingleFlight:
+    """Tests for coalescing of identical in-flight requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_request(
+        self, api_wrapper, mock_response
+    ):
+        """Test that identical concurrent calls issue a single API request."""
+        import asyncio
+        import time
+
+        def slow_call(**kwargs):
+            time.sleep(0.1)
+            return mock_response({"results": [{"price": 65000.0}]})
+
+        api_wrapper.client.get_last_crypto_trade.side_effect = slow_call
+
+        results = await asyncio.gather(
+            *(
+                api_wrapper.call("get_last_crypto_trade", from_="BTC", to="USD")
+                for _ in range(5)
+            )
+        )
+
+        assert len(set(results)) == 1
+        assert "65000.0" in results[0]
+        api_wrapper.client.get_last_crypto_trade.assert_called_once()
+        assert api_wrapper._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_coalesced(self, api_wrapper, mock_response):
+        """Test that a finished request is not reused for uncached endpoints."""
+        api_wrapper.client.get_last_trade.return_value = mock_response(
+            {"results": {"p": 150.0}}
+        )
+
+        await api_wrapper.call("get_last_trade", ticker="AAPL")
+        await api_wrapper.call("get_last_trade", ticker="AAPL")
+
+        assert api_wrapper.client.get_last_trade.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(
+        self, api_wrapper, mock_response
+    ):
+        """Test that cancelling one waiter leaves the others with a result."""
+        import asyncio
+        import time
+
+        def slow_call(**kwargs):
+            time.sleep(0.1)
+            return mock_response({"results": {"p": 150.0}})
+
+        api_wrapper.client.get_last_trade.side_effect = slow_call
+
+        first = asyncio.ensure_future(api_wrapper.call("get_last_trade", ticker="AAPL"))
+        second = asyncio.ensure_future(
+            api_wrapper.call("get_last_trade", ticker="AAPL")
+        )
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert "150.0" in await second
+        api_wrapper.client.get_last_trade.assert_called_once()
+
+
+class TestRateLimiter:
+    """Tests for the client-side request rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_burst_are_spaced(self):
+        """Test that acquiring past the burst waits for refilled tokens."""
+        import time
+
+        from mcp_polygon.api_wrapper import _RateLimiter
+
+        limiter = _RateLimiter(20)
+        start = time.monotonic()
+        for _ in range(25):
+            await limiter.acquire()
+
+        # 20 immediate tokens, then 5 more at 20 per second
+        assert time.monotonic() - start >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables_limit(self):
+        """Test that a rate of 0 never waits."""
+        import time
+
+        from mcp_polygon.api_wrapper import _RateLimiter
+
+        limiter = _RateLimiter(0)
+        start = time.monotonic()
+        for _ in range(1000):
+            await limiter.acquire()
+
+        assert time.monotonic() - start < 0.1
+
+    @pytest.mark.asyncio
+    async def test_only_network_requests_take_tokens(self, api_wrapper, mock_response):
+        """Test that cache hits do not consume rate limit tokens."""
+        from unittest.mock import AsyncMock
+
+        api_wrapper._limiter.acquire = AsyncMock()
+        api_wrapper.client.list_treasury_yields.return_value = mock_response(
+            {"results": [{"date": "2024-01-02"}]}
+        )
+
+        await api_wrapper.call("list_treasury_yields", date="2024-01-02")
+        await api_wrapper.call("list_treasury_yields", date="2024-01-02")
+
+        api_wrapper._limiter.acquire.assert_awaited_once()
+
+
+class TestCallMany:
+    """Tests for concurrent multi-value calls merged into one table."""
+
+    @pytest.mark.asyncio
+    async def test_merges_records_with_tag_column(self, api_wrapper, mock_response):
+        """Test that each value's records are tagged and formatted together."""
+
+        def get_sma(ticker, **kwargs):
+            value = {"I:SPX": 5000.0, "I:NDX": 18000.0}[ticker]
+            return mock_response(
+                {"results": {"values": [{"timestamp": 1, "value": value}]}}
+            )
+
+        api_wrapper.client.get_sma.side_effect = get_sma
+
+        result = await api_wrapper.call_many(
+            "get_sma", "ticker", ["I:SPX", "I:NDX"], window=50
+        )
+
+        assert result == "ticker,timestamp,value\nI:SPX,1,5000.0\nI:NDX,1,18000.0\n"
+        assert api_wrapper.client.get_sma.call_args.kwargs["window"] == 50
+
+    @pytest.mark.asyncio
+    async def test_failed_values_listed_as_errors(self, api_wrapper, mock_response):
+        """Test that a failing value does not drop the others' results."""
+
+        def get_sma(ticker, **kwargs):
+            if ticker == "I:BAD":
+                raise Exception("404 Not Found")
+            return mock_response({"results": {"values": [{"value": 1.0}]}})
+
+        api_wrapper.client.get_sma.side_effect = get_sma
+
+        result = await api_wrapper.call_many("get_sma", "ticker", ["I:SPX", "I:BAD"])
+
+        table, errors = result.split("\nErrors:\n")
+        assert table == "ticker,value\nI:SPX,1.0\n"
+        assert errors.startswith("I:BAD: Error:")
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently(self, api_wrapper, mock_response):
+        """Test that per-value calls overlap instead of running back to back."""
+        import time
+
+        def slow_sma(ticker, **kwargs):
+            time.sleep(0.1)
+            return mock_response({"results": {"values": [{"value": 1.0}]}})
+
+        api_wrapper.client.get_sma.side_effect = slow_sma
+
+        start = time.perf_counter()
+        await api_wrapper.call_many("get_sma", "ticker", [f"X:T{i}" for i in range(4)])
+
+        assert time.perf_counter() - start < 0.35
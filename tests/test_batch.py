@@ -0,0 +1,159 @@
+"""Tests for the batch_execute tool."""
+
+import asyncio
+import json
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
+
+from mcp_polygon.tools import batch
+
+
+@pytest.fixture
+def mcp_server():
+    """FastMCP instance with simple tools and batch_execute registered."""
+    mcp = FastMCP("test-batch")
+
+    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    async def echo(value: str) -> str:
+        return f"echo:{value}"
+
+    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    async def slow(delay: float) -> str:
+        await asyncio.sleep(delay)
+        return "done"
+
+    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True), structured_output=False)
+    async def plain(value: str) -> str:
+        return f"plain:{value}"
+
+    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    async def not_found(ticker: str) -> str:
+        return f"Error: No data found for {ticker}"
+
+    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=False))
+    async def start_stream() -> str:
+        return "started"
+
+    batch.register_tools(mcp)
+    return mcp
+
+
+async def run_batch(mcp, **arguments):
+    """Call batch_execute and decode its JSON result."""
+    tool = mcp._tool_manager.get_tool("batch_execute")
+    return json.loads(await tool.run(arguments))
+
+
+@pytest.mark.asyncio
+async def test_results_in_call_order(mcp_server):
+    """Test that each sub-call result is returned in request order."""
+    results = await run_batch(
+        mcp_server,
+        calls=[
+            {"name": "echo", "args": {"value": "a"}},
+            {"name": "echo", "args": {"value": "b"}},
+        ],
+    )
+
+    assert results == [
+        {"name": "echo", "ok": True, "result": "echo:a"},
+        {"name": "echo", "ok": True, "result": "echo:b"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_calls_run_concurrently(mcp_server):
+    """Test that sub-calls overlap instead of running back to back."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    results = await run_batch(
+        mcp_server,
+        calls=[{"name": "slow", "args": {"delay": 0.2}} for _ in range(4)],
+    )
+
+    assert all(r["ok"] for r in results)
+    assert loop.time() - start < 0.6
+
+
+@pytest.mark.asyncio
+async def test_rejects_unknown_and_non_read_only_tools(mcp_server):
+    """Test that unknown, side-effecting, and nested batch calls are refused."""
+    results = await run_batch(
+        mcp_server,
+        calls=[
+            {"name": "missing"},
+            {"name": "start_stream"},
+            {"name": "batch_execute", "args": {"calls": []}},
+        ],
+    )
+
+    assert [r["ok"] for r in results] == [False, False, False]
+
+
+@pytest.mark.asyncio
+async def test_sub_call_errors_are_isolated(mcp_server):
+    """Test that a failing or timed-out sub-call does not fail the batch."""
+    results = await run_batch(
+        mcp_server,
+        calls=[
+            {"name": "echo", "args": {}},
+            {"name": "slow", "args": {"delay": 1}},
+            {"name": "echo", "args": {"value": "ok"}},
+        ],
+        timeout_ms=50,
+    )
+
+    assert results[0]["ok"] is False
+    assert results[1] == {"name": "slow", "ok": False, "error": "Timed out after 50ms"}
+    assert results[2]["result"] == "echo:ok"
+
+
+@pytest.mark.asyncio
+async def test_empty_and_oversized_batches(mcp_server):
+    """Test that empty and oversized batches return an error message."""
+    tool = mcp_server._tool_manager.get_tool("batch_execute")
+
+    assert "at least one" in await tool.run({"calls": []})
+    oversized = [{"name": "echo", "args": {"value": "x"}}] * (batch.MAX_BATCH_CALLS + 1)
+    assert "at most" in await tool.run({"calls": oversized})
+
+
+@pytest.mark.asyncio
+async def test_non_positive_timeout_rejected(mcp_server):
+    """Test that a zero or negative timeout returns an error message."""
+    tool = mcp_server._tool_manager.get_tool("batch_execute")
+    calls = [{"name": "echo", "args": {"value": "x"}}]
+
+    for timeout_ms in (0, -1):
+        result = await tool.run({"calls": calls, "timeout_ms": timeout_ms})
+        assert result.startswith("Error: 'timeout_ms'")
+
+
+@pytest.mark.asyncio
+async def test_error_results_reported_as_failures(mcp_server):
+    """Test that a tool's "Error..." reply is returned as ok=false."""
+    results = await run_batch(
+        mcp_server,
+        calls=[
+            {"name": "not_found", "args": {"ticker": "NOPE"}},
+            {"name": "echo", "args": {"value": "a"}},
+        ],
+    )
+
+    assert results == [
+        {"name": "not_found", "ok": False, "error": "Error: No data found for NOPE"},
+        {"name": "echo", "ok": True, "result": "echo:a"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unstructured_tool_results(mcp_server):
+    """Test that tools without an output schema return their text as well."""
+    results = await run_batch(
+        mcp_server, calls=[{"name": "plain", "args": {"value": "a"}}]
+    )
+
+    assert results == [{"name": "plain", "ok": True, "result": "plain:a"}]
@@ -50,6 +50,19 @@ class TestAPITierErrorDetection:
         assert "https://polygon.io/pricing" in result
         assert "method=get_indices_snapshot" in result
 
+    @pytest.mark.asyncio
+    async def test_lowercase_not_authorized_not_a_tier_error(self):
+        """Test that NOT_AUTHORIZED only matches in its exact uppercase form."""
+        client = Mock()
+        client.list_options_contracts = Mock(
+            side_effect=Exception("field not_authorized_by is invalid")
+        )
+        wrapper = PolygonAPIWrapper(client, json_to_csv)
+
+        result = await wrapper.call("list_options_contracts", ticker="AAPL")
+
+        assert "API tier limitation" not in result
+
     @pytest.mark.asyncio
     async def test_api_tier_error_includes_upgrade_link(self):
         """Test that API tier errors include polygon.io upgrade link."""
@@ -529,6 +542,39 @@ class TestStartupDiagnostics:
 
         assert success
 
+    @pytest.mark.asyncio
+    async def test_diagnostics_timeout(self):
+        """Test that a hanging connectivity probe is abandoned after the timeout."""
+        import time
+        from mcp_polygon import server
+
+        with patch.object(server, 'HEALTHCHECK_TIMEOUT', 0.05):
+            with patch.object(
+                server.polygon_client, 'get_aggs', side_effect=lambda *a, **k: time.sleep(0.5)
+            ):
+                with patch('mcp_polygon.server.POLYGON_API_KEY', 'test_key'):
+                    with patch('mcp_polygon.server.logger') as mock_logger:
+                        assert await server.run_startup_diagnostics() is False
+
+                        error_calls = [call[0][0] for call in mock_logger.error.call_args_list]
+                        assert any("timed out" in str(call) for call in error_calls)
+
+    def test_health_cache_roundtrip(self, tmp_path, monkeypatch):
+        """Test that a successful check is cached per API key within the TTL."""
+        from mcp_polygon import server
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        with patch('mcp_polygon.server.POLYGON_API_KEY', 'test_key'):
+            assert server._health_cache_fresh() is False
+            server._write_health_cache()
+            assert server._health_cache_fresh() is True
+
+            with patch.object(server, 'HEALTHCHECK_TTL', 0):
+                assert server._health_cache_fresh() is False
+
+        with patch('mcp_polygon.server.POLYGON_API_KEY', 'other_key'):
+            assert server._health_cache_fresh() is False
+
 
 class TestErrorHandlingIntegration:
     """Integration tests for combined error handling features."""
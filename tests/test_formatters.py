@@ -4,7 +4,7 @@ import io
 
 import pytest
 
-from mcp_polygon.formatters import json_to_csv, _flatten_dict
+from mcp_polygon.formatters import json_to_csv, json_to_onto, _flatten_dict
 
 
 class TestFlattenDict:
@@ -34,6 +34,22 @@ class TestFlattenDict:
         result = _flatten_dict(input_dict)
         assert result == {"items": "[1, 2, 3]", "names": "['alice', 'bob']"}
 
+    def test_list_of_objects_schema_once(self):
+        """Test that lists of objects list their field names only once."""
+        input_dict = {
+            "legs": [
+                {"ticker": "O:A", "ratio": 1, "greeks": {"delta": 0.5}},
+                {"ticker": "O:B", "ratio": 2},
+            ]
+        }
+        result = _flatten_dict(input_dict)
+        assert result == {"legs": "{ticker|ratio|greeks/delta}[O:A|1|0.5;O:B|2|]"}
+
+    def test_list_of_objects_escapes_delimiters(self):
+        """Test that delimiters inside list-of-object values are escaped."""
+        result = _flatten_dict({"tags": [{"name": "a|b"}, {"name": "c;d"}]})
+        assert result == {"tags": "{name}[a\\|b;c\\;d]"}
+
     def test_mixed_nested_structure(self):
         """Test flattening mixed nested structures."""
         input_dict = {
@@ -376,6 +392,23 @@ class TestJsonToCsvStdlib:
         with pytest.raises(json.JSONDecodeError):
             json_to_csv("not valid json {")
 
+    def test_bytes_input(self):
+        """Test that raw JSON bytes are parsed without decoding first."""
+        data = {"results": [{"ticker": "AAPL", "price": 150.5}]}
+        assert json_to_csv(json.dumps(data).encode("utf-8")) == json_to_csv(data)
+        assert json_to_csv(memoryview(json.dumps(data).encode())) == json_to_csv(data)
+
+    def test_large_body_uses_stdlib_parser(self, monkeypatch):
+        """Test that bodies over the size threshold parse to the same CSV."""
+        from mcp_polygon import formatters
+
+        data = {"results": [{"ticker": "ESZ4", "price": 5000.25, "size": 3}]}
+        expected = json_to_csv(data)
+        monkeypatch.setattr(formatters, "LARGE_BODY_BYTES", 0)
+
+        assert json_to_csv(json.dumps(data).encode("utf-8")) == expected
+        assert json_to_csv(json.dumps(data)) == expected
+
     def test_csv_output_format(self):
         """Test that output is valid CSV with proper headers."""
         json_input = {
@@ -412,6 +445,34 @@ class TestJsonToCsvStdlib:
         fields = header.split(",")
         assert fields == ["z", "a", "m"]
 
+    def test_new_field_in_later_record(self):
+        """Test that columns first seen in later records are still included."""
+        json_input = {
+            "results": [
+                {"a": 1, "b": 2},
+                {"a": 3},
+                {"a": 4, "c": 5},
+            ]
+        }
+
+        result = json_to_csv(json_input)
+
+        assert result == "a,b,c\n1,2,\n3,,\n4,,5\n"
+
+    def test_reordered_and_missing_fields_align_with_header(self):
+        """Test that rows with reordered or missing keys stay column-aligned."""
+        json_input = {
+            "results": [
+                {"a": 1, "b": 2, "c": 3},
+                {"c": 6, "a": 4, "b": 5},
+                {"b": 8},
+            ]
+        }
+
+        result = json_to_csv(json_input)
+
+        assert result == "a,b,c\n1,2,3\n4,5,6\n,8,\n"
+
     def test_unicode_characters(self):
         """Test handling of unicode characters."""
         json_input = {"results": [{"name": "Café", "symbol": "€", "emoji": "🚀"}]}
@@ -424,3 +485,60 @@ class TestJsonToCsvStdlib:
         assert rows[0]["name"] == "Café"
         assert rows[0]["symbol"] == "€"
         assert rows[0]["emoji"] == "🚀"
+
+
+class TestJsonToOnto:
+    """Tests for the json_to_onto columnar formatter."""
+
+    def test_flat_results_header_once(self):
+        """Test that field names are emitted once in the schema header."""
+        json_input = {
+            "results": [
+                {"ticker": "AAPL", "price": 150.5},
+                {"ticker": "MSFT", "price": 380.0},
+            ]
+        }
+        result = json_to_onto(json_input)
+        assert result == "results{ticker|price}\nAAPL|150.5\nMSFT|380.0\n"
+
+    def test_accepts_json_string(self):
+        """Test that JSON strings are parsed like dictionaries."""
+        data = {"results": [{"a": 1, "b": 2}]}
+        assert json_to_onto(json.dumps(data)) == json_to_onto(data)
+
+    def test_nested_object_becomes_sub_schema(self):
+        """Test that nested objects are declared once and emitted as child rows."""
+        json_input = {
+            "results": [
+                {"ticker": "AAPL", "day": {"o": 1, "c": 2}},
+                {"ticker": "MSFT"},
+            ]
+        }
+        lines = json_to_onto(json_input).splitlines()
+        assert lines[0] == "results{ticker}"
+        assert lines[1] == "  day{o|c}"
+        assert lines[2:] == ["AAPL", "  1|2", "MSFT", "  |"]
+
+    def test_list_of_objects_one_row_per_item(self):
+        """Test that arrays of objects are emitted as indented child rows."""
+        json_input = {"results": [{"id": 1, "legs": [{"x": 1}, {"x": 2}]}]}
+        lines = json_to_onto(json_input).splitlines()
+        assert lines == ["results{id}", "  legs{x}", "1", "  1", "  2"]
+
+    def test_scalar_values(self):
+        """Test formatting of None, booleans, and scalar lists."""
+        json_input = {"results": [{"a": None, "b": True, "c": ["x", "y"]}]}
+        assert json_to_onto(json_input).splitlines()[1] == "|true|x,y"
+
+    def test_delimiter_escaping(self):
+        """Test that delimiter and newline characters are escaped."""
+        json_input = {"results": [{"name": "A|B", "note": "line1\nline2"}]}
+        assert json_to_onto(json_input).splitlines()[1] == "A\\|B|line1\\nline2"
+
+    def test_single_object(self):
+        """Test that a single object without results is treated as one record."""
+        assert json_to_onto({"status": "OK"}) == "results{status}\nOK\n"
+
+    def test_empty_results(self):
+        """Test that empty results produce empty output."""
+        assert json_to_onto({"results": []}) == ""
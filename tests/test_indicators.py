@@ -0,0 +1,260 @@
+"""Tests for local indicator computation and the fused indicator tools."""
+
+import csv
+import io
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from mcp_polygon.formatters import json_to_onto
+from mcp_polygon.indicators import IndicatorFormatter, ema, macd, rsi, sma
+
+
+class TestIndicatorMath:
+    """Tests for the SMA/EMA/MACD/RSI series functions."""
+
+    def test_sma(self):
+        """Test that SMA averages each full window and pads the warm-up."""
+        assert sma([1, 2, 3, 4, 5], 3) == [None, None, 2.0, 3.0, 4.0]
+
+    def test_ema_seeded_with_sma(self):
+        """Test that EMA starts from the SMA and then applies the recurrence."""
+        result = ema([1, 2, 3, 4, 5], 3)
+
+        # Seed = mean(1, 2, 3) = 2; alpha = 0.5
+        assert result[:3] == [None, None, 2.0]
+        assert result[3] == pytest.approx(0.5 * 4 + 0.5 * 2.0)
+        assert result[4] == pytest.approx(0.5 * 5 + 0.5 * 3.0)
+
+    def test_ema_skips_leading_none(self):
+        """Test that EMA of a warming-up series starts after its None values."""
+        assert ema([None, None, 2, 4], 2) == [None, None, None, 3.0]
+
+    def test_macd_histogram_is_line_minus_signal(self):
+        """Test that MACD histogram equals the MACD line minus its signal."""
+        closes = [100 + (i % 7) * 1.5 + i * 0.3 for i in range(60)]
+
+        line, signal, histogram = macd(closes, 12, 26, 9)
+
+        # Line starts with the slow EMA; signal needs 9 more line values
+        assert line[24] is None and line[25] is not None
+        assert signal[32] is None and signal[33] is not None
+        assert histogram[59] == pytest.approx(line[59] - signal[59])
+
+    def test_macd_matches_separate_emas(self):
+        """Test that the single-pass MACD equals EMAs computed one by one."""
+        closes = [100 + (i % 11) * 0.7 - i * 0.2 for i in range(80)]
+
+        line, signal, _ = macd(closes, 12, 26, 9)
+
+        fast, slow = ema(closes, 12), ema(closes, 26)
+        expected = [
+            f - s if f is not None and s is not None else None
+            for f, s in zip(fast, slow)
+        ]
+        assert line == expected
+        assert signal == ema(expected, 9)
+
+    def test_rsi_bounds(self):
+        """Test RSI is 100 for only gains, 0 for only losses, 50 when balanced."""
+        assert rsi([1, 2, 3, 4, 5], 3)[3:] == [100.0, 100.0]
+        assert rsi([5, 4, 3, 2, 1], 3)[3:] == [0.0, 0.0]
+        assert rsi([1, 2, 1, 2, 1], 2)[2] == pytest.approx(50.0)
+
+
+class TestIndicatorFormatter:
+    """Tests for turning aggregate bars into indicator CSV."""
+
+    def test_columns_for_requested_indicators(self):
+        """Test that only the requested indicators become columns."""
+        data = {"results": [{"t": i, "c": float(i)} for i in range(1, 6)]}
+
+        rows = list(
+            csv.DictReader(
+                io.StringIO(IndicatorFormatter(indicators=("sma",), window=2)(data))
+            )
+        )
+
+        assert list(rows[0]) == ["timestamp", "close", "sma"]
+        assert [r["sma"] for r in rows] == ["", "1.5", "2.5", "3.5", "4.5"]
+
+    def test_bars_sorted_oldest_first(self):
+        """Test that bars are ordered by timestamp before computing."""
+        data = b'{"results": [{"t": 2, "c": 20}, {"t": 1, "c": 10}]}'
+
+        result = IndicatorFormatter(indicators=("sma",), window=2)(data)
+
+        assert result == "timestamp,close,sma\n1,10.0,\n2,20.0,15.0\n"
+
+    def test_rows_rendered_by_output_formatter(self):
+        """Test that a non-CSV output formatter receives one record per bar."""
+        data = {"results": [{"t": i, "c": float(i)} for i in range(1, 4)]}
+
+        formatter = IndicatorFormatter(
+            indicators=("sma",), window=2, output=json_to_onto
+        )
+
+        lines = formatter(data).splitlines()
+        assert lines == [
+            "results{timestamp|close|sma}",
+            "1|1.0|",
+            "2|2.0|1.5",
+            "3|3.0|2.5",
+        ]
+
+    def test_no_bars(self):
+        """Test that an empty aggregates response formats as empty output."""
+        assert IndicatorFormatter()({"results": []}) == ""
+
+
+class TestFusedIndicatorTools:
+    """Tests for the get_*_indicators tools."""
+
+    @pytest.fixture
+    def mcp(self, api_wrapper):
+        from mcp_polygon.tools.rest import crypto, indices, options
+
+        server = FastMCP("test-indicators")
+        for module in (crypto, indices, options):
+            module.register_tools(server, api_wrapper)
+        return server
+
+    @pytest.mark.asyncio
+    async def test_one_aggregates_call_for_all_indicators(
+        self, mcp, api_wrapper, mock_response
+    ):
+        """Test that all four indicators come from a single get_aggs request."""
+        bars = [{"t": i, "c": 100.0 + i} for i in range(60)]
+        api_wrapper.client.get_aggs.return_value = mock_response({"results": bars})
+
+        result = await mcp._tool_manager.call_tool(
+            "get_crypto_indicators",
+            {"ticker": "X:BTCUSD", "from_": "2024-01-01", "to": "2024-03-01"},
+        )
+
+        header = result.splitlines()[0]
+        assert header == "timestamp,close,sma,ema,macd,macd_signal,macd_histogram,rsi"
+        assert len(result.splitlines()) == 61
+        api_wrapper.client.get_aggs.assert_called_once()
+        assert api_wrapper.client.get_aggs.call_args.kwargs["ticker"] == "X:BTCUSD"
+        api_wrapper.client.get_sma.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_follows_configured_output_format(
+        self, mcp, api_wrapper, mock_response
+    ):
+        """Test that indicator rows use the wrapper's formatter (onto here)."""
+        api_wrapper.formatter = json_to_onto
+        bars = [{"t": i, "c": 100.0 + i} for i in range(3)]
+        api_wrapper.client.get_aggs.return_value = mock_response({"results": bars})
+
+        result = await mcp._tool_manager.call_tool(
+            "get_crypto_indicators",
+            {
+                "ticker": "X:BTCUSD",
+                "from_": "2024-01-01",
+                "to": "2024-03-01",
+                "indicators": ["sma"],
+                "window": 2,
+            },
+        )
+
+        assert result.splitlines()[0] == "results{timestamp|close|sma}"
+
+    @pytest.mark.asyncio
+    async def test_unknown_indicator_rejected(self, mcp, api_wrapper):
+        """Test that unknown indicator names return an error without an API call."""
+        result = await mcp._tool_manager.call_tool(
+            "get_index_indicators",
+            {
+                "ticker": "I:SPX",
+                "from_": "2024-01-01",
+                "to": "2024-03-01",
+                "indicators": ["vwap"],
+            },
+        )
+
+        assert result.startswith("Error: Unknown indicator(s): vwap")
+        api_wrapper.client.get_aggs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_future_start_date_rejected(self, mcp, api_wrapper):
+        """Test that a future from_ returns an error without an API call."""
+        result = await mcp._tool_manager.call_tool(
+            "get_crypto_indicators",
+            {"ticker": "X:BTCUSD", "from_": "2099-01-01", "to": "2024-03-01"},
+        )
+
+        assert result.startswith("Error:") and "from_" in result
+        api_wrapper.client.get_aggs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_indicator_results_cached_separately_from_aggs(
+        self, mcp, api_wrapper, mock_response
+    ):
+        """Test that indicator output does not collide with plain aggregates."""
+        bars = [{"t": i, "c": 10.0 + i} for i in range(5)]
+        api_wrapper.client.get_aggs.return_value = mock_response({"results": bars})
+        kwargs = dict(
+            ticker="O:SPY251219C00650000",
+            multiplier=1,
+            timespan="day",
+            from_="2024-01-01",
+            to="2024-03-01",
+            adjusted=None,
+            sort="asc",
+            limit=5000,
+        )
+
+        plain = await api_wrapper.call("get_aggs", **kwargs)
+        fused = await mcp._tool_manager.call_tool(
+            "get_options_indicators",
+            {
+                "ticker": "O:SPY251219C00650000",
+                "from_": "2024-01-01",
+                "to": "2024-03-01",
+                "indicators": ["SMA"],
+                "window": 2,
+            },
+        )
+
+        assert plain.startswith("t,c")
+        assert fused.startswith("timestamp,close,sma")
+        assert api_wrapper.client.get_aggs.call_count == 2
+
+
+class TestMultiTickerSmaTools:
+    """Tests for the get_*_sma_batch tools."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_per_ticker_merged(self, api_wrapper, mock_response):
+        """Test that each ticker is fetched once and merged with a ticker column."""
+        from mcp_polygon.tools.rest import indices
+
+        mcp = FastMCP("test-sma-batch")
+        indices.register_tools(mcp, api_wrapper)
+        api_wrapper.client.get_sma.return_value = mock_response(
+            {"results": {"values": [{"timestamp": 1, "value": 10.0}]}}
+        )
+
+        result = await mcp._tool_manager.call_tool(
+            "get_index_sma_batch", {"tickers": ["I:SPX", "I:NDX"], "window": 20}
+        )
+
+        assert result == "ticker,timestamp,value\nI:SPX,1,10.0\nI:NDX,1,10.0\n"
+        assert api_wrapper.client.get_sma.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_ticker_list_rejected(self, api_wrapper):
+        """Test that an empty ticker list returns an error without API calls."""
+        from mcp_polygon.tools.rest import crypto
+
+        mcp = FastMCP("test-sma-batch")
+        crypto.register_tools(mcp, api_wrapper)
+
+        result = await mcp._tool_manager.call_tool(
+            "get_crypto_sma_batch", {"tickers": []}
+        )
+
+        assert result.startswith("Error:")
+        api_wrapper.client.get_sma.assert_not_called()
@@ -29,18 +29,61 @@ class TestServerInitialization:
             assert isinstance(server.poly_mcp, FastMCP)
 
     @pytest.mark.asyncio
-    async def test_all_117_tools_registered(self):
-        """Verify exactly 117 tools are registered (81 REST + 36 WebSocket)."""
+    async def test_all_124_tools_registered(self):
+        """Verify exactly 124 tools are registered (87 REST + 36 WebSocket + batch)."""
         with patch.dict(os.environ, {"POLYGON_API_KEY": "test_key"}):
             from mcp_polygon import server
 
             # Count registered tools
             tools = await server.poly_mcp.list_tools()
             tool_count = len(tools)
-            assert tool_count == 117, (
-                f"Expected 117 tools (81 REST + 36 WebSocket), found {tool_count}"
+            assert tool_count == 124, (
+                f"Expected 124 tools (87 REST + 36 WebSocket + batch), found {tool_count}"
             )
 
+    @pytest.mark.asyncio
+    async def test_tools_publish_structured_output_by_default(self):
+        """Verify tools keep their output schema unless opted out."""
+        with patch.dict(os.environ, {"POLYGON_API_KEY": "test_key"}):
+            from mcp_polygon import server
+
+            tools = await server.poly_mcp.list_tools()
+            assert [t.name for t in tools if t.outputSchema is None] == []
+
+    @pytest.mark.asyncio
+    async def test_tools_return_unstructured_text_when_opted_out(self, api_wrapper):
+        """Verify MCP_STRUCTURED_OUTPUT=false registers text-only tools."""
+        from mcp_polygon.tools.rest import economy
+
+        mcp = FastMCP("test-text-only")
+        with patch.object(economy, "STRUCTURED_OUTPUT", False):
+            economy.register_tools(mcp, api_wrapper)
+
+        tools = await mcp.list_tools()
+        assert tools
+        assert [t.name for t in tools if t.outputSchema is not None] == []
+
+    def test_rest_tool_names_are_unique(self, api_wrapper):
+        """Verify no REST tool is defined twice, within or across modules."""
+        import importlib
+        import inspect
+        from mcp.server.fastmcp import FastMCP
+        from mcp_polygon.tools import rest
+
+        seen = set()
+        for name in rest.__all__:
+            module = importlib.import_module(f"mcp_polygon.tools.rest.{name}")
+            mcp = FastMCP(f"test-{name}")
+            module.register_tools(mcp, api_wrapper)
+            names = set(mcp._tool_manager._tools)
+
+            # A duplicate inside a module would silently replace the earlier tool
+            assert len(names) == inspect.getsource(module).count("@mcp.tool"), name
+            assert not names & seen, f"{name} redefines {sorted(names & seen)}"
+            seen |= names
+
+        assert len(seen) == 87
+
     @pytest.mark.asyncio
     async def test_tool_distribution_by_asset_class(self):
         """Verify tools distributed correctly by asset class."""
@@ -71,6 +114,108 @@ class TestServerInitialization:
             assert "User-Agent" in server.polygon_client.headers
             assert "MCP-Polygon" in server.polygon_client.headers["User-Agent"]
 
+    def test_transport_security_settings_validated(self):
+        """Verify allowed hosts/origins reach FastMCP as validated settings."""
+        with patch.dict(os.environ, {"POLYGON_API_KEY": "test_key"}):
+            from mcp_polygon import server
+
+            security = server.poly_mcp.settings.transport_security
+            assert security.enable_dns_rebinding_protection
+            assert isinstance(security.allowed_hosts, list)
+            assert isinstance(security.allowed_origins, list)
+            assert "localhost:8000" in security.allowed_hosts
+            assert "http://localhost" in security.allowed_origins
+
+    def test_connection_manager_singleton(self):
+        """Verify the WebSocket ConnectionManager is created once and shared."""
+        with patch.dict(os.environ, {"POLYGON_API_KEY": "test_key"}):
+            from mcp_polygon import server
+            from mcp_polygon.tools.websockets import ConnectionManager
+
+            manager = server.get_connection_manager()
+            assert isinstance(manager, ConnectionManager)
+            assert server.get_connection_manager() is manager
+
+    @pytest.mark.asyncio
+    async def test_connection_manager_resolved_on_first_stream_call(self):
+        """Verify WebSocket tool registration defers creating the manager."""
+        from mcp_polygon.tools.websockets import stocks
+
+        manager = Mock()
+        manager.get_connection.side_effect = KeyError("stocks")
+        get_manager = Mock(return_value=manager)
+
+        mcp = FastMCP("test-lazy-ws")
+        stocks.register_tools(mcp, get_manager)
+        get_manager.assert_not_called()
+
+        await mcp.call_tool("get_stocks_stream_status", {})
+        get_manager.assert_called_once_with()
+        manager.get_connection.assert_called_once_with("stocks")
+
+    def test_uvloop_for_http_transports_and_streaming(self):
+        """Verify uvloop is used for HTTP or streaming and skipped otherwise."""
+        import asyncio
+        import sys
+        import types
+
+        with patch.dict(os.environ, {"POLYGON_API_KEY": "test_key"}):
+            from mcp_polygon import server
+
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.EventLoopPolicy = asyncio.DefaultEventLoopPolicy
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            with patch.object(server.asyncio, "set_event_loop_policy") as set_policy:
+                with patch.object(server, "ENABLE_WEBSOCKETS", False):
+                    assert server._use_uvloop("stdio") is False
+                set_policy.assert_not_called()
+
+                assert server._use_uvloop("streamable-http") is (
+                    sys.platform != "win32"
+                )
+                with patch.object(server, "ENABLE_WEBSOCKETS", True):
+                    assert server._use_uvloop("stdio") is (sys.platform != "win32")
+
+        # Not installed: fall back to the default loop without failing
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert server._use_uvloop("sse") is False
+
+    @pytest.mark.asyncio
+    async def test_rest_modules_share_one_api_wrapper(
+        self, api_wrapper, mock_response
+    ):
+        """Verify tools from different modules use the wrapper they are given."""
+        from mcp.server.fastmcp import FastMCP
+        from mcp_polygon.tools.rest import economy, forex
+
+        mcp = FastMCP("test")
+        economy.register_tools(mcp, api_wrapper)
+        forex.register_tools(mcp, api_wrapper)
+        api_wrapper.client.list_treasury_yields.return_value = mock_response(
+            {"results": [{"date": "2024-01-02"}]}
+        )
+        api_wrapper.client.get_sma.return_value = mock_response({"results": []})
+
+        await mcp._tool_manager.call_tool("list_treasury_yields", {})
+        await mcp._tool_manager.call_tool("get_forex_sma", {"ticker": "C:EURUSD"})
+
+        assert len(api_wrapper._cache._entries) == 2
+        with patch.dict(os.environ, {"POLYGON_API_KEY": "test_key"}):
+            from mcp_polygon import server
+
+            assert server.polygon_api.client is server.polygon_client
+
+    def test_http_pool_keeps_connections_for_concurrent_calls(self):
+        """Verify the Polygon connection pool holds more than one connection."""
+        with patch.dict(os.environ, {"POLYGON_API_KEY": "test_key"}):
+            from mcp_polygon import server
+
+            pool = server.polygon_client.client.connection_from_host(
+                "api.polygon.io", 443, "https"
+            )
+
+            assert pool.pool.maxsize == server.HTTP_POOL_SIZE > 1
+
 
 # Test 2: Tool Signature Tests
 class TestToolSignatures:
@@ -679,7 +824,7 @@ class TestOptionsToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_options_contracts"]
 
         result = await tool.fn(underlying_ticker="SPY", contract_type="call")
@@ -721,7 +866,7 @@ class TestOptionsToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_options_contract"]
 
         result = await tool.fn(options_ticker="O:SPY251219C00650000")
@@ -733,6 +878,23 @@ class TestOptionsToolsPhase2:
             ticker="O:SPY251219C00650000", params=None, raw=True
         )
 
+    @pytest.mark.asyncio
+    async def test_get_options_contract_rejects_malformed_ticker(
+        self, mock_polygon_client, api_wrapper
+    ):
+        """Test get_options_contract returns an error without an API call."""
+        from src.mcp_polygon.tools.rest.options import register_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mcp = FastMCP("test")
+        register_tools(mcp, api_wrapper)
+        tool = mcp._tool_manager._tools["get_options_contract"]
+
+        result = await tool.fn(options_ticker="SPY251219C650")
+
+        assert result.startswith("Error: Invalid options ticker(s): SPY251219C650")
+        mock_polygon_client.get_options_contract.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_options_chain_success(
         self, mock_polygon_client, mock_response, api_wrapper
@@ -762,7 +924,7 @@ class TestOptionsToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_options_chain"]
 
         result = await tool.fn(underlying_asset="SPY", contract_type="call")
@@ -803,7 +965,7 @@ class TestStocksToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_related_companies"]
 
         result = await tool.fn(ticker="AAPL")
@@ -837,7 +999,7 @@ class TestStocksToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_ticker_changes"]
 
         result = await tool.fn(ticker="AAPL")
@@ -880,7 +1042,7 @@ class TestStocksToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_ticker_events"]
 
         result = await tool.fn(ticker="AAPL", types="earnings,dividend")
@@ -911,7 +1073,7 @@ class TestStocksToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_sma"]
 
         result = await tool.fn(ticker="AAPL", window=50, timespan="day")
@@ -950,7 +1112,7 @@ class TestStocksToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_ema"]
 
         result = await tool.fn(ticker="AAPL", window=20)
@@ -982,7 +1144,7 @@ class TestStocksToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_macd"]
 
         result = await tool.fn(ticker="AAPL")
@@ -1005,7 +1167,7 @@ class TestStocksToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_rsi"]
 
         result = await tool.fn(ticker="AAPL", window=14)
@@ -1061,7 +1223,7 @@ class TestIndicesToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_indices_snapshot"]
 
         result = await tool.fn(ticker_any_of="I:SPX,I:DJI")
@@ -1093,7 +1255,7 @@ class TestIndicesToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_index_sma"]
 
         result = await tool.fn(ticker="I:SPX", window=200)
@@ -1131,7 +1293,7 @@ class TestTechnicalIndicatorsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_options_sma"]
 
         result = await tool.fn(ticker="O:SPY251219C00650000", window=50)
@@ -1154,7 +1316,7 @@ class TestTechnicalIndicatorsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_forex_sma"]
 
         result = await tool.fn(ticker="C:EURUSD", window=50)
@@ -1188,7 +1350,7 @@ class TestTechnicalIndicatorsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_crypto_sma"]
 
         result = await tool.fn(ticker="X:BTCUSD", window=100)
@@ -1230,7 +1392,7 @@ class TestEconomyToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_inflation_expectations"]
 
         result = await tool.fn(date_gte="2023-10-01")
@@ -1264,7 +1426,7 @@ class TestEconomyToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_inflation_expectations"]
 
         result = await tool.fn(date_gte="2023-10-01")
@@ -1312,7 +1474,7 @@ class TestEconomyToolsPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_inflation_expectations"]
 
         result = await tool.fn(date_gte="2023-10-01", limit=10)
@@ -1351,7 +1513,7 @@ class TestErrorHandlingPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_options_contracts"]
 
         result = await tool.fn(underlying_ticker="INVALID")
@@ -1371,7 +1533,7 @@ class TestErrorHandlingPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_sma"]
 
         result = await tool.fn(ticker="AAPL")
@@ -1395,7 +1557,7 @@ class TestErrorHandlingPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_indices_snapshot"]
 
         result = await tool.fn(ticker_any_of="I:SPX")
@@ -1438,7 +1600,7 @@ class TestCSVFormattingPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_options_chain"]
 
         result = await tool.fn(underlying_asset="SPY")
@@ -1470,7 +1632,7 @@ class TestCSVFormattingPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_sma"]
 
         result = await tool.fn(ticker="AAPL", window=50)
@@ -1497,7 +1659,7 @@ class TestParameterValidationPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_options_contracts"]
 
         await tool.fn(
@@ -1531,7 +1693,7 @@ class TestParameterValidationPhase2:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_sma"]
 
         await tool.fn(ticker="AAPL", window=200, timespan="week")
@@ -1596,7 +1758,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         result = await tool.fn(date="2024-01-15")
@@ -1631,7 +1793,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         await tool.fn(
@@ -1659,7 +1821,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         # Test with future date
@@ -1687,7 +1849,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         # Test with past date
@@ -1717,7 +1879,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         result = await tool.fn(date=today)
@@ -1747,7 +1909,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         result = await tool.fn(date=past_date)
@@ -1771,7 +1933,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         result = await tool.fn(date="2023-01-15")
@@ -1796,7 +1958,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         result = await tool.fn(date="2023-01-15")
@@ -1846,7 +2008,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         result = await tool.fn(date="2024-01-15")
@@ -1878,7 +2040,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         result = await tool.fn(date="2024-01-15")
@@ -1900,7 +2062,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         await tool.fn(date="2024-01-15")
@@ -1924,7 +2086,7 @@ class TestGroupedDailyAggsRefactored:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["get_grouped_daily_aggs"]
 
         await tool.fn(date="2024-01-15")
@@ -1994,7 +2156,7 @@ class TestListUniversalSnapshots:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_universal_snapshots"]
 
         # Test with comma-separated tickers (string format)
@@ -2076,7 +2238,7 @@ class TestListUniversalSnapshots:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_universal_snapshots"]
 
         # Test with type="stocks" and limit=5
@@ -2137,7 +2299,7 @@ class TestListUniversalSnapshots:
         from mcp.server.fastmcp import FastMCP
 
         mcp = FastMCP("test")
-        register_tools(mcp, mock_polygon_client, api_wrapper.formatter)
+        register_tools(mcp, api_wrapper)
         tool = mcp._tool_manager._tools["list_universal_snapshots"]
 
         # Test with ticker range parameters (directly passed to tool)
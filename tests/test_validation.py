@@ -2,7 +2,11 @@
 
 import pytest
 from datetime import datetime, date, timedelta, timezone
-from mcp_polygon.validation import validate_date, validate_date_any_of
+from mcp_polygon.validation import (
+    validate_date,
+    validate_date_any_of,
+    validate_option_ticker,
+)
 
 
 class TestDateValidation:
@@ -223,6 +227,34 @@ class TestDateAnyOfValidation:
         assert future1 in result
 
 
+class TestOptionTickerValidation:
+    """Test suite for validate_option_ticker() function."""
+
+    def test_accepts_valid_tickers(self):
+        """Test that OCC-format tickers, including adjusted roots, are valid."""
+        assert validate_option_ticker("O:SPY251219C00650000") is None
+        assert validate_option_ticker("O:SPXW251219P06000000") is None
+        assert validate_option_ticker("O:AAPL1250117C00150000") is None
+
+    def test_rejects_malformed_tickers(self):
+        """Test that missing prefix, bad type or short strike are rejected."""
+        for ticker in (
+            "SPY251219C00650000",
+            "O:SPY251219X00650000",
+            "O:SPY251219C650",
+            "o:spy251219c00650000",
+        ):
+            result = validate_option_ticker(ticker)
+            assert result is not None and ticker in result
+
+    def test_lists_every_invalid_ticker(self):
+        """Test that a batch reports all malformed tickers at once."""
+        result = validate_option_ticker("O:SPY251219C00650000", "BAD1", "BAD2")
+
+        assert "BAD1, BAD2" in result
+        assert "O:SPY" not in result.split(".")[0]
+
+
 class TestEdgeCases:
     """Additional edge case tests for validation functions."""
 
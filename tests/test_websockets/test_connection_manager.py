@@ -8,6 +8,7 @@ Tests the WebSocketConnection and ConnectionManager classes including:
 - State transitions and status reporting
 """
 
+import asyncio
 import json
 import pytest
 from collections import deque
@@ -47,6 +48,11 @@ def connection():
     )
 
 
+async def drain_handlers(connection):
+    """Wait until every handler has consumed its queued messages."""
+    await asyncio.gather(*(queue.join() for queue in connection._handler_queues))
+
+
 @pytest.fixture
 def connection_manager():
     """Create a ConnectionManager instance for testing."""
@@ -123,6 +129,27 @@ async def test_connect_success(connection, mock_websocket):
     assert auth_msg["params"] == "test_api_key"
 
 
+@pytest.mark.asyncio
+async def test_connect_reuses_ssl_context(connection, mock_websocket):
+    """Test every connect passes the same verified SSL context."""
+    import ssl
+
+    mock_websocket.recv.return_value = json.dumps(
+        [{"ev": "status", "status": "auth_success", "message": "authenticated"}]
+    )
+
+    with patch(
+        "websockets.connect", new_callable=AsyncMock, return_value=mock_websocket
+    ) as mock_connect:
+        with patch.object(connection, "_receive_messages", new_callable=AsyncMock):
+            await connection.connect()
+            await connection.connect()
+
+    first, second = (call.kwargs["ssl"] for call in mock_connect.call_args_list)
+    assert first is second
+    assert first.verify_mode == ssl.CERT_REQUIRED and first.check_hostname
+
+
 @pytest.mark.asyncio
 async def test_connect_with_ping_config(connection, mock_websocket):
     """Test connection includes ping configuration."""
@@ -197,7 +224,7 @@ async def test_close_connection(connection, mock_websocket):
 
 
 # ============================================================================
-# Subscription Management Tests (6 tests)
+# Subscription Management Tests (8 tests)
 # ============================================================================
 
 
@@ -250,6 +277,39 @@ async def test_unsubscribe_channels(connection, mock_websocket):
     assert connection.subscriptions == {"Q.MSFT"}
 
 
+@pytest.mark.asyncio
+async def test_subscribe_skips_duplicate_and_existing_channels(
+    connection, mock_websocket
+):
+    """Test that only new channels are sent, each once, in request order."""
+    connection.websocket = mock_websocket
+    connection.state = ConnectionState.CONNECTED
+    connection.subscriptions = {"T.AAPL"}
+
+    await connection.subscribe(["Q.MSFT", "T.AAPL", "Q.MSFT", "T.GOOGL"])
+    await connection.subscribe(["T.AAPL", "T.GOOGL"])
+
+    mock_websocket.send.assert_called_once()
+    subscribe_msg = json.loads(mock_websocket.send.call_args[0][0])
+    assert subscribe_msg["params"] == "Q.MSFT,T.GOOGL"
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_skips_unknown_channels(connection, mock_websocket):
+    """Test that unsubscribing only sends channels that are subscribed."""
+    connection.websocket = mock_websocket
+    connection.state = ConnectionState.CONNECTED
+    connection.subscriptions = {"T.AAPL", "Q.MSFT"}
+
+    await connection.unsubscribe(["T.TSLA"])
+    await connection.unsubscribe(["Q.MSFT", "T.TSLA", "Q.MSFT"])
+
+    mock_websocket.send.assert_called_once()
+    unsubscribe_msg = json.loads(mock_websocket.send.call_args[0][0])
+    assert unsubscribe_msg["params"] == "Q.MSFT"
+    assert connection.subscriptions == {"T.AAPL"}
+
+
 @pytest.mark.asyncio
 async def test_unsubscribe_when_disconnected(connection):
     """Test unsubscribing fails when not connected."""
@@ -320,6 +380,7 @@ async def test_receive_messages_data_routing(connection, mock_websocket):
     mock_websocket.__aiter__ = lambda self: async_iterator()
 
     await connection._receive_messages()
+    await drain_handlers(connection)
 
     # Verify handler called for each message
     assert handler.call_count == 2
@@ -327,6 +388,87 @@ async def test_receive_messages_data_routing(connection, mock_websocket):
     handler.assert_any_call({"ev": "Q", "sym": "MSFT", "bp": 300.50, "ap": 300.75})
 
 
+@pytest.mark.asyncio
+async def test_slow_handler_does_not_block_receiving(connection, mock_websocket):
+    """Test reception finishes while a handler is still working."""
+    release = asyncio.Event()
+    seen = []
+
+    async def slow_handler(msg):
+        await release.wait()
+        seen.append(msg)
+
+    connection.add_message_handler(slow_handler)
+    connection.websocket = mock_websocket
+
+    async def async_iterator():
+        yield json.dumps([{"ev": "T", "sym": "AAPL"}, {"ev": "T", "sym": "MSFT"}])
+
+    mock_websocket.__aiter__ = lambda self: async_iterator()
+
+    await connection._receive_messages()
+
+    assert connection._total_messages_received == 2
+    assert seen == []
+    release.set()
+    await drain_handlers(connection)
+    assert [msg["sym"] for msg in seen] == ["AAPL", "MSFT"]
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_full_handler_queue_drops_messages(connection, mock_websocket):
+    """Test a backed-up handler loses messages instead of stalling the stream."""
+    from mcp_polygon.tools.websockets import connection_manager
+
+    release = asyncio.Event()
+    seen = []
+
+    async def handler(msg):
+        await release.wait()
+        seen.append(msg)
+
+    with patch.object(connection_manager, "HANDLER_QUEUE_SIZE", 2):
+        connection.add_message_handler(handler)
+    connection.websocket = mock_websocket
+
+    async def async_iterator():
+        yield json.dumps([{"ev": "T", "id": i} for i in range(5)])
+
+    mock_websocket.__aiter__ = lambda self: async_iterator()
+
+    await connection._receive_messages()
+
+    assert connection.get_message_stats()["dropped"] == 3
+    assert connection._total_messages_received == 5
+    release.set()
+    await drain_handlers(connection)
+    assert [msg["id"] for msg in seen] == [0, 1]
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_messages_yields_during_bursts(connection, mock_websocket):
+    """Test a burst of queued frames does not starve other tasks on the loop."""
+    frame = json.dumps([{"ev": "T", "sym": "AAPL"}] * 64)
+
+    async def async_iterator():
+        # Frames already queued: iteration never suspends on its own
+        for _ in range(10):
+            yield frame
+
+    connection.websocket = mock_websocket
+    mock_websocket.__aiter__ = lambda self: async_iterator()
+
+    async def observer():
+        await asyncio.sleep(0)
+        return connection._total_messages_received
+
+    observed, _ = await asyncio.gather(observer(), connection._receive_messages())
+
+    assert 0 < observed < 640
+
+
 @pytest.mark.asyncio
 async def test_receive_messages_status_handling(connection, mock_websocket):
     """Test status messages are handled separately."""
@@ -368,6 +510,7 @@ async def test_receive_messages_json_decode_error(connection, mock_websocket):
 
     # Should log error but continue processing
     await connection._receive_messages()
+    await drain_handlers(connection)
 
     # Valid message should still be processed
     handler.assert_called_once_with({"ev": "T", "sym": "AAPL"})
@@ -456,6 +599,24 @@ async def test_handle_connection_error_backoff_increases(connection):
     mock_connect.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_handle_connection_error_retries_in_a_loop(connection):
+    """Test repeated reconnect failures retry with backoff until one succeeds."""
+    with patch.object(
+        connection,
+        "connect",
+        new_callable=AsyncMock,
+        side_effect=[OSError("down"), OSError("down"), None],
+    ) as mock_connect:
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await connection._handle_connection_error(Exception("test"))
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 4]
+    assert mock_connect.call_count == 3
+    # Each attempt raises instead of starting a nested retry chain
+    assert all(c.kwargs == {"retry": False} for c in mock_connect.call_args_list)
+
+
 @pytest.mark.asyncio
 async def test_receive_messages_connection_closed(connection, mock_websocket):
     """Test handling of connection closed during receive."""
@@ -71,7 +71,7 @@ def mock_connection_manager(mock_websocket_connection):
 def mcp_server(mock_connection_manager):
     """FastMCP instance with crypto tools registered."""
     mcp = FastMCP("test-crypto")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
     return mcp
 
 
@@ -85,7 +85,7 @@ async def test_start_crypto_stream_success(mock_connection_manager, mock_websock
     """Test successful crypto stream start with valid API key."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool(
@@ -119,7 +119,7 @@ async def test_start_crypto_stream_with_custom_endpoint(mock_connection_manager,
     """Test stream start with custom delayed endpoint."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
     custom_endpoint = "wss://delayed.polygon.io/crypto"
 
     # Act
@@ -150,7 +150,7 @@ async def test_start_crypto_stream_uses_env_api_key(mock_connection_manager, moc
     """Test stream start uses POLYGON_API_KEY environment variable when not provided."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     with patch.dict(os.environ, {"POLYGON_API_KEY": "env_api_key"}):
         # Act
@@ -176,7 +176,7 @@ async def test_start_crypto_stream_multiple_channels(mock_connection_manager, mo
     """Test stream start with multiple channel subscriptions."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
     channels = ["XT.BTC-USD", "XQ.BTC-USD", "XA.BTC-USD", "XT.ETH-USD", "XQ.ETH-USD"]
 
     # Act
@@ -200,7 +200,7 @@ async def test_start_crypto_stream_connection_failure(mock_connection_manager, m
     """Test error handling when connection fails."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock connection failure
     mock_websocket_connection.connect.side_effect = Exception("Connection timeout")
@@ -231,7 +231,7 @@ async def test_stop_crypto_stream_success(mock_connection_manager, mock_websocke
     """Test successful stop of active stream."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("stop_crypto_stream", {})
@@ -251,7 +251,7 @@ async def test_stop_crypto_stream_no_active_connection(mock_connection_manager):
     """Test stop when no stream exists (KeyError handling)."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("crypto")
@@ -270,7 +270,7 @@ async def test_stop_crypto_stream_close_failure(mock_connection_manager, mock_we
     """Test error handling when close operation fails."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock close failure
     mock_websocket_connection.close.side_effect = Exception("Close error")
@@ -295,7 +295,7 @@ async def test_get_crypto_stream_status_active(mock_connection_manager, mock_web
     """Test status retrieval for active connection."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("get_crypto_stream_status", {})
@@ -315,7 +315,7 @@ async def test_get_crypto_stream_status_no_connection(mock_connection_manager):
     """Test status when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("crypto")
@@ -339,7 +339,7 @@ async def test_subscribe_crypto_channels_success(mock_connection_manager, mock_w
     """Test successful subscription to new channels."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
     new_channels = ["XT.SOL-USD", "XQ.ADA-USD"]
 
     # Act
@@ -364,7 +364,7 @@ async def test_subscribe_crypto_channels_single(mock_connection_manager, mock_we
     """Test subscribing to a single channel."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool(
@@ -384,7 +384,7 @@ async def test_subscribe_crypto_channels_no_stream(mock_connection_manager):
     """Test subscribe when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("crypto")
@@ -407,7 +407,7 @@ async def test_subscribe_crypto_channels_failure(mock_connection_manager, mock_w
     """Test error handling when subscription fails."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock subscription failure
     mock_websocket_connection.subscribe.side_effect = Exception("Invalid channel format")
@@ -435,7 +435,7 @@ async def test_unsubscribe_crypto_channels_success(mock_connection_manager, mock
     """Test successful unsubscription from channels."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock status after unsubscribe
     mock_websocket_connection.get_status.return_value = {
@@ -468,7 +468,7 @@ async def test_unsubscribe_crypto_channels_no_stream(mock_connection_manager):
     """Test unsubscribe when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("crypto")
@@ -491,7 +491,7 @@ async def test_unsubscribe_crypto_channels_failure(mock_connection_manager, mock
     """Test error handling when unsubscription fails."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock unsubscribe failure
     mock_websocket_connection.unsubscribe.side_effect = Exception("Unsubscribe error")
@@ -519,7 +519,7 @@ async def test_list_crypto_subscriptions_active(mock_connection_manager, mock_we
     """Test listing subscriptions for active stream."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("list_crypto_subscriptions", {})
@@ -539,7 +539,7 @@ async def test_list_crypto_subscriptions_grouped_by_type(mock_connection_manager
     """Test subscriptions are grouped by channel type."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock with multiple channel types
     mock_websocket_connection.get_status.return_value = {
@@ -573,7 +573,7 @@ async def test_list_crypto_subscriptions_empty(mock_connection_manager, mock_web
     """Test listing when no subscriptions exist."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock with no subscriptions
     mock_websocket_connection.get_status.return_value = {
@@ -597,7 +597,7 @@ async def test_list_crypto_subscriptions_no_connection(mock_connection_manager):
     """Test list when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("crypto")
@@ -620,7 +620,7 @@ async def test_complete_workflow_start_subscribe_stop(mock_connection_manager, m
     """Test complete workflow: start -> subscribe -> stop."""
     # Arrange
     mcp = FastMCP("test")
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act & Assert - Start
     result1 = await mcp.call_tool(
@@ -664,7 +664,7 @@ async def test_tool_registration_all_tools_available(mock_connection_manager):
     mcp = FastMCP("test")
 
     # Act
-    crypto.register_tools(mcp, mock_connection_manager)
+    crypto.register_tools(mcp, lambda: mock_connection_manager)
 
     # Assert - Verify all tools registered
     tool_names = [tool.name for tool in mcp._tool_manager._tools.values()]
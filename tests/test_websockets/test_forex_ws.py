@@ -71,7 +71,7 @@ def mock_connection_manager(mock_websocket_connection):
 def mcp_server(mock_connection_manager):
     """FastMCP instance with forex tools registered."""
     mcp = FastMCP("test-forex")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
     return mcp
 
 
@@ -85,7 +85,7 @@ async def test_start_forex_stream_success(mock_connection_manager, mock_websocke
     """Test successful forex stream start with valid API key."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool(
@@ -119,7 +119,7 @@ async def test_start_forex_stream_with_custom_endpoint(mock_connection_manager,
     """Test stream start with custom delayed endpoint."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
     custom_endpoint = "wss://delayed.polygon.io/forex"
 
     # Act
@@ -150,7 +150,7 @@ async def test_start_forex_stream_uses_env_api_key(mock_connection_manager, mock
     """Test stream start uses POLYGON_API_KEY environment variable when not provided."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     with patch.dict(os.environ, {"POLYGON_API_KEY": "env_api_key"}):
         # Act
@@ -176,7 +176,7 @@ async def test_start_forex_stream_connection_failure(mock_connection_manager, mo
     """Test error handling when connection fails."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock connection failure
     mock_websocket_connection.connect.side_effect = Exception("Connection timeout")
@@ -207,7 +207,7 @@ async def test_stop_forex_stream_success(mock_connection_manager, mock_websocket
     """Test successful stop of active stream."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("stop_forex_stream", {})
@@ -227,7 +227,7 @@ async def test_stop_forex_stream_no_active_connection(mock_connection_manager):
     """Test stop when no stream exists (KeyError handling)."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("forex")
@@ -251,7 +251,7 @@ async def test_get_forex_stream_status_active(mock_connection_manager, mock_webs
     """Test status retrieval for active connection."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("get_forex_stream_status", {})
@@ -271,7 +271,7 @@ async def test_get_forex_stream_status_no_connection(mock_connection_manager):
     """Test status when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("forex")
@@ -295,7 +295,7 @@ async def test_subscribe_forex_channels_success(mock_connection_manager, mock_we
     """Test successful subscription to new channels."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
     new_channels = ["C.USD/JPY", "CA.AUD/USD"]
 
     # Act
@@ -320,7 +320,7 @@ async def test_subscribe_forex_channels_no_stream(mock_connection_manager):
     """Test subscribe when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("forex")
@@ -343,7 +343,7 @@ async def test_subscribe_forex_channels_failure(mock_connection_manager, mock_we
     """Test error handling when subscription fails."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock subscription failure
     mock_websocket_connection.subscribe.side_effect = Exception("Invalid channel format")
@@ -371,7 +371,7 @@ async def test_unsubscribe_forex_channels_success(mock_connection_manager, mock_
     """Test successful unsubscription from channels."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock status after unsubscribe
     mock_websocket_connection.get_status.return_value = {
@@ -404,7 +404,7 @@ async def test_unsubscribe_forex_channels_no_stream(mock_connection_manager):
     """Test unsubscribe when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("forex")
@@ -432,7 +432,7 @@ async def test_list_forex_subscriptions_active(mock_connection_manager, mock_web
     """Test listing subscriptions for active stream."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("list_forex_subscriptions", {})
@@ -452,7 +452,7 @@ async def test_list_forex_subscriptions_grouped_by_type(mock_connection_manager,
     """Test subscriptions are grouped by channel type (4 groups: C., CA., CAS., FMV.)."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock with multiple channel types (NO trades for forex)
     mock_websocket_connection.get_status.return_value = {
@@ -484,7 +484,7 @@ async def test_list_forex_subscriptions_empty(mock_connection_manager, mock_webs
     """Test listing when no subscriptions exist."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock with no subscriptions
     mock_websocket_connection.get_status.return_value = {
@@ -508,7 +508,7 @@ async def test_list_forex_subscriptions_no_connection(mock_connection_manager):
     """Test list when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("forex")
@@ -531,7 +531,7 @@ async def test_complete_workflow_start_subscribe_stop(mock_connection_manager, m
     """Test complete workflow: start -> subscribe -> stop."""
     # Arrange
     mcp = FastMCP("test")
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act & Assert - Start
     result1 = await mcp.call_tool(
@@ -574,7 +574,7 @@ async def test_tool_registration_all_tools_available(mock_connection_manager):
     mcp = FastMCP("test")
 
     # Act
-    forex.register_tools(mcp, mock_connection_manager)
+    forex.register_tools(mcp, lambda: mock_connection_manager)
 
     # Assert - Verify all tools registered
     tool_names = [tool.name for tool in mcp._tool_manager._tools.values()]
@@ -71,7 +71,7 @@ def mock_connection_manager(mock_websocket_connection):
 def mcp_server(mock_connection_manager):
     """FastMCP instance with options tools registered."""
     mcp = FastMCP("test-options")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
     return mcp
 
 
@@ -85,7 +85,7 @@ async def test_start_options_stream_success(mock_connection_manager, mock_websoc
     """Test successful options stream start with valid API key."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool(
@@ -121,7 +121,7 @@ async def test_start_options_stream_with_custom_endpoint(mock_connection_manager
     """Test stream start with custom delayed endpoint."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
     custom_endpoint = "wss://delayed.polygon.io/options"
 
     # Act
@@ -152,7 +152,7 @@ async def test_start_options_stream_uses_env_api_key(mock_connection_manager, mo
     """Test stream start uses POLYGON_API_KEY environment variable when not provided."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     with patch.dict(os.environ, {"POLYGON_API_KEY": "env_api_key"}):
         # Act
@@ -178,7 +178,7 @@ async def test_start_options_stream_connection_failure(mock_connection_manager,
     """Test error handling when connection fails."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock connection failure
     mock_websocket_connection.connect.side_effect = Exception("Connection timeout")
@@ -209,7 +209,7 @@ async def test_stop_options_stream_success(mock_connection_manager, mock_websock
     """Test successful stop of active stream."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("stop_options_stream", {})
@@ -229,7 +229,7 @@ async def test_stop_options_stream_no_active_connection(mock_connection_manager)
     """Test stop when no stream exists (KeyError handling)."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("options")
@@ -253,7 +253,7 @@ async def test_get_options_stream_status_active(mock_connection_manager, mock_we
     """Test status retrieval for active connection."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("get_options_stream_status", {})
@@ -273,7 +273,7 @@ async def test_get_options_stream_status_no_connection(mock_connection_manager):
     """Test status when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("options")
@@ -297,7 +297,7 @@ async def test_subscribe_options_channels_success(mock_connection_manager, mock_
     """Test successful subscription to new channels."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
     new_channels = ["T.O:TSLA251219P00300000", "AM.O:SPY251219C00650000"]
 
     # Act
@@ -322,7 +322,7 @@ async def test_subscribe_options_channels_no_stream(mock_connection_manager):
     """Test subscribe when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("options")
@@ -345,7 +345,7 @@ async def test_subscribe_options_channels_failure(mock_connection_manager, mock_
     """Test error handling when subscription fails."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock subscription failure
     mock_websocket_connection.subscribe.side_effect = Exception("Invalid channel format")
@@ -373,7 +373,7 @@ async def test_unsubscribe_options_channels_success(mock_connection_manager, moc
     """Test successful unsubscription from channels."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock status after unsubscribe
     mock_websocket_connection.get_status.return_value = {
@@ -406,7 +406,7 @@ async def test_unsubscribe_options_channels_no_stream(mock_connection_manager):
     """Test unsubscribe when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("options")
@@ -434,7 +434,7 @@ async def test_list_options_subscriptions_active(mock_connection_manager, mock_w
     """Test listing subscriptions for active stream."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("list_options_subscriptions", {})
@@ -454,7 +454,7 @@ async def test_list_options_subscriptions_grouped_by_type(mock_connection_manage
     """Test subscriptions are grouped by channel type (5 groups: T.O:, Q.O:, AM.O:, AS.O:, FMV.O:)."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock with multiple channel types
     mock_websocket_connection.get_status.return_value = {
@@ -488,7 +488,7 @@ async def test_list_options_subscriptions_empty(mock_connection_manager, mock_we
     """Test listing when no subscriptions exist."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock with no subscriptions
     mock_websocket_connection.get_status.return_value = {
@@ -512,7 +512,7 @@ async def test_list_options_subscriptions_no_connection(mock_connection_manager)
     """Test list when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("options")
@@ -535,7 +535,7 @@ async def test_complete_workflow_start_subscribe_stop(mock_connection_manager, m
     """Test complete workflow: start -> subscribe -> stop."""
     # Arrange
     mcp = FastMCP("test")
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act & Assert - Start
     result1 = await mcp.call_tool(
@@ -578,7 +578,7 @@ async def test_tool_registration_all_tools_available(mock_connection_manager):
     mcp = FastMCP("test")
 
     # Act
-    options.register_tools(mcp, mock_connection_manager)
+    options.register_tools(mcp, lambda: mock_connection_manager)
 
     # Assert - Verify all tools registered
     tool_names = [tool.name for tool in mcp._tool_manager._tools.values()]
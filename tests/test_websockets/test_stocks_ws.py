@@ -71,7 +71,7 @@ def mock_connection_manager(mock_websocket_connection):
 def mcp_server(mock_connection_manager):
     """FastMCP instance with stocks tools registered."""
     mcp = FastMCP("test-stocks")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
     return mcp
 
 
@@ -85,7 +85,7 @@ async def test_start_stocks_stream_success(mock_connection_manager, mock_websock
     """Test successful stocks stream start with valid API key."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool(
@@ -122,7 +122,7 @@ async def test_start_stocks_stream_with_custom_endpoint(mock_connection_manager,
     """Test stream start with custom delayed endpoint."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
     custom_endpoint = "wss://delayed.polygon.io/stocks"
 
     # Act
@@ -156,7 +156,7 @@ async def test_start_stocks_stream_uses_env_api_key(mock_connection_manager, moc
     """Test stream start uses POLYGON_API_KEY environment variable when not provided."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     with patch.dict(os.environ, {"POLYGON_API_KEY": "env_api_key"}):
         # Act
@@ -185,7 +185,7 @@ async def test_start_stocks_stream_multiple_channels(mock_connection_manager, mo
     """Test stream start with multiple channel subscriptions."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
     channels = ["T.AAPL", "Q.AAPL", "AM.AAPL", "T.MSFT", "Q.MSFT"]
 
     # Act
@@ -213,7 +213,7 @@ async def test_start_stocks_stream_connection_failure(mock_connection_manager, m
     """Test error handling when connection fails."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock connection failure
     mock_websocket_connection.connect.side_effect = Exception("Connection timeout")
@@ -247,7 +247,7 @@ async def test_stop_stocks_stream_success(mock_connection_manager, mock_websocke
     """Test successful stop of active stream."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("stop_stocks_stream", {})
@@ -270,7 +270,7 @@ async def test_stop_stocks_stream_no_active_connection(mock_connection_manager):
     """Test stop when no stream exists (KeyError handling)."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("stocks")
@@ -292,7 +292,7 @@ async def test_stop_stocks_stream_close_failure(mock_connection_manager, mock_we
     """Test error handling when close operation fails."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock close failure
     mock_websocket_connection.close.side_effect = Exception("Close error")
@@ -320,7 +320,7 @@ async def test_get_stocks_stream_status_active(mock_connection_manager, mock_web
     """Test status retrieval for active connection."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("get_stocks_stream_status", {})
@@ -343,7 +343,7 @@ async def test_get_stocks_stream_status_no_connection(mock_connection_manager):
     """Test status when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("stocks")
@@ -370,7 +370,7 @@ async def test_subscribe_stocks_channels_success(mock_connection_manager, mock_w
     """Test successful subscription to new channels."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
     new_channels = ["T.NVDA", "Q.AMD"]
 
     # Act
@@ -398,7 +398,7 @@ async def test_subscribe_stocks_channels_single(mock_connection_manager, mock_we
     """Test subscribing to a single channel."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool(
@@ -421,7 +421,7 @@ async def test_subscribe_stocks_channels_no_stream(mock_connection_manager):
     """Test subscribe when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("stocks")
@@ -447,7 +447,7 @@ async def test_subscribe_stocks_channels_failure(mock_connection_manager, mock_w
     """Test error handling when subscription fails."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock subscription failure
     mock_websocket_connection.subscribe.side_effect = Exception("Invalid channel format")
@@ -478,7 +478,7 @@ async def test_unsubscribe_stocks_channels_success(mock_connection_manager, mock
     """Test successful unsubscription from channels."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock status after unsubscribe
     mock_websocket_connection.get_status.return_value = {
@@ -514,7 +514,7 @@ async def test_unsubscribe_stocks_channels_no_stream(mock_connection_manager):
     """Test unsubscribe when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("stocks")
@@ -540,7 +540,7 @@ async def test_unsubscribe_stocks_channels_failure(mock_connection_manager, mock
     """Test error handling when unsubscription fails."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock unsubscribe failure
     mock_websocket_connection.unsubscribe.side_effect = Exception("Unsubscribe error")
@@ -571,7 +571,7 @@ async def test_list_stocks_subscriptions_active(mock_connection_manager, mock_we
     """Test listing subscriptions for active stream."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act
     result = await mcp.call_tool("list_stocks_subscriptions", {})
@@ -593,7 +593,7 @@ async def test_list_stocks_subscriptions_grouped_by_type(mock_connection_manager
     """Test subscriptions are grouped by channel type."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock with multiple channel types
     mock_websocket_connection.get_status.return_value = {
@@ -622,7 +622,7 @@ async def test_list_stocks_subscriptions_empty(mock_connection_manager, mock_web
     """Test listing when no subscriptions exist."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Update mock with no subscriptions
     mock_websocket_connection.get_status.return_value = {
@@ -648,7 +648,7 @@ async def test_list_stocks_subscriptions_no_connection(mock_connection_manager):
     """Test list when no stream exists."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Mock KeyError when getting connection
     mock_connection_manager.get_connection.side_effect = KeyError("stocks")
@@ -673,7 +673,7 @@ async def test_complete_workflow_start_subscribe_stop(mock_connection_manager, m
     """Test complete workflow: start -> subscribe -> stop."""
     # Arrange
     mcp = FastMCP("test")
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Act & Assert - Start
     result1 = await mcp.call_tool(
@@ -717,7 +717,7 @@ async def test_tool_registration_all_tools_available(mock_connection_manager):
     mcp = FastMCP("test")
 
     # Act
-    stocks.register_tools(mcp, mock_connection_manager)
+    stocks.register_tools(mcp, lambda: mock_connection_manager)
 
     # Assert - Verify all tools registered
     tool_names = [tool.name for tool in mcp._tool_manager._tools.values()]
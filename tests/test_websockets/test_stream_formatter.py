@@ -611,7 +611,7 @@ def test_format_connection_status_many_subscriptions():
 
 
 # ============================================================================
-# Edge Cases and Special Scenarios (5 tests)
+# Edge Cases and Special Scenarios (7 tests)
 # ============================================================================
 
 
@@ -694,3 +694,27 @@ def test_compact_json_output():
     # Compact JSON should not have indentation
     assert result.count("\n") <= 1  # May have trailing newline
     assert "  " not in result  # No double-space indentation
+
+
+def test_compact_output_is_exact():
+    """Test the exact compact bytes: summary key order, no separator spaces."""
+    message = {"ev": "T", "sym": "AAPL", "p": 1.5, "s": 10}
+
+    result = format_stream_message(message, pretty=False)
+
+    assert result == (
+        '{"event":"TRADE","symbol":"AAPL","price":1.5,"size":10,'
+        '"exchange_id":null,"conditions":[],"timestamp":null,'
+        '"full_data":{"ev":"T","sym":"AAPL","p":1.5,"s":10}}'
+    )
+
+
+def test_pretty_output_is_exact_and_keeps_non_ascii():
+    """Test two-space indentation and that non-ASCII text is not escaped."""
+    message = {"ev": "STATUS", "message": "café ✓", "pair": "€-USD"}
+
+    result = format_stream_message(message, pretty=True)
+
+    assert result == (
+        '{\n  "ev": "STATUS",\n  "message": "café ✓",\n  "pair": "€-USD"\n}'
+    )